@@ -7,11 +7,13 @@ Convenience script to run the application from the project root
 import os
 import sys
 
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Change to project directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_DIR)
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'src'))
 
 from ui import TaskManagerApp
 import tkinter as tk
@@ -4,6 +4,7 @@
 #include <ctype.h>
 #include <string.h>
 #include <unistd.h>
+#include <dlfcn.h>
 
 #define TABLE_SIZE 1024
 #define MAX_PROCESSES 1024
@@ -190,62 +191,119 @@ unsigned long get_process_memory(int pid){
 
 }
 
-// Get NVIDIA GPU information using nvidia-smi
+// NVML types (libnvidia-ml is loaded at runtime, so no NVIDIA headers or driver are needed to build)
+typedef struct nvmlDevice_st *nvmlDevice_t;
+typedef struct { unsigned int gpu; unsigned int memory; } nvmlUtilization_t;
+typedef struct { unsigned long long total; unsigned long long free; unsigned long long used; } nvmlMemory_t;
+
+#define NVML_SUCCESS 0
+#define NVML_TEMPERATURE_GPU 0
+
+static struct {
+    int state;  // 0 = not loaded yet, 1 = ready, -1 = unavailable
+    int (*DeviceGetCount)(unsigned int *);
+    int (*DeviceGetHandleByIndex)(unsigned int, nvmlDevice_t *);
+    int (*DeviceGetName)(nvmlDevice_t, char *, unsigned int);
+    int (*DeviceGetUtilizationRates)(nvmlDevice_t, nvmlUtilization_t *);
+    int (*DeviceGetMemoryInfo)(nvmlDevice_t, nvmlMemory_t *);
+    int (*DeviceGetTemperature)(nvmlDevice_t, int, unsigned int *);
+    int (*DeviceGetPowerUsage)(nvmlDevice_t, unsigned int *);
+    int (*DeviceGetEnforcedPowerLimit)(nvmlDevice_t, unsigned int *);
+} nvml;
+
+// Look up an NVML symbol, preferring the _v2 variant when it exists
+static void *nvml_sym(void *lib, const char *name, int has_v2) {
+    char v2[64];
+    void *fn = NULL;
+    if (has_v2) {
+        snprintf(v2, sizeof(v2), "%s_v2", name);
+        fn = dlsym(lib, v2);
+    }
+    return fn ? fn : dlsym(lib, name);
+}
+
+// Load and initialise NVML once; returns 1 if it is usable
+static int nvml_load(void) {
+    if (nvml.state != 0) {
+        return nvml.state == 1;
+    }
+    nvml.state = -1;
+
+    void *lib = dlopen("libnvidia-ml.so.1", RTLD_LAZY);
+    if (lib == NULL) {
+        return 0;
+    }
+
+    int (*init)(void) = (int (*)(void))nvml_sym(lib, "nvmlInit", 1);
+    *(void **)&nvml.DeviceGetCount = nvml_sym(lib, "nvmlDeviceGetCount", 1);
+    *(void **)&nvml.DeviceGetHandleByIndex = nvml_sym(lib, "nvmlDeviceGetHandleByIndex", 1);
+    *(void **)&nvml.DeviceGetName = nvml_sym(lib, "nvmlDeviceGetName", 0);
+    *(void **)&nvml.DeviceGetUtilizationRates = nvml_sym(lib, "nvmlDeviceGetUtilizationRates", 0);
+    *(void **)&nvml.DeviceGetMemoryInfo = nvml_sym(lib, "nvmlDeviceGetMemoryInfo", 0);
+    *(void **)&nvml.DeviceGetTemperature = nvml_sym(lib, "nvmlDeviceGetTemperature", 0);
+    *(void **)&nvml.DeviceGetPowerUsage = nvml_sym(lib, "nvmlDeviceGetPowerUsage", 0);
+    *(void **)&nvml.DeviceGetEnforcedPowerLimit = nvml_sym(lib, "nvmlDeviceGetEnforcedPowerLimit", 0);
+
+    if (init == NULL || nvml.DeviceGetCount == NULL || nvml.DeviceGetHandleByIndex == NULL ||
+        init() != NVML_SUCCESS) {
+        dlclose(lib);
+        return 0;
+    }
+
+    nvml.state = 1;
+    return 1;
+}
+
+// Get NVIDIA GPU information through NVML (no nvidia-smi process per poll)
 int get_gpu_info(gpu_info *gpus, int max_gpus) {
-    FILE *fp = popen("nvidia-smi --query-gpu=index,name,utilization.gpu,memory.used,memory.total,temperature.gpu,power.draw,power.limit --format=csv,noheader,nounits 2>/dev/null", "r");
-    if (fp == NULL) {
+    unsigned int count = 0;
+    if (!nvml_load() || nvml.DeviceGetCount(&count) != NVML_SUCCESS) {
         return 0;
     }
 
     int gpu_count = 0;
-    char line[LINE_SIZE];
+    for (unsigned int i = 0; i < count && gpu_count < max_gpus; i++) {
+        nvmlDevice_t dev;
+        if (nvml.DeviceGetHandleByIndex(i, &dev) != NVML_SUCCESS) {
+            continue;
+        }
 
-    while (fgets(line, sizeof(line), fp) != NULL && gpu_count < max_gpus) {
         gpu_info *g = &gpus[gpu_count];
+        memset(g, 0, sizeof(*g));
+        g->index = (int)i;
 
-        // Parse CSV: index, name, utilization, mem_used, mem_total, temp, power, power_limit
-        char *token = strtok(line, ",");
-        if (token) g->index = atoi(token);
-
-        token = strtok(NULL, ",");
-        if (token) {
-            while (*token == ' ') token++; // trim leading space
-            strncpy(g->name, token, NAME_SIZE - 1);
-            g->name[NAME_SIZE - 1] = '\0';
-            // Trim trailing whitespace
-            char *end = g->name + strlen(g->name) - 1;
-            while (end > g->name && (*end == ' ' || *end == '\n')) *end-- = '\0';
+        if (nvml.DeviceGetName == NULL || nvml.DeviceGetName(dev, g->name, NAME_SIZE) != NVML_SUCCESS) {
+            snprintf(g->name, NAME_SIZE, "NVIDIA GPU %u", i);
         }
 
-        token = strtok(NULL, ",");
-        if (token) g->utilization = atoi(token);
-
-        token = strtok(NULL, ",");
-        if (token) g->mem_used = atol(token);
-
-        token = strtok(NULL, ",");
-        if (token) g->mem_total = atol(token);
+        nvmlUtilization_t util;
+        if (nvml.DeviceGetUtilizationRates && nvml.DeviceGetUtilizationRates(dev, &util) == NVML_SUCCESS) {
+            g->utilization = (int)util.gpu;
+        }
 
-        token = strtok(NULL, ",");
-        if (token) g->temperature = atoi(token);
+        // Memory in MiB, as nvidia-smi reports it
+        nvmlMemory_t mem;
+        if (nvml.DeviceGetMemoryInfo && nvml.DeviceGetMemoryInfo(dev, &mem) == NVML_SUCCESS) {
+            g->mem_used = (unsigned long)(mem.used >> 20);
+            g->mem_total = (unsigned long)(mem.total >> 20);
+        }
 
-        token = strtok(NULL, ",");
-        if (token) g->power_usage = (int)atof(token);
+        unsigned int value;
+        if (nvml.DeviceGetTemperature && nvml.DeviceGetTemperature(dev, NVML_TEMPERATURE_GPU, &value) == NVML_SUCCESS) {
+            g->temperature = (int)value;
+        }
 
-        token = strtok(NULL, ",");
-        if (token) {
-            // Handle "[N/A]" case for power limit
-            if (strstr(token, "N/A") != NULL) {
-                g->power_limit = 0;
-            } else {
-                g->power_limit = (int)atof(token);
-            }
+        // Power in milliwatts -> watts (limit stays 0 when unsupported, like "[N/A]")
+        if (nvml.DeviceGetPowerUsage && nvml.DeviceGetPowerUsage(dev, &value) == NVML_SUCCESS) {
+            g->power_usage = (int)(value / 1000);
+        }
+        if (nvml.DeviceGetEnforcedPowerLimit && nvml.DeviceGetEnforcedPowerLimit(dev, &value) == NVML_SUCCESS) {
+            g->power_limit = (int)(value / 1000);
         }
 
         gpu_count++;
     }
 
-    pclose(fp);
     return gpu_count;
 }
 
@@ -5,15 +5,39 @@ WSysMon-inspired main window with tabbed interface
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import asyncio
+import concurrent.futures
+import hashlib
+import queue
 import subprocess
-import threading
 import os
 import sys
+import re
+import time
 
-from .themes import COLORS, Theme
+from .themes import (
+    COLORS, Theme,
+    BG_PRIMARY, BG_SECONDARY, SURFACE_HOVER, ACCENT, TEXT_PRIMARY, TEXT_SECONDARY,
+)
 from .views import ProcessesView, PerformanceView
 
 
+# Resolved once at import instead of per call
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SRC_DIR = os.path.dirname(_MODULE_DIR)
+_PROJECT_DIR = os.path.dirname(_SRC_DIR)
+
+# Backend protocol, matched on raw bytes (one regex scan per frame)
+# Process line: PID|name|state|cpu|mem|threads
+PROC_LINE_RE = re.compile(
+    rb'^(\d+)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)$', re.M
+)
+# GPU line: GPU|index|name|util|mem_used|mem_total|temp|power|power_limit
+GPU_LINE_RE = re.compile(rb'^GPU' + rb'\|([^|\n]*)' * 8 + rb'$', re.M)
+FRAME_END_RE = re.compile(rb'^END\n', re.M)
+GPU_END_RE = re.compile(rb'^GPU_END\n', re.M)
+
+
 class TaskManagerApp:
     """
     Main Task Manager application.
@@ -25,7 +49,10 @@ class TaskManagerApp:
         self.root.title("Task Manager")
         self.root.geometry("1100x700")
         self.root.minsize(900, 600)
-        self.root.configure(bg=COLORS['bg_primary'])
+        self.root.configure(bg=BG_PRIMARY)
+
+        # Resolve font families once, before any widget asks for a font
+        Theme.init(self.root)
 
         # Load app icon
         self._app_icon = None
@@ -37,6 +64,32 @@ class TaskManagerApp:
         self.proc = None
         self.current_view = 'processes'
 
+        # Backend I/O runs on an asyncio loop pumped from the Tk event loop
+        self._loop = asyncio.new_event_loop()
+        self._reader_task = None
+        self._pump_interval = 1
+        self._backend_activity = False
+
+        # Latest unprocessed frames (older ones are dropped when UI is behind)
+        self._pending_frame = None
+        self._pending_gpu = None
+        self._flush_scheduled = False
+
+        # Frame parser keyed on the first byte of a block; process rows
+        # start with a digit and are the default
+        self._frame_parsers = {ord('G'): self._parse_gpu_block}
+
+        # Worker for blocking helper work (backend compile, wmctrl / xprop)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._window_pids_future = None
+        # (callback, result) pairs posted by the pool, drained on the Tk thread
+        self._results_q = queue.SimpleQueue()
+
+        # Check (and if needed compile) the backend while the UI builds
+        self._backend_path = None
+        self._backend_error = None
+        self._backend_build = self._io_pool.submit(self._build_backend)
+
         # Setup UI
         self._setup_styles()
         self._create_ui()
@@ -53,8 +106,16 @@ class TaskManagerApp:
     def _load_app_icon(self):
         """Load the white app icon and set as window icon"""
         try:
-            src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            icon_path = os.path.join(src_dir, 'activity-tracker-white.png')
+            # Pre-rendered icons (tools/prerender_icons.py) load without PIL
+            win_path = os.path.join(_SRC_DIR, 'activity-tracker-white-32.png')
+            side_path = os.path.join(_SRC_DIR, 'activity-tracker-white-22.png')
+            if os.path.exists(win_path) and os.path.exists(side_path):
+                self._app_icon = tk.PhotoImage(file=win_path)
+                self.root.iconphoto(False, self._app_icon)
+                self._sidebar_icon = tk.PhotoImage(file=side_path)
+                return
+
+            icon_path = os.path.join(_SRC_DIR, 'activity-tracker-white.png')
             if os.path.exists(icon_path):
                 from PIL import Image, ImageTk
 
@@ -83,33 +144,33 @@ class TaskManagerApp:
         # Notebook (tabs)
         style.configure(
             'TNotebook',
-            background=COLORS['bg_primary'],
+            background=BG_PRIMARY,
             borderwidth=0
         )
         style.configure(
             'TNotebook.Tab',
-            background=COLORS['bg_secondary'],
-            foreground=COLORS['text_secondary'],
+            background=BG_SECONDARY,
+            foreground=TEXT_SECONDARY,
             padding=[16, 8],
             font=Theme.get_font(Theme.FONT_SIZE_BODY)
         )
         style.map(
             'TNotebook.Tab',
-            background=[('selected', COLORS['accent'])],
-            foreground=[('selected', COLORS['text_primary'])]
+            background=[('selected', ACCENT)],
+            foreground=[('selected', TEXT_PRIMARY)]
         )
 
         # PanedWindow
         style.configure(
             'TPanedwindow',
-            background=COLORS['bg_primary']
+            background=BG_PRIMARY
         )
 
         # Scrollbar
         style.configure(
             'Vertical.TScrollbar',
             background=COLORS['surface'],
-            troughcolor=COLORS['bg_secondary'],
+            troughcolor=BG_SECONDARY,
             borderwidth=0,
             arrowsize=0
         )
@@ -117,7 +178,7 @@ class TaskManagerApp:
     def _create_ui(self):
         """Create the main UI"""
         # Main container with sidebar and content
-        self.main_container = tk.Frame(self.root, bg=COLORS['bg_primary'])
+        self.main_container = tk.Frame(self.root, bg=BG_PRIMARY)
         self.main_container.pack(fill=tk.BOTH, expand=True)
 
         # Create sidebar
@@ -133,32 +194,32 @@ class TaskManagerApp:
         """Create the left sidebar with navigation"""
         sidebar = tk.Frame(
             self.main_container,
-            bg=COLORS['bg_secondary'],
+            bg=BG_SECONDARY,
             width=180
         )
         sidebar.pack(side=tk.LEFT, fill=tk.Y)
         sidebar.pack_propagate(False)
 
         # App title: icon + "Task" on line 1, "Manager" on line 2
-        title_area = tk.Frame(sidebar, bg=COLORS['bg_secondary'])
+        title_area = tk.Frame(sidebar, bg=BG_SECONDARY)
         title_area.pack(padx=16, pady=(20, 24), anchor='w')
 
         # Line 1: icon + "Task"
-        line1 = tk.Frame(title_area, bg=COLORS['bg_secondary'])
+        line1 = tk.Frame(title_area, bg=BG_SECONDARY)
         line1.pack(anchor='w')
 
         if self._sidebar_icon:
             tk.Label(
                 line1, image=self._sidebar_icon,
-                bg=COLORS['bg_secondary']
+                bg=BG_SECONDARY
             ).pack(side=tk.LEFT, padx=(0, 8))
 
         tk.Label(
             line1,
             text="Task",
             font=Theme.get_font(Theme.FONT_SIZE_HEADER, bold=True),
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_primary']
+            bg=BG_SECONDARY,
+            fg=TEXT_PRIMARY
         ).pack(side=tk.LEFT)
 
         # Line 2: "Manager" indented to align under "Task" (icon 22px + gap 8px = 30px)
@@ -166,12 +227,14 @@ class TaskManagerApp:
             title_area,
             text="Manager",
             font=Theme.get_font(Theme.FONT_SIZE_HEADER, bold=True),
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_primary']
+            bg=BG_SECONDARY,
+            fg=TEXT_PRIMARY
         ).pack(anchor='w', padx=(30, 0))
 
         # Navigation buttons
         self.tab_buttons = {}
+        self._tab_bg = {}  # view_name -> current background color
+        self._active_tab = None
 
         self.processes_tab = self._create_sidebar_button(sidebar, "Processes", 'processes')
         self.processes_tab.pack(fill=tk.X, padx=8, pady=2)
@@ -183,7 +246,7 @@ class TaskManagerApp:
         """Create a sidebar navigation button"""
         btn = tk.Frame(
             parent,
-            bg=COLORS['bg_secondary'],
+            bg=BG_SECONDARY,
             cursor='hand2'
         )
 
@@ -191,8 +254,8 @@ class TaskManagerApp:
             btn,
             text=text,
             font=Theme.get_font(Theme.FONT_SIZE_BODY),
-            bg=COLORS['bg_secondary'],
-            fg=COLORS['text_secondary'],
+            bg=BG_SECONDARY,
+            fg=TEXT_SECONDARY,
             anchor='w'
         )
         label.pack(fill=tk.X, padx=16, pady=12)
@@ -200,15 +263,17 @@ class TaskManagerApp:
         def on_click(e):
             self._select_tab(view_name)
 
+        # Closure locals so hover events do no global/dict lookups
+        hover = SURFACE_HOVER
+        normal = BG_SECONDARY
+
         def on_enter(e):
             if self.current_view != view_name:
-                btn.configure(bg=COLORS['surface_hover'])
-                label.configure(bg=COLORS['surface_hover'])
+                self._set_tab_bg(view_name, hover)
 
         def on_leave(e):
             if self.current_view != view_name:
-                btn.configure(bg=COLORS['bg_secondary'])
-                label.configure(bg=COLORS['bg_secondary'])
+                self._set_tab_bg(view_name, normal)
 
         btn.bind('<Button-1>', on_click)
         label.bind('<Button-1>', on_click)
@@ -216,27 +281,44 @@ class TaskManagerApp:
         btn.bind('<Leave>', on_leave)
 
         self.tab_buttons[view_name] = (btn, label)
+        self._tab_bg[view_name] = BG_SECONDARY
         return btn
 
+    def _set_tab_bg(self, view_name, color):
+        """Set a sidebar button's background, skipping no-op repaints"""
+        if self._tab_bg[view_name] == color:
+            return
+        btn, label = self.tab_buttons[view_name]
+        btn.configure(bg=color)
+        label.configure(bg=color)
+        self._tab_bg[view_name] = color
+
     def _select_tab(self, view_name):
         """Select a tab"""
+        if view_name == self._active_tab:
+            return
         self.current_view = view_name
 
-        for name, (btn, label) in self.tab_buttons.items():
-            if name == view_name:
-                btn.configure(bg=COLORS['accent'])
-                label.configure(
-                    bg=COLORS['accent'],
-                    fg=COLORS['text_primary'],
-                    font=Theme.get_font(Theme.FONT_SIZE_BODY, bold=True)
-                )
-            else:
-                btn.configure(bg=COLORS['bg_secondary'])
-                label.configure(
-                    bg=COLORS['bg_secondary'],
-                    fg=COLORS['text_secondary'],
-                    font=Theme.get_font(Theme.FONT_SIZE_BODY)
-                )
+        # Only the previously active and the newly active buttons change
+        if self._active_tab is not None:
+            btn, label = self.tab_buttons[self._active_tab]
+            btn.configure(bg=BG_SECONDARY)
+            label.configure(
+                bg=BG_SECONDARY,
+                fg=TEXT_SECONDARY,
+                font=Theme.get_font(Theme.FONT_SIZE_BODY)
+            )
+            self._tab_bg[self._active_tab] = BG_SECONDARY
+
+        btn, label = self.tab_buttons[view_name]
+        btn.configure(bg=ACCENT)
+        label.configure(
+            bg=ACCENT,
+            fg=TEXT_PRIMARY,
+            font=Theme.get_font(Theme.FONT_SIZE_BODY, bold=True)
+        )
+        self._tab_bg[view_name] = ACCENT
+        self._active_tab = view_name
 
         # Show/hide views
         if view_name == 'processes':
@@ -248,21 +330,21 @@ class TaskManagerApp:
 
     def _create_content(self):
         """Create the main content area"""
-        self.content = tk.Frame(self.main_container, bg=COLORS['bg_primary'])
+        self.content = tk.Frame(self.main_container, bg=BG_PRIMARY)
         self.content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Create views
         self.processes_view = ProcessesView(self.content)
-        self.performance_view = PerformanceView(self.content)
+        self.performance_view = PerformanceView(self.content, self._results_q)
 
         # Show processes view by default
         self.processes_view.pack(fill=tk.BOTH, expand=True)
 
-    def _start_backend(self):
-        """Start the C backend process"""
+    def _build_backend(self):
+        """Locate the C backend and compile it if the source has changed"""
         try:
             # Find backend location
-            backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            backend_dir = _PROJECT_DIR
             backend_path = os.path.join(backend_dir, 'src', 'backend', 'task_manager')
             source_path = os.path.join(backend_dir, 'src', 'backend', 'task_manager.c')
 
@@ -271,85 +353,176 @@ class TaskManagerApp:
                 source_path = os.path.join(backend_dir, 'task_manager.c')
                 backend_path = os.path.join(backend_dir, 'task_manager')
 
+            # Sidecar file records the hash of the source the binary was built from
+            stamp_path = backend_path + '.built'
+            source_hash = None
+            if os.path.exists(source_path):
+                with open(source_path, 'rb') as f:
+                    source_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+
+            built_hash = None
+            try:
+                with open(stamp_path, 'r') as f:
+                    built_hash = f.read().strip()
+            except OSError:
+                pass
+
             # Compile if needed
             if not os.path.exists(backend_path) or (
-                os.path.exists(source_path) and
-                os.path.getmtime(source_path) > os.path.getmtime(backend_path)
+                source_hash is not None and source_hash != built_hash
             ):
                 print(f"Compiling backend from {source_path}...")
                 result = subprocess.run(
-                    ['gcc', '-o', backend_path, source_path, '-Wall', '-O2'],
+                    ['gcc', '-o', backend_path, source_path, '-Wall', '-O2', '-ldl'],
                     capture_output=True, text=True
                 )
                 if result.returncode != 0:
-                    messagebox.showerror("Error", f"Failed to compile backend:\n{result.stderr}")
-                    self.root.quit()
+                    self._backend_error = f"Failed to compile backend:\n{result.stderr}"
                     return
 
+                try:
+                    with open(stamp_path, 'w') as f:
+                        f.write(source_hash or '')
+                except OSError:
+                    pass
+
+            self._backend_path = backend_path
+
+        except Exception as e:
+            self._backend_error = f"Failed to start backend: {e}"
+
+    def _start_backend(self):
+        """Start the C backend process"""
+        try:
+            # Wait for the check/compile started in __init__
+            self._backend_build.result()
+            if self._backend_error:
+                messagebox.showerror("Error", self._backend_error)
+                self.root.quit()
+                return
+            backend_path = self._backend_path
+
             # Start backend
-            self.proc = subprocess.Popen(
-                [backend_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
+            self.proc = self._loop.run_until_complete(
+                asyncio.create_subprocess_exec(
+                    backend_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
             )
 
-            # Start reader thread
-            threading.Thread(target=self._read_backend, daemon=True).start()
+            # Read backend output on the Tk thread, pumped via root.after
+            self._reader_task = self._loop.create_task(self._read_backend())
+            self._pump_asyncio()
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start backend: {e}")
             self.root.quit()
 
-    def _read_backend(self):
+    def _pump_asyncio(self):
+        """Run one iteration of the backend event loop, then reschedule"""
+        if not self.running:
+            return
+
+        self._backend_activity = False
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+
+        # Apply results posted by the worker pool
+        while True:
+            try:
+                callback, result = self._results_q.get_nowait()
+            except queue.Empty:
+                break
+            callback(result)
+
+        # Poll quickly while frames are streaming in, back off when idle
+        if self._backend_activity:
+            self._pump_interval = 1
+        else:
+            self._pump_interval = min(50, self._pump_interval * 2)
+
+        self.root.after(self._pump_interval, self._pump_asyncio)
+
+    async def _read_backend(self):
         """Read data from backend"""
-        frame = []
-        gpu_frame = []
-        in_gpu_block = False
+        buf = bytearray()
 
         try:
-            for line in self.proc.stdout:
-                if not self.running:
+            while self.running:
+                chunk = await self.proc.stdout.read(65536)
+                if not chunk:
                     break
 
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Handle GPU data block
-                if line == "GPU_START":
-                    in_gpu_block = True
-                    gpu_frame.clear()
-                    continue
-                elif line == "GPU_END":
-                    in_gpu_block = False
-                    if gpu_frame:
-                        self.root.after(0, self._update_gpu, gpu_frame.copy())
-                    continue
-
-                if in_gpu_block:
-                    if line.startswith("GPU|"):
-                        parts = line.split('|')
-                        if len(parts) == 9:  # GPU|index|name|util|mem_used|mem_total|temp|power|power_limit
-                            gpu_frame.append(parts[1:])  # Skip "GPU" prefix
-                    continue
-
-                # Handle process data
-                if line == "END":
-                    if frame:
-                        self.root.after(0, self._update_processes, frame.copy())
-                        frame.clear()
-                    continue
-
-                parts = line.split('|')
-                if len(parts) == 6:
-                    frame.append(parts)
+                self._backend_activity = True
+
+                buf += chunk
+                consumed = self._parse_frames(buf)
+                if consumed:
+                    del buf[:consumed]
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             if self.running:
                 print(f"Backend error: {e}")
 
+    def _parse_frames(self, buf):
+        """Dispatch every complete frame in buf, return bytes consumed"""
+        parsers = self._frame_parsers
+        default = self._parse_process_block
+        pos = 0
+
+        while pos < len(buf):
+            end = parsers.get(buf[pos], default)(buf, pos)
+            if end < 0:
+                break
+            pos = end
+
+        return pos
+
+    def _parse_gpu_block(self, buf, pos):
+        """Parse GPU_START..GPU_END at pos, return end offset or -1"""
+        end = GPU_END_RE.search(buf, pos)
+        if not end:
+            return -1
+        gpu_frame = GPU_LINE_RE.findall(buf, pos, end.start())
+        if gpu_frame:
+            self._pending_gpu = gpu_frame
+            self._schedule_flush()
+        return end.end()
+
+    def _parse_process_block(self, buf, pos):
+        """Parse process rows up to END at pos, return end offset or -1"""
+        end = FRAME_END_RE.search(buf, pos)
+        if not end:
+            return -1
+        frame = PROC_LINE_RE.findall(buf, pos, end.start())
+        if frame:
+            self._pending_frame = frame
+            self._schedule_flush()
+        return end.end()
+
+    def _schedule_flush(self):
+        """Schedule a single idle-time flush of the pending frames"""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_pending)
+
+    def _flush_pending(self):
+        """Apply only the most recent pending frames to the views"""
+        self._flush_scheduled = False
+        frame, self._pending_frame = self._pending_frame, None
+        gpu_frame, self._pending_gpu = self._pending_gpu, None
+
+        if not self.running:
+            return
+
+        if frame is not None:
+            self._update_processes(frame)
+        if gpu_frame is not None:
+            self._update_gpu(gpu_frame)
+
     def _update_processes(self, data):
         """Update processes view with new data"""
         self.processes_view.update_data(data)
@@ -360,6 +533,7 @@ class TaskManagerApp:
 
     def _start_updates(self):
         """Start periodic updates"""
+        self._next_perf_tick = time.monotonic()
         self._update_performance()
         self._update_window_pids()
 
@@ -371,28 +545,57 @@ class TaskManagerApp:
         # Always collect performance data so graphs have history from startup
         self.performance_view.update()
 
-        self.root.after(1000, self._update_performance)
+        # Schedule against a monotonic target so ticks don't drift by the
+        # time each update takes; resync if we fell a whole period behind
+        self._next_perf_tick += 1.0
+        now = time.monotonic()
+        if self._next_perf_tick < now:
+            self._next_perf_tick = now + 1.0
+        delay_ms = int((self._next_perf_tick - now) * 1000)
+        self.root.after(delay_ms, self._update_performance)
 
     def _update_window_pids(self):
         """Update window PIDs for process classification"""
         if not self.running:
             return
 
-        # Run in background, less frequently (10 seconds)
-        self.processes_view.update_window_pids()
+        # Collect on the worker thread (runs shell commands), less frequently
+        # (10 seconds); skip if the previous collection is still running
+        if self._window_pids_future is None or self._window_pids_future.done():
+            self._window_pids_future = self._io_pool.submit(
+                self.processes_view.collect_window_pids
+            )
+            self._window_pids_future.add_done_callback(self._on_window_pids_collected)
+
         self.root.after(10000, self._update_window_pids)
 
+    def _on_window_pids_collected(self, future):
+        """Hand collected window PIDs back to the Tk thread (via the pump)"""
+        if not self.running or future.exception():
+            return
+        self._results_q.put((self.processes_view.apply_window_pids, future.result()))
+
     def _on_close(self):
         """Handle window close"""
         self.running = False
 
+        self._io_pool.shutdown(wait=False)
+
+        if self._reader_task:
+            self._reader_task.cancel()
+
         if self.proc:
-            self.proc.terminate()
             try:
-                self.proc.wait(timeout=2)
+                self.proc.terminate()
+                self._loop.run_until_complete(asyncio.wait_for(self.proc.wait(), 2))
             except:
-                self.proc.kill()
+                try:
+                    self.proc.kill()
+                    self._loop.run_until_complete(self.proc.wait())
+                except:
+                    pass
 
+        self._loop.close()
         self.root.destroy()
 
 
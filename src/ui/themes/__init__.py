@@ -1,4 +1,12 @@
 """Theme package"""
-from .theme import Theme, COLORS
+from .theme import (
+    Theme, COLORS,
+    BG_PRIMARY, BG_SECONDARY, BG_TERTIARY, SURFACE, SURFACE_HOVER, ACCENT,
+    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_TERTIARY, SELECTION,
+)
 
-__all__ = ['Theme', 'COLORS']
+__all__ = [
+    'Theme', 'COLORS',
+    'BG_PRIMARY', 'BG_SECONDARY', 'BG_TERTIARY', 'SURFACE', 'SURFACE_HOVER', 'ACCENT',
+    'TEXT_PRIMARY', 'TEXT_SECONDARY', 'TEXT_TERTIARY', 'SELECTION',
+]
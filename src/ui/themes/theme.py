@@ -66,6 +66,18 @@ COLORS = {
     'category_system': '#555555',
 }
 
+# Frequently used colors as module constants (skip the dict lookup)
+BG_PRIMARY = COLORS['bg_primary']
+BG_SECONDARY = COLORS['bg_secondary']
+BG_TERTIARY = COLORS['bg_tertiary']
+SURFACE = COLORS['surface']
+SURFACE_HOVER = COLORS['surface_hover']
+ACCENT = COLORS['accent']
+TEXT_PRIMARY = COLORS['text_primary']
+TEXT_SECONDARY = COLORS['text_secondary']
+TEXT_TERTIARY = COLORS['text_tertiary']
+SELECTION = COLORS['selection']
+
 
 class Theme:
     """Theme configuration and utilities"""
@@ -103,72 +115,74 @@ class Theme:
     GRAPH_LINE_WIDTH = 3
     GRAPH_HISTORY_SIZE = 60
 
-    # Font availability cache
-    _font_available_cache = {}
+    # Resolved font families (set once by Theme.init)
+    _primary_family = FONT_FAMILY_FALLBACK
+    _mono_family = FONT_FAMILY_MONO_FALLBACK
     # Font tuple cache (key: (size, bold, mono) -> font tuple)
     _font_tuple_cache = {}
 
-    @staticmethod
-    def _check_font_available(font_name):
-        """Check if a font is available on the system (cached)"""
-        if font_name in Theme._font_available_cache:
-            return Theme._font_available_cache[font_name]
-
+    @classmethod
+    def init(cls, root):
+        """Resolve available font families once (call after tk root exists)"""
         try:
-            import tkinter as tk
             import tkinter.font as tkfont
-            root = tk._default_root
-            if root:
-                # Cache the family list to avoid repeated lookups
-                if not hasattr(Theme, '_font_families'):
-                    Theme._font_families = {f.lower() for f in tkfont.families()}
-                available = font_name.lower() in Theme._font_families
-                Theme._font_available_cache[font_name] = available
-                return available
-        except:
-            pass
-        Theme._font_available_cache[font_name] = False
-        return False
+            families = tkfont.families(root)
+        except Exception:
+            families = ()
+
+        # Only two names are checked, so scan without building a set
+        # and stop as soon as both are found
+        primary_low = cls.FONT_FAMILY.lower()
+        mono_low = cls.FONT_FAMILY_MONO.lower()
+        has_primary = has_mono = False
+        for family in families:
+            family = family.lower()
+            if family == primary_low:
+                has_primary = True
+            elif family == mono_low:
+                has_mono = True
+            if has_primary and has_mono:
+                break
+
+        cls._primary_family = cls.FONT_FAMILY if has_primary else cls.FONT_FAMILY_FALLBACK
+        cls._mono_family = cls.FONT_FAMILY_MONO if has_mono else cls.FONT_FAMILY_MONO_FALLBACK
+
+        cls._build_font_cache()
+
+    @classmethod
+    def _build_font_cache(cls):
+        """Precompute every (size, bold, mono) font tuple the UI uses"""
+        cls._font_tuple_cache.clear()
+        for size in (cls.FONT_SIZE_TITLE, cls.FONT_SIZE_HEADER, cls.FONT_SIZE_SUBHEADER,
+                     cls.FONT_SIZE_BODY, cls.FONT_SIZE_SMALL, cls.FONT_SIZE_TINY):
+            for bold in (False, True):
+                weight = 'bold' if bold else 'normal'
+                cls._font_tuple_cache[(size, bold, False)] = (cls._primary_family, size, weight)
+                cls._font_tuple_cache[(size, bold, True)] = (cls._mono_family, size, weight)
 
     @staticmethod
     def get_font(size=None, bold=False):
-        """Get font tuple for tkinter (cached for performance)"""
-        size = size or Theme.FONT_SIZE_BODY
-        cache_key = (size, bold, False)
-
-        if cache_key in Theme._font_tuple_cache:
-            return Theme._font_tuple_cache[cache_key]
-
-        weight = 'bold' if bold else 'normal'
-
-        # Try primary font, fall back if not available
-        if Theme._check_font_available(Theme.FONT_FAMILY):
-            result = (Theme.FONT_FAMILY, size, weight)
-        else:
-            result = (Theme.FONT_FAMILY_FALLBACK, size, weight)
-
-        Theme._font_tuple_cache[cache_key] = result
-        return result
+        """Get font tuple for tkinter (precomputed)"""
+        try:
+            return Theme._font_tuple_cache[(size or Theme.FONT_SIZE_BODY, bold, False)]
+        except KeyError:
+            size = size or Theme.FONT_SIZE_BODY
+            return Theme._font_tuple_cache.setdefault(
+                (size, bold, False),
+                (Theme._primary_family, size, 'bold' if bold else 'normal')
+            )
 
     @staticmethod
     def get_mono_font(size=None, bold=False):
-        """Get monospace font tuple (cached for performance)"""
-        size = size or Theme.FONT_SIZE_BODY
-        cache_key = (size, bold, True)
-
-        if cache_key in Theme._font_tuple_cache:
-            return Theme._font_tuple_cache[cache_key]
-
-        weight = 'bold' if bold else 'normal'
-
-        # Try primary mono font, fall back if not available
-        if Theme._check_font_available(Theme.FONT_FAMILY_MONO):
-            result = (Theme.FONT_FAMILY_MONO, size, weight)
-        else:
-            result = (Theme.FONT_FAMILY_MONO_FALLBACK, size, weight)
-
-        Theme._font_tuple_cache[cache_key] = result
-        return result
+        """Get monospace font tuple (precomputed)"""
+        try:
+            return Theme._font_tuple_cache[(size or Theme.FONT_SIZE_BODY, bold, True)]
+        except KeyError:
+            size = size or Theme.FONT_SIZE_BODY
+            return Theme._font_tuple_cache.setdefault(
+                (size, bold, True),
+                (Theme._mono_family, size, 'bold' if bold else 'normal')
+            )
 
     @staticmethod
     def get_bar_alpha(value, scale=40):
@@ -202,3 +216,6 @@ class Theme:
         b = int(b1 * (1 - alpha) + b2 * alpha)
 
         return Theme.rgb_to_hex(r, g, b)
+
+
+Theme._build_font_cache()
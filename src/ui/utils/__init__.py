@@ -1,3 +1,3 @@
 """UI Utilities"""
 
-from .icon_loader import IconLoader
+from .icon_loader import IconLoader, get_icon_loader
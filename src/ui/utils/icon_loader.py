@@ -1,31 +1,129 @@
 """
 IconLoader - Load application icons from .desktop files and icon themes
-Uses CairoSVG to render SVG icons to PNG for Tkinter display
+Renders SVG icons to PNG with resvg when available (CairoSVG otherwise) for Tkinter display
 """
 
 import os
-import glob
+import concurrent.futures
+import configparser
+import hashlib
+import shlex
 import subprocess
 import io
+import mmap
+import pickle
+import shutil
+import struct
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from urllib.parse import quote
 from pathlib import Path
 from typing import Optional, Dict
 
-try:
-    from PIL import Image, ImageTk
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-
-try:
-    import cairosvg
-    HAS_CAIROSVG = True
-except ImportError:
-    HAS_CAIROSVG = False
+# PIL and CairoSVG are imported off the UI thread by the index worker
+# (or on first use), so startup never waits on the import cost
+Image = None
+ImageTk = None
+cairosvg = None
+resvg_py = None
+HAS_PIL = None  # None until the first import attempt
+HAS_CAIROSVG = False
+HAS_RESVG_PY = False
+RESVG_BIN = shutil.which('resvg')  # resvg CLI, preferred over CairoSVG when present
+_imaging_lock = threading.Lock()
+
+
+def _import_imaging() -> bool:
+    """Import PIL and CairoSVG once; return True if PIL is available"""
+    global Image, ImageTk, cairosvg, resvg_py, HAS_PIL, HAS_CAIROSVG, HAS_RESVG_PY
+    if HAS_PIL is not None:
+        return HAS_PIL
+
+    with _imaging_lock:
+        if HAS_PIL is None:
+            try:
+                import resvg_py
+                HAS_RESVG_PY = True
+            except ImportError:
+                HAS_RESVG_PY = False
+
+            try:
+                import cairosvg
+                HAS_CAIROSVG = True
+            except (ImportError, OSError):
+                HAS_CAIROSVG = False
+
+            # Set last: HAS_PIL being non-None means both imports are done
+            try:
+                from PIL import Image, ImageTk
+                HAS_PIL = True
+            except ImportError:
+                HAS_PIL = False
+    return HAS_PIL
+
+
+class _IconThemeCache:
+    """Reader for a theme's icon-theme.cache (gtk-update-icon-cache format 1.x)"""
+
+    # Image flags: which suffixes exist for the icon in a directory
+    FLAG_XPM = 1
+    FLAG_SVG = 2
+    FLAG_PNG = 4
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        major, _minor, self._hash_offset, dir_list_offset = struct.unpack_from('>HHII', self._mm, 0)
+        if major != 1:
+            raise ValueError(f'unsupported icon cache version {major}')
+        n_dirs, = struct.unpack_from('>I', self._mm, dir_list_offset)
+        self.directories = [
+            self._string(offset)
+            for offset in struct.unpack_from(f'>{n_dirs}I', self._mm, dir_list_offset + 4)
+        ]
+        self._n_buckets, = struct.unpack_from('>I', self._mm, self._hash_offset)
+
+    def _string(self, offset: int) -> str:
+        """NUL-terminated string at offset"""
+        end = self._mm.find(b'\0', offset)
+        return self._mm[offset:end].decode('utf-8', 'replace')
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        """GTK's icon_name_hash (h * 31 + c over signed chars, 32-bit)"""
+        h = 0
+        for i, c in enumerate(key):
+            if c > 127:
+                c -= 256
+            h = (c if i == 0 else h * 31 + c) & 0xFFFFFFFF
+        return h
+
+    def lookup(self, icon_name: str) -> list:
+        """(directory, flags) for each theme directory containing icon_name"""
+        if not self._n_buckets:
+            return []
+        key = icon_name.encode('utf-8')
+        bucket = self._hash(key) % self._n_buckets
+        offset, = struct.unpack_from('>I', self._mm, self._hash_offset + 4 + 4 * bucket)
+        while offset != 0xFFFFFFFF:
+            chain, name_offset, image_list_offset = struct.unpack_from('>III', self._mm, offset)
+            if self._mm[name_offset:name_offset + len(key) + 1] == key + b'\0':
+                n_images, = struct.unpack_from('>I', self._mm, image_list_offset)
+                return [
+                    (self.directories[dir_index], flags)
+                    for dir_index, flags, _ in struct.iter_unpack(
+                        '>HHI', self._mm[image_list_offset + 4:image_list_offset + 4 + 8 * n_images]
+                    )
+                ]
+            offset = chain
+        return []
 
 
 class IconLoader:
     """
-    Loads application icons from the system using SVG with CairoSVG.
+    Loads application icons from the system, rendering SVGs with resvg or CairoSVG.
     Searches .desktop files and icon themes.
     """
 
@@ -53,6 +151,40 @@ class IconLoader:
     # Icon categories to search
     ICON_CATEGORIES = ['apps', 'applications', 'places', 'mimetypes', 'legacy']
 
+    # Bounds for the in-memory icon LRU and the known-miss set
+    ICON_CACHE_SIZE = 512
+    MISS_CACHE_SIZE = 4096
+
+    # Process name suffixes stripped when looking up .desktop entries
+    NAME_SUFFIXES = ('-bin', '-browser', '-stable', '-beta', '-dev')
+
+    # Process names whose icon name differs from the executable
+    MAPPINGS = {
+        'chrome': 'google-chrome',
+        'chromium-browser': 'chromium',
+        'code': 'visual-studio-code',
+        'code-oss': 'visual-studio-code',
+        'cursor': 'cursor',
+        'firefox-esr': 'firefox',
+        'thunderbird': 'thunderbird',
+        'nautilus': 'org.gnome.Nautilus',
+        'gnome-terminal': 'org.gnome.Terminal',
+        'konsole': 'utilities-terminal',
+        'dolphin': 'org.kde.dolphin',
+        'vlc': 'vlc',
+        'spotify': 'spotify',
+        'discord': 'discord',
+        'slack': 'slack',
+        'telegram-desktop': 'telegram',
+        'steam': 'steam',
+    }
+
+    # On-disk cache for indexes (reused across sessions)
+    CACHE_DIR = os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+        'taskmanager'
+    )
+
     def __init__(self, size: int = 20):
         """
         Initialize the icon loader.
@@ -61,14 +193,325 @@ class IconLoader:
             size: Target icon size in pixels
         """
         self.size = size
-        self._cache: Dict[str, Optional[any]] = {}  # name -> PhotoImage or None
+        self._cache: 'OrderedDict[str, any]' = OrderedDict()  # name -> PhotoImage (LRU)
+        self._live = weakref.WeakValueDictionary()  # name -> PhotoImage still referenced by rows
         self._desktop_cache: Dict[str, Optional[str]] = {}  # name -> icon_name or None
+        self._miss_set: set = set()  # raw process names known to have no icon
+        # Signatures the indexes were loaded against (they also key the render cache)
+        self._desktop_sig = ()
+        self._icon_sig = ()
+
+        # Theme lookup and indexes are built off the UI thread;
+        # get_icon returns None until they are ready
+        self._icon_theme = None
+        self._desktop_index = None
+        self._icon_index = None  # name -> (rank, path)
+        self._theme_caches = []
+        self._cached_themes = set()
+        self._icon_cache_dir = None
+        self._dir_contents: Dict[str, frozenset] = {}  # dir -> entry names (on-demand lookups)
+
+        # Image loaders by file extension (anything else is treated as raster)
+        self._loaders = {'.svg': self._load_svg, '.png': self._load_raster, '.xpm': self._load_raster}
+        self._size_tuple = (size, size)
+        self._resample = None  # Image.Resampling.LANCZOS once PIL is imported
+
+        self._ready = threading.Event()
+        threading.Thread(target=self._init_indexes, daemon=True).start()
+
+    def _init_indexes(self):
+        """Resolve the icon theme and load both indexes (runs in a worker thread)"""
         self._icon_theme = self._get_icon_theme()
+        self._load_desktop_index()
+        self._load_icon_index()
+
+        # Import the imaging modules before the first icon is rendered (the
+        # renderers found are part of the render cache key)
+        _import_imaging()
+
+        # Rendered icons and misses persist across sessions, per theme and size,
+        # in a directory keyed on the index signatures and available renderers
+        parent = os.path.join(self.CACHE_DIR, 'icons', quote(self._icon_theme, safe=''), str(self.size))
+        key = self._render_cache_key()
+        self._prune_render_caches(parent, key)
+        self._icon_cache_dir = os.path.join(parent, key)
+        self._ready.set()
+
+    def _render_cache_key(self) -> str:
+        """Short hash of everything a rendered icon or a miss depends on"""
+        state = (self._desktop_sig, self._icon_sig,
+                 HAS_PIL, HAS_CAIROSVG, HAS_RESVG_PY, RESVG_BIN)
+        return hashlib.sha1(repr(state).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _prune_render_caches(parent: str, keep: str):
+        """Delete render caches in parent other than keep (stale ones are never read again)"""
+        try:
+            entries = list(os.scandir(parent))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name == keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _dir_signature(dirs) -> tuple:
+        """(dir, mtime_ns) for each existing directory; changes when entries are added/removed"""
+        sig = []
+        for d in dirs:
+            try:
+                sig.append((d, os.stat(d).st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(sig)
+
+    def _read_cache(self, filename: str):
+        """Return (sig, data) from the cache dir, or (None, None)"""
+        try:
+            with open(os.path.join(self.CACHE_DIR, filename), 'rb') as f:
+                cached = pickle.load(f)
+            return cached['sig'], cached['data']
+        except Exception:
+            return None, None
+
+    def _write_cache(self, filename: str, sig: tuple, data):
+        """Atomically write data with its signature to the cache dir"""
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.CACHE_DIR, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump({'sig': sig, 'data': data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, os.path.join(self.CACHE_DIR, filename))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            pass
+
+    def _load_desktop_index(self):
+        """Load the desktop index from the on-disk cache, rebuilding if stale"""
+        sig = self._desktop_sig = self._dir_signature(self.DESKTOP_DIRS)
+        cached_sig, index = self._read_cache('desktop_index.pkl')
+        if index is not None and cached_sig == sig:
+            self._desktop_index = index
+            return
+
         self._build_desktop_index()
+        self._write_cache('desktop_index.pkl', sig, self._desktop_index)
+
+    def _themes_to_search(self) -> list:
+        """Icon themes in lookup priority order"""
+        return [self._icon_theme, 'hicolor', 'breeze', 'Adwaita', 'AdwaitaLegacy', 'HighContrast']
+
+    def _size_order(self) -> list:
+        """
+        Icon size directories in lookup order.
+
+        Fixed sizes at or above the target come first (nearest first) so a
+        ready-made PNG is preferred over rasterising an SVG, then scalable,
+        then smaller sizes (largest first).
+        """
+        fixed = [(int(s.split('x')[0]), s) for s in self.ICON_SIZES if 'x' in s]
+        larger = [s for px, s in sorted(fixed) if px >= self.size]
+        smaller = [s for px, s in sorted(fixed, reverse=True) if px < self.size]
+        scalable = [s for s in self.ICON_SIZES if 'x' not in s]
+        return larger + scalable + smaller
+
+    @staticmethod
+    def _exts_for_size(size: str) -> tuple:
+        """Preferred extensions in a size directory (SVG first only for scalable)"""
+        if 'x' in size:
+            return ('.png', '.svg', '.xpm')
+        return ('.svg', '.png', '.xpm')
+
+    def _load_icon_index(self):
+        """Load the icon index from the on-disk cache, rebuilding if stale"""
+        theme_rank = {}
+        for i, theme in enumerate(self._themes_to_search()):
+            theme_rank.setdefault(theme, i)
+        self._theme_rank = theme_rank
+        self._size_rank = {size: i for i, size in enumerate(self._size_order())}
+        self._size_ext_rank = {
+            size: {ext: i for i, ext in enumerate(self._exts_for_size(size))}
+            for size in self._size_rank
+        }
+        self._category_rank = {cat: i for i, cat in enumerate(self.ICON_CATEGORIES)}
+
+        # Themes that ship an up-to-date icon-theme.cache are looked up through
+        # it and left out of the walk
+        cache_paths = self._open_theme_caches()
+
+        filename = 'icon_index_v2_%d.pkl' % self.size
+        cached_sig, index = self._read_cache(filename)
+        if index is not None and cached_sig and cached_sig[0] == self._icon_theme:
+            # Signature covers every directory the walk visited
+            if self._dir_signature(d for d, _ in cached_sig[1]) == cached_sig[1]:
+                self._icon_index = index
+                self._icon_sig = cached_sig
+                return
+
+        visited = self._build_icon_index()
+        self._icon_sig = (self._icon_theme, self._dir_signature(visited + cache_paths))
+        self._write_cache(filename, self._icon_sig, self._icon_index)
+
+    def _open_theme_caches(self) -> list:
+        """
+        Map the icon-theme.cache of each searched theme that has a valid one.
+
+        A cache older than its theme directory is ignored, as GTK does.
+
+        Returns:
+            Theme directories and cache files used (for the index signature)
+        """
+        self._theme_caches = []  # ((theme_rank, dir_rank), cache, theme_dir)
+        self._cached_themes = set()  # (icon_dir, theme) resolved through a cache
+        used = []
+        for dir_rank, icon_dir in enumerate(self.ICON_DIRS):
+            for theme, rank in self._theme_rank.items():
+                theme_dir = os.path.join(icon_dir, theme)
+                cache_path = os.path.join(theme_dir, 'icon-theme.cache')
+                try:
+                    if os.stat(cache_path).st_mtime_ns < os.stat(theme_dir).st_mtime_ns:
+                        continue
+                    cache = _IconThemeCache(cache_path)
+                except (OSError, ValueError, struct.error):
+                    continue
+                self._theme_caches.append(((rank, dir_rank), cache, theme_dir))
+                self._cached_themes.add((icon_dir, theme))
+                used += [theme_dir, cache_path]
+        self._theme_caches.sort(key=lambda item: item[0])
+        return used
+
+    def _build_icon_index(self) -> list:
+        """
+        Index icon files by name with a single pruned walk of ICON_DIRS.
+
+        Only <icon_dir>/<theme>/<size>/<category>/ directories that the
+        lookup order cares about are visited, skipping themes resolved
+        through icon-theme.cache. Each name keeps its best
+        (theme, icon_dir, size, category, ext) rank and path, using the
+        same size and extension preference as _scan_icon_dirs.
+
+        Returns:
+            List of visited directories (for the cache signature)
+        """
+        ext_rank = {'.svg': 0, '.png': 1, '.xpm': 2}
+        theme_rank = self._theme_rank
+        size_rank = self._size_rank
+        size_ext_rank = self._size_ext_rank
+        category_rank = self._category_rank
+
+        best: Dict[str, tuple] = {}  # name -> (rank, path)
+        visited = []
+
+        # Pixmaps are checked before any theme (exact file name ranks last)
+        pixmaps = '/usr/share/pixmaps'
+        try:
+            with os.scandir(pixmaps) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext in ext_rank:
+                        rank = (-1, 0, 0, 0, ext_rank[ext])
+                        if stem not in best or rank < best[stem][0]:
+                            best[stem] = (rank, entry.path)
+                    rank = (-1, 0, 0, 0, 3)
+                    if entry.name not in best or rank < best[entry.name][0]:
+                        best[entry.name] = (rank, entry.path)
+            visited.append(pixmaps)
+        except OSError:
+            pass
+
+        for dir_rank, icon_dir in enumerate(self.ICON_DIRS):
+            for dirpath, dirnames, filenames in os.walk(icon_dir, followlinks=True):
+                visited.append(dirpath)
+                rel = os.path.relpath(dirpath, icon_dir)
+                parts = [] if rel == '.' else rel.split(os.sep)
+                depth = len(parts)
+
+                # Prune to <theme>/<size>/<category>
+                if depth == 0:
+                    dirnames[:] = [d for d in dirnames
+                                   if d in theme_rank and (icon_dir, d) not in self._cached_themes]
+                    continue
+                if depth == 1:
+                    dirnames[:] = [d for d in dirnames if d in size_rank]
+                    continue
+                if depth == 2:
+                    dirnames[:] = [d for d in dirnames if d in category_rank]
+                    continue
+                dirnames[:] = []
+
+                theme, size, category = parts
+                base_rank = (theme_rank[theme], dir_rank, size_rank[size], category_rank[category])
+                dir_ext_rank = size_ext_rank[size]
+                for filename in filenames:
+                    stem, ext = os.path.splitext(filename)
+                    if ext not in dir_ext_rank:
+                        continue
+                    rank = base_rank + (dir_ext_rank[ext],)
+                    if stem not in best or rank < best[stem][0]:
+                        best[stem] = (rank, os.path.join(dirpath, filename))
+
+        self._icon_index = best
+        return visited
+
+    def _lookup_theme_caches(self, icon_name: str, best: Optional[tuple]) -> Optional[tuple]:
+        """Improve a (rank, path) candidate with hits from the mapped icon-theme.cache files"""
+        ext_flags = {
+            '.svg': _IconThemeCache.FLAG_SVG,
+            '.png': _IconThemeCache.FLAG_PNG,
+            '.xpm': _IconThemeCache.FLAG_XPM,
+        }
+        for key, cache, theme_dir in self._theme_caches:
+            # Caches are sorted by (theme, icon_dir); nothing later can win
+            if best is not None and best[0][:2] < key:
+                break
+            for directory, flags in cache.lookup(icon_name):
+                size, _, category = directory.partition('/')
+                if size not in self._size_rank or category not in self._category_rank:
+                    continue
+                for ext, ext_rank in self._size_ext_rank[size].items():
+                    if flags & ext_flags[ext]:
+                        rank = key + (self._size_rank[size], self._category_rank[category], ext_rank)
+                        if best is None or rank < best[0]:
+                            best = (rank, os.path.join(theme_dir, directory, icon_name + ext))
+        return best
 
     def _get_icon_theme(self) -> str:
         """Get the current icon theme name"""
-        # Try gsettings first (GNOME)
+        # Try GSettings through GIO (GNOME), without spawning gsettings
+        try:
+            from gi.repository import Gio
+            schema_id = 'org.gnome.desktop.interface'
+            source = Gio.SettingsSchemaSource.get_default()
+            # Settings.new() aborts on a missing schema, so look it up first
+            if source is not None and source.lookup(schema_id, True) is not None:
+                theme = Gio.Settings.new(schema_id).get_string('icon-theme')
+                if theme:
+                    return theme
+        except Exception:
+            pass
+
+        # Try GTK settings files
+        for gtk_dir in ('gtk-4.0', 'gtk-3.0'):
+            try:
+                cp = configparser.RawConfigParser(interpolation=None, strict=False)
+                cp.read(os.path.expanduser(f'~/.config/{gtk_dir}/settings.ini'), encoding='utf-8')
+                theme = cp.get('Settings', 'gtk-icon-theme-name', fallback='').strip()
+                if theme:
+                    return theme
+            except Exception:
+                pass
+
+        # Try the gsettings CLI
         try:
             result = subprocess.run(
                 ['gsettings', 'get', 'org.gnome.desktop.interface', 'icon-theme'],
@@ -104,59 +547,69 @@ class IconLoader:
         """Build an index of process names to .desktop files"""
         self._desktop_index: Dict[str, str] = {}  # lowercase name -> icon name
 
-        for desktop_dir in self.DESKTOP_DIRS:
-            if not os.path.exists(desktop_dir):
-                continue
+        # Directories are scanned concurrently; later dirs still override earlier ones
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.DESKTOP_DIRS)) as ex:
+            for part in ex.map(self._scan_desktop_dir, self.DESKTOP_DIRS):
+                self._desktop_index.update(part)
 
-            for desktop_file in glob.glob(os.path.join(desktop_dir, '*.desktop')):
+    def _scan_desktop_dir(self, desktop_dir: str) -> Dict[str, str]:
+        """Index the .desktop files of one directory"""
+        index: Dict[str, str] = {}
+        try:
+            with os.scandir(desktop_dir) as it:
+                # Flatpak/snap exports are symlinks, so follow them here
+                desktop_files = [e.path for e in it
+                                 if e.name.endswith('.desktop') and e.is_file()]
+        except OSError:
+            return index
+
+        for desktop_file in desktop_files:
+            try:
+                cp = configparser.RawConfigParser(
+                    interpolation=None, strict=False, delimiters=('=',)
+                )
                 try:
-                    exec_name = None
-                    icon_name = None
-                    app_name = None
-
-                    with open(desktop_file, 'r', errors='ignore') as f:
-                        in_desktop_entry = False
-                        for line in f:
-                            line = line.strip()
-                            if line == '[Desktop Entry]':
-                                in_desktop_entry = True
-                                continue
-                            if line.startswith('[') and line.endswith(']'):
-                                in_desktop_entry = False
-                                continue
-                            if not in_desktop_entry:
-                                continue
-
-                            if line.startswith('Exec='):
-                                exec_val = line[5:].strip()
-                                exec_parts = exec_val.split()
-                                if exec_parts:
-                                    exec_name = os.path.basename(exec_parts[0])
-                                    if exec_name in ('env', 'bash', 'sh', 'flatpak', 'snap'):
-                                        for part in exec_parts[1:]:
-                                            if not part.startswith('-') and '=' not in part:
-                                                exec_name = os.path.basename(part)
-                                                break
-
-                            elif line.startswith('Icon='):
-                                icon_name = line[5:].strip()
-
-                            elif line.startswith('Name='):
-                                app_name = line[5:].strip()
+                    cp.read(desktop_file, encoding='utf-8')
+                except configparser.ParsingError:
+                    pass  # Keep whatever parsed before the bad line
+                if not cp.has_section('Desktop Entry'):
+                    continue
+                entry = cp['Desktop Entry']
 
-                    if icon_name:
-                        if exec_name:
-                            self._desktop_index[exec_name.lower()] = icon_name
-                        if app_name:
-                            self._desktop_index[app_name.lower()] = icon_name
-                        basename = os.path.basename(desktop_file).replace('.desktop', '')
-                        self._desktop_index[basename.lower()] = icon_name
-
-                except Exception:
+                icon_name = entry.get('Icon')
+                if not icon_name:
                     continue
+                app_name = entry.get('Name')
+
+                exec_name = None
+                exec_val = entry.get('Exec')
+                if exec_val:
+                    try:
+                        exec_parts = shlex.split(exec_val, posix=True)
+                    except ValueError:
+                        exec_parts = exec_val.split()
+                    if exec_parts:
+                        exec_name = os.path.basename(exec_parts[0])
+                        if exec_name in ('env', 'bash', 'sh', 'flatpak', 'snap'):
+                            for part in exec_parts[1:]:
+                                if not part.startswith('-') and '=' not in part:
+                                    exec_name = os.path.basename(part)
+                                    break
+
+                if exec_name:
+                    index[exec_name.lower()] = icon_name
+                if app_name:
+                    index[app_name.lower()] = icon_name
+                basename = os.path.basename(desktop_file).replace('.desktop', '')
+                index[basename.lower()] = icon_name
+
+            except Exception:
+                continue
+
+        return index
 
     def _find_icon_file(self, icon_name: str) -> Optional[str]:
-        """Find the actual icon file path for an icon name (prefers SVG)"""
+        """Find the actual icon file path for an icon name"""
         if not icon_name:
             return None
 
@@ -166,122 +619,195 @@ class IconLoader:
                 return icon_name
             return None
 
-        # Check pixmaps (prefer SVG)
-        for ext in ['.svg', '.png', '.xpm', '']:
-            pixmap_path = f'/usr/share/pixmaps/{icon_name}{ext}'
-            if os.path.exists(pixmap_path):
-                return pixmap_path
-
-        # Search in icon themes
-        themes_to_search = [self._icon_theme, 'hicolor', 'breeze', 'Adwaita', 'AdwaitaLegacy', 'HighContrast']
-
-        for theme in themes_to_search:
+        # Pixmaps and icon themes, resolved by the prebuilt index and icon-theme.cache
+        best = self._lookup_theme_caches(icon_name, self._icon_index.get(icon_name))
+        if best:
+            return best[1]
+
+        # Icons installed after the index was built
+        return self._scan_icon_dirs(icon_name)
+
+    def _listdir(self, path: str) -> frozenset:
+        """Entry names of a directory, listed once per session"""
+        names = self._dir_contents.get(path)
+        if names is None:
+            try:
+                names = frozenset(os.listdir(path))
+            except OSError:
+                names = frozenset()
+            self._dir_contents[path] = names
+        return names
+
+    def _scan_icon_dirs(self, icon_name: str) -> Optional[str]:
+        """On-demand lookup in the same order as the index, using cached listings"""
+        exts = ('.svg', '.png', '.xpm')
+
+        pixmaps = '/usr/share/pixmaps'
+        names = self._listdir(pixmaps)
+        for ext in exts + ('',):
+            if icon_name + ext in names:
+                return os.path.join(pixmaps, icon_name + ext)
+
+        for theme in self._themes_to_search():
             for icon_dir in self.ICON_DIRS:
-                theme_path = os.path.join(icon_dir, theme)
-                if not os.path.exists(theme_path):
+                theme_dir = os.path.join(icon_dir, theme)
+                if theme not in self._listdir(icon_dir):
                     continue
-
-                # Search by size (scalable first for SVG)
-                for size in self.ICON_SIZES:
+                for size in self._size_order():
+                    size_dir = os.path.join(theme_dir, size)
+                    if size not in self._listdir(theme_dir):
+                        continue
                     for category in self.ICON_CATEGORIES:
-                        # Prefer SVG, then PNG
-                        for ext in ['.svg', '.png', '.xpm']:
-                            icon_path = os.path.join(
-                                theme_path, size, category, f'{icon_name}{ext}'
-                            )
-                            if os.path.exists(icon_path):
-                                return icon_path
-
+                        names = self._listdir(os.path.join(size_dir, category))
+                        for ext in self._exts_for_size(size):
+                            if icon_name + ext in names:
+                                return os.path.join(size_dir, category, icon_name + ext)
         return None
 
-    def _load_svg(self, svg_path: str) -> Optional[Image.Image]:
-        """Load an SVG file and convert to PIL Image using CairoSVG"""
-        if not HAS_CAIROSVG:
+    def _load_svg(self, svg_path: str) -> Optional['Image.Image']:
+        """Load an SVG file and convert to PIL Image (resvg first, then CairoSVG)"""
+        try:
+            # Read the file in one go and render from bytes at desired size
+            with open(svg_path, 'rb') as f:
+                svg_data = f.read()
+        except OSError:
+            return None
+
+        png_data = self._render_svg_resvg(svg_path, svg_data)
+        if png_data is None and HAS_CAIROSVG:
+            try:
+                png_data = cairosvg.svg2png(
+                    bytestring=svg_data,
+                    output_width=self.size,
+                    output_height=self.size
+                )
+            except Exception:
+                png_data = None
+
+        if not png_data:
             return None
 
         try:
-            # Render SVG to PNG in memory at desired size
-            png_data = cairosvg.svg2png(
-                url=svg_path,
-                output_width=self.size,
-                output_height=self.size
-            )
             # Load PNG data into PIL
             img = Image.open(io.BytesIO(png_data))
             return img
         except Exception:
             return None
 
-    def _load_image(self, icon_path: str) -> Optional[Image.Image]:
+    def _render_svg_resvg(self, svg_path: str, svg_data: bytes) -> Optional[bytes]:
+        """Render an SVG to PNG bytes with resvg (binding or CLI), or None"""
+        if HAS_RESVG_PY:
+            try:
+                return bytes(resvg_py.svg_to_bytes(
+                    svg_string=svg_data.decode('utf-8', 'replace'),
+                    width=self.size,
+                    height=self.size
+                ))
+            except Exception:
+                pass
+
+        if RESVG_BIN:
+            try:
+                result = subprocess.run(
+                    [RESVG_BIN, '-w', str(self.size), '-h', str(self.size), svg_path, '-c'],
+                    capture_output=True, timeout=5
+                )
+                if result.returncode == 0 and result.stdout:
+                    return result.stdout
+            except Exception:
+                pass
+
+        return None
+
+    def _load_image(self, icon_path: str) -> Optional['Image.Image']:
         """Load an image file (SVG or raster) into PIL Image"""
-        if not HAS_PIL:
+        if not _import_imaging():
             return None
 
+        if self._resample is None:
+            self._resample = Image.Resampling.LANCZOS
+
+        ext = icon_path[icon_path.rfind('.'):].lower()
+        return self._loaders.get(ext, self._load_raster)(icon_path)
+
+    def _load_raster(self, icon_path: str) -> Optional['Image.Image']:
+        """Load a raster image file and scale it to the icon size"""
         try:
-            if icon_path.endswith('.svg'):
-                return self._load_svg(icon_path)
-            else:
-                img = Image.open(icon_path)
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                img = img.resize((self.size, self.size), Image.Resampling.LANCZOS)
-                return img
+            img = Image.open(icon_path)
+            img.draft(None, self._size_tuple)  # JPEG decodes at reduced scale
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            # thumbnail() shrinks in place (with a fast pre-reduce); only
+            # smaller or non-square icons still need a full resize
+            img.thumbnail(self._size_tuple, self._resample)
+            if img.size != self._size_tuple:
+                img = img.resize(self._size_tuple, self._resample)
+            return img
         except Exception:
             return None
 
-    def get_icon(self, process_name: str, root=None) -> Optional[any]:
+    def is_ready(self) -> bool:
+        """Whether the indexes are loaded (get_icon returns None until then)"""
+        return self._ready.is_set()
+
+    def get_icon(self, process_name: str, root=None, name_lower: Optional[str] = None) -> Optional[any]:
         """
         Get an icon for a process name.
 
         Args:
             process_name: The process name (e.g., 'firefox', 'code')
             root: Tkinter root window (needed for PhotoImage)
+            name_lower: Precomputed process_name.lower(), if the caller has it
 
         Returns:
             A Tkinter PhotoImage or None if not found
         """
-        if not HAS_PIL:
+        if HAS_PIL is False or not self._ready.is_set():
             return None
 
-        name_lower = process_name.lower()
+        # Known misses skip even the lowercase/cache lookups
+        if process_name in self._miss_set:
+            return None
+
+        if name_lower is None:
+            name_lower = process_name.lower()
 
         # Check cache first
-        if name_lower in self._cache:
-            return self._cache[name_lower]
+        photo = self._cache.get(name_lower)
+        if photo is not None:
+            self._cache.move_to_end(name_lower)
+            return photo
+
+        # Evicted from the LRU but still shown by a row
+        photo = self._live.get(name_lower)
+        if photo is not None:
+            self._cache_icon(name_lower, photo)
+            return photo
+
+        # Rendered icon (or known miss) from a previous session
+        cache_base = os.path.join(self._icon_cache_dir, quote(name_lower, safe=''))
+        photo = self._load_cached_icon(cache_base + '.png')
+        if photo is not None:
+            self._cache_icon(name_lower, photo)
+            return photo
+        if self._is_cached_miss(cache_base + '.miss'):
+            self._remember_miss(process_name)
+            return None
 
         # Try to find icon name from desktop file
         icon_name = self._desktop_index.get(name_lower)
 
-        # Try variations if not found
+        # Try variations if not found (only suffixes present in the name)
         if not icon_name:
-            for suffix in ['-bin', '-browser', '-stable', '-beta', '-dev']:
-                base_name = name_lower.replace(suffix, '')
-                if base_name in self._desktop_index:
-                    icon_name = self._desktop_index[base_name]
-                    break
+            for suffix in self.NAME_SUFFIXES:
+                if suffix in name_lower:
+                    icon_name = self._desktop_index.get(name_lower.replace(suffix, ''))
+                    if icon_name:
+                        break
 
         # Try common mappings
         if not icon_name:
-            mappings = {
-                'chrome': 'google-chrome',
-                'chromium-browser': 'chromium',
-                'code': 'visual-studio-code',
-                'code-oss': 'visual-studio-code',
-                'cursor': 'cursor',
-                'firefox-esr': 'firefox',
-                'thunderbird': 'thunderbird',
-                'nautilus': 'org.gnome.Nautilus',
-                'gnome-terminal': 'org.gnome.Terminal',
-                'konsole': 'utilities-terminal',
-                'dolphin': 'org.kde.dolphin',
-                'vlc': 'vlc',
-                'spotify': 'spotify',
-                'discord': 'discord',
-                'slack': 'slack',
-                'telegram-desktop': 'telegram',
-                'steam': 'steam',
-            }
-            icon_name = mappings.get(name_lower)
+            icon_name = self.MAPPINGS.get(name_lower)
 
         if not icon_name:
             icon_name = name_lower
@@ -290,25 +816,98 @@ class IconLoader:
         icon_path = self._find_icon_file(icon_name)
 
         if not icon_path:
-            self._cache[name_lower] = None
+            self._remember_miss(process_name)
+            self._save_cached_miss(cache_base + '.miss')
             return None
 
         # Load the image
         img = self._load_image(icon_path)
 
         if not img:
-            self._cache[name_lower] = None
+            self._remember_miss(process_name)
+            # An SVG with no renderer installed is not a miss for later sessions
+            if self._can_render(icon_path):
+                self._save_cached_miss(cache_base + '.miss')
             return None
 
+        self._save_cached_icon(img, cache_base + '.png')
+
         # Convert to PhotoImage
         try:
             photo = ImageTk.PhotoImage(img)
-            self._cache[name_lower] = photo
+            self._cache_icon(name_lower, photo)
             return photo
         except Exception:
-            self._cache[name_lower] = None
+            self._remember_miss(process_name)
             return None
 
+    def _cache_icon(self, name_lower: str, photo):
+        """Add an icon to the LRU, evicting the least recently used past the bound"""
+        self._cache[name_lower] = photo
+        self._cache.move_to_end(name_lower)
+        self._live[name_lower] = photo
+        if len(self._cache) > self.ICON_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _remember_miss(self, process_name: str):
+        """Record a process name with no icon (bounded; reset when full)"""
+        if len(self._miss_set) >= self.MISS_CACHE_SIZE:
+            self._miss_set.clear()
+        self._miss_set.add(process_name)
+
+    def _load_cached_icon(self, png_path: str) -> Optional[any]:
+        """Load a previously rendered icon PNG as a PhotoImage"""
+        if not os.path.exists(png_path) or not _import_imaging():
+            return None
+        try:
+            img = Image.open(png_path)
+            img.load()
+            return ImageTk.PhotoImage(img)
+        except Exception:
+            return None
+
+    def _save_cached_icon(self, img, png_path: str):
+        """Write a rendered icon to the on-disk cache"""
+        try:
+            os.makedirs(self._icon_cache_dir, exist_ok=True)
+            img.save(png_path, 'PNG', optimize=False, compress_level=1)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _can_render(icon_path: str) -> bool:
+        """Whether a renderer for the icon file's format is installed"""
+        if icon_path.lower().endswith('.svg'):
+            return bool(HAS_RESVG_PY or RESVG_BIN or HAS_CAIROSVG)
+        return bool(HAS_PIL)
+
+    def _is_cached_miss(self, miss_path: str) -> bool:
+        """True if a miss marker exists (the cache dir changes with the indexes)"""
+        return os.path.exists(miss_path)
+
+    def _save_cached_miss(self, miss_path: str):
+        """Record a negative lookup as a zero-byte marker file"""
+        try:
+            os.makedirs(self._icon_cache_dir, exist_ok=True)
+            with open(miss_path, 'wb'):
+                pass
+        except OSError:
+            pass
+
     def clear_cache(self):
         """Clear the icon cache"""
         self._cache.clear()
+        self._live.clear()
+        self._miss_set.clear()
+
+
+# Shared loaders (one per icon size) so indexes and caches are built once per process
+_shared_loaders: Dict[int, IconLoader] = {}
+
+
+def get_icon_loader(size: int = 20) -> IconLoader:
+    """Return the shared IconLoader for an icon size, creating it on first use"""
+    loader = _shared_loaders.get(size)
+    if loader is None:
+        loader = _shared_loaders[size] = IconLoader(size=size)
+    return loader
@@ -5,36 +5,147 @@ WSysMon-inspired layout with sidebar and detail panels
 
 import tkinter as tk
 from tkinter import ttk
-from collections import deque
+from collections import deque, namedtuple
 import psutil
+import os
+import threading
 import time
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from ..themes import COLORS, Theme
 from ..widgets import GraphWidget, PerformanceButton
 
 
+# Byte-count divisors for the display units
+GB = 1 << 30
+MB = 1 << 20
+
+
+# Static CPU facts; they never change while the app runs
+CpuInfo = namedtuple('CpuInfo', ['model', 'max_speed', 'sockets', 'cores', 'threads'])
+
+
+# Memory figures read from /proc/meminfo (same meaning as psutil.virtual_memory)
+MemInfo = namedtuple('MemInfo', ['total', 'available', 'used', 'cached', 'percent'])
+
+
+# Filesystem usage figures (same meaning as psutil.disk_usage)
+DiskUsage = namedtuple('DiskUsage', ['total', 'used', 'percent'])
+
+
+def _disk_usage(path):
+    """statvfs-based disk usage for path, or None if it can't be read"""
+    try:
+        st = os.statvfs(path)
+    except OSError:
+        return None
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    avail = st.f_bavail * st.f_frsize  # what unprivileged users can still use
+    percent = round(used / (used + avail) * 100, 1) if used + avail else 0.0
+    return DiskUsage(total, used, percent)
+
+
+@lru_cache(maxsize=1)
+def _static_cpu_info() -> CpuInfo:
+    """Read static CPU information from /proc and sysfs (once per process)"""
+    model = None
+    physical_ids = set()
+    core_ids = set()  # distinct (physical id, core id) pairs = physical cores
+    physical_id = None
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    if model is None:
+                        model = line.split(':', 1)[1].strip()
+                elif line.startswith('physical id'):
+                    physical_id = line.split(':', 1)[1].strip()
+                    physical_ids.add(physical_id)
+                elif line.startswith('core id'):
+                    core_ids.add((physical_id, line.split(':', 1)[1].strip()))
+    except OSError:
+        pass
+
+    try:
+        threads = os.sysconf('SC_NPROCESSORS_ONLN')
+    except (ValueError, OSError):
+        threads = 0
+
+    max_mhz = 0.0
+    try:
+        with open('/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq', 'r') as f:
+            max_mhz = int(f.read()) / 1000
+    except (OSError, ValueError):
+        try:
+            max_mhz = psutil.cpu_freq().max
+        except:
+            pass
+
+    return CpuInfo(
+        model=model or "Unknown CPU",
+        max_speed=f"{max_mhz/1000:.2f}GHz" if max_mhz else "0 GHz",
+        sockets=len(physical_ids) or 1,
+        # Some architectures have no core id lines; let psutil work it out there
+        cores=len(core_ids) or psutil.cpu_count(logical=False) or 1,
+        threads=threads if threads > 0 else (psutil.cpu_count() or 1)
+    )
+
+
 class PerformanceView(tk.Frame):
     """
     Performance view with sidebar navigation and metric panels.
     Displays CPU, Memory, Disk, Network, and GPU statistics.
     """
 
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, results_q, **kwargs):
         super().__init__(parent, bg=COLORS['bg_primary'], **kwargs)
 
-        self.cpu_history = deque(maxlen=60)
-        self.mem_history = deque(maxlen=60)
-        self.gpu_history = deque(maxlen=60)
         self.current_panel = 'cpu'
+        self._results_q = results_q  # (callback, result) pairs run on the Tk thread
         self.gpu_data = []
         self.has_gpu = False
+        self._gpu_btn_frame = None  # GPU rows last written to the button / panel labels
+        self._gpu_labels_frame = None
         self.start_time = time.time()
+        self._boot_time = psutil.boot_time()  # fixed until reboot; uptime fallback only
 
         # Cached values for expensive operations (updated less frequently)
         self._thread_count = 0
         self._proc_count = 0
         self._cpu_temp = 0
-        self._slow_update_counter = 0
+        self._tick_count = 0
+
+        # /proc files read every tick stay open; each read is a pread at offset 0
+        self._proc_fds = {}
+        for name in ('stat', 'meminfo', 'uptime', 'net/dev'):
+            try:
+                self._proc_fds[name] = os.open('/proc/' + name, os.O_RDONLY)
+            except OSError:
+                pass
+        self._prev_cpu_times = None  # (busy, total) jiffies from the last tick
+
+        # CPU temperature is polled by a background thread (hwmon reads can be slow)
+        self._stopped = threading.Event()
+        self._sensor_thread = threading.Thread(target=self._sensor_loop, daemon=True)
+        self._sensor_thread.start()
+
+        # Pre-bound "configure -text" calls for labels written on ticks, by name
+        self._text_setters = {}
+        self._last_texts = {}  # last text written per setter name
+
+        # Samples for graphs whose panel hasn't been built yet (panels are created
+        # on first show; the backlog is replayed into the new graph)
+        self._graph_backlog = {
+            'memory': deque(maxlen=Theme.GRAPH_HISTORY_SIZE),
+            'gpu': deque(maxlen=Theme.GRAPH_HISTORY_SIZE),
+        }
+
+        # Disk usage is stat'ed on worker threads (see _stat_disk)
+        self._disk_pool = None
+        self._disk_pending = {}  # mountpoint -> last statvfs future
+        self._disk_usage = {}  # mountpoint -> last DiskUsage (None if unreadable)
+        self._disk_partitions = []
 
         # Get CPU info once
         self._get_cpu_info()
@@ -43,24 +154,12 @@ class PerformanceView(tk.Frame):
 
     def _get_cpu_info(self):
         """Get static CPU information"""
-        self.cpu_model = "Unknown CPU"
-        self.cpu_max_speed = "0 GHz"
-        self.cpu_sockets = 1
-        self.cpu_cores = psutil.cpu_count(logical=False) or 1
-        self.cpu_threads = psutil.cpu_count() or 1
-
-        try:
-            result = subprocess.run(['lscpu'], capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if 'Model name' in line:
-                    self.cpu_model = line.split(':')[1].strip()
-                elif 'CPU max MHz' in line:
-                    max_mhz = float(line.split(':')[1].strip())
-                    self.cpu_max_speed = f"{max_mhz/1000:.2f}GHz"
-                elif 'Socket(s)' in line:
-                    self.cpu_sockets = int(line.split(':')[1].strip())
-        except:
-            pass
+        info = _static_cpu_info()
+        self.cpu_model = info.model
+        self.cpu_max_speed = info.max_speed
+        self.cpu_sockets = info.sockets
+        self.cpu_cores = info.cores
+        self.cpu_threads = info.threads
 
     def _create_ui(self):
         """Create the performance view UI"""
@@ -85,17 +184,23 @@ class PerformanceView(tk.Frame):
         self.content = tk.Frame(main_container, bg=COLORS['bg_primary'])
         self.content.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, Theme.PADDING_LARGE), pady=(0, Theme.PADDING_MEDIUM))
 
-        # Create panels
+        # Panels are built on first show; only the default CPU panel up front
         self.panels = {}
-        self._create_cpu_panel()
-        self._create_memory_panel()
-        self._create_disk_panel()
-        self._create_network_panel()
-        self._create_gpu_panel()
+        self._panel_factories = {
+            'cpu': self._create_cpu_panel,
+            'memory': self._create_memory_panel,
+            'disk': self._create_disk_panel,
+            'network': self._create_network_panel,
+            'gpu': self._create_gpu_panel,
+        }
 
         # Show CPU panel by default
         self._show_panel('cpu')
 
+        # Graphs skip redraws while not viewable; hiding the view or a panel
+        # (pack_forget) doesn't unmap them, so catch up when it is shown again
+        self.bind('<Map>', self._on_map)
+
     def _create_sidebar_buttons(self, parent):
         """Create sidebar navigation buttons"""
         # CPU Button - orange
@@ -211,97 +316,85 @@ class PerformanceView(tk.Frame):
             bg=COLORS['bg_primary'], fg=COLORS['text_secondary']
         ).pack(side=tk.RIGHT)
 
-        # Stats section - two rows matching WSysMon layout
-        stats_container = tk.Frame(panel, bg=COLORS['bg_primary'])
-        stats_container.pack(fill=tk.X, padx=Theme.PADDING_LARGE, pady=(Theme.PADDING_MEDIUM, Theme.PADDING_LARGE))
+        # Stats section - two rows matching WSysMon layout, one grid
+        stats = self._create_stats_grid(panel)
 
         # Row 1: Usage, Speed, Processes | Maximum CPU speed
-        row1 = tk.Frame(stats_container, bg=COLORS['bg_primary'])
-        row1.pack(fill=tk.X, pady=(0, Theme.PADDING_SMALL))
-
-        # Left stats
-        left_stats1 = tk.Frame(row1, bg=COLORS['bg_primary'])
-        left_stats1.pack(side=tk.LEFT)
+        self._create_stat_item(stats, "Usage", "0%", 'cpu_usage', row=0, column=0, pady=Theme.PADDING_SMALL)
+        self._create_stat_item(stats, "Speed", "0GHz", 'cpu_speed', row=0, column=1, pady=Theme.PADDING_SMALL)
+        self._create_stat_item(stats, "Processes", "0", 'cpu_procs', row=0, column=2, pady=Theme.PADDING_SMALL)
 
-        # Usage
-        self._create_stat_item(left_stats1, "Usage", "0%", 'cpu_usage')
-        # Speed
-        self._create_stat_item(left_stats1, "Speed", "0GHz", 'cpu_speed')
-        # Processes
-        self._create_stat_item(left_stats1, "Processes", "0", 'cpu_procs')
-
-        # Right stats
-        right_stats1 = tk.Frame(row1, bg=COLORS['bg_primary'])
-        right_stats1.pack(side=tk.RIGHT)
-
-        self._create_stat_item_right(right_stats1, "Maximum CPU speed:", self.cpu_max_speed)
+        self._create_stat_item_right(stats, "Maximum CPU speed:", self.cpu_max_speed, row=0, rowspan=2)
 
         # Row 2: Threads, Uptime, Temperature | Sockets, Cores, Logical processors
-        row2 = tk.Frame(stats_container, bg=COLORS['bg_primary'])
-        row2.pack(fill=tk.X)
-
-        # Left stats
-        left_stats2 = tk.Frame(row2, bg=COLORS['bg_primary'])
-        left_stats2.pack(side=tk.LEFT)
-
-        self._create_stat_item(left_stats2, "Threads", "0", 'cpu_threads')
-        self._create_stat_item(left_stats2, "Uptime", "00:00:00", 'cpu_uptime')
-        self._create_stat_item(left_stats2, "Temperature", "0°C", 'cpu_temp')
+        self._create_stat_item(stats, "Threads", "0", 'cpu_threads', row=2, column=0, value_rowspan=2)
+        self._create_stat_item(stats, "Uptime", "00:00:00", 'cpu_uptime', row=2, column=1, value_rowspan=2)
+        self._create_stat_item(stats, "Temperature", "0°C", 'cpu_temp', row=2, column=2, value_rowspan=2)
 
-        # Right stats
-        right_stats2 = tk.Frame(row2, bg=COLORS['bg_primary'])
-        right_stats2.pack(side=tk.RIGHT)
-
-        self._create_stat_item_right(right_stats2, "Sockets:", str(self.cpu_sockets))
-        self._create_stat_item_right(right_stats2, "Cores:", str(self.cpu_cores))
-        self._create_stat_item_right(right_stats2, "Logical processors:", str(self.cpu_threads))
+        self._create_stat_item_right(stats, "Sockets:", str(self.cpu_sockets), row=2)
+        self._create_stat_item_right(stats, "Cores:", str(self.cpu_cores), row=3)
+        self._create_stat_item_right(stats, "Logical processors:", str(self.cpu_threads), row=4)
 
         self.panels['cpu'] = panel
 
-    def _create_stat_item(self, parent, label, value, var_name=None):
-        """Create a stat item (label on top, value below)"""
-        frame = tk.Frame(parent, bg=COLORS['bg_primary'])
-        frame.pack(side=tk.LEFT, padx=(0, 24))
+    def _create_stats_grid(self, panel):
+        """Create the stats frame below a graph (left items, spacer column 3, right items)"""
+        stats = tk.Frame(panel, bg=COLORS['bg_primary'])
+        stats.pack(fill=tk.X, padx=Theme.PADDING_LARGE, pady=(Theme.PADDING_MEDIUM, Theme.PADDING_LARGE))
+        stats.columnconfigure(3, weight=1)
+        return stats
 
+    def _create_stat_item(self, parent, label, value, var_name=None, row=0, column=0,
+                          value_rowspan=1, pady=0):
+        """Create a stat item (label on top, value below) in grid cells of parent"""
         tk.Label(
-            frame, text=label,
+            parent, text=label,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['bg_primary'], fg=COLORS['text_secondary']
-        ).pack(anchor='w')
+        ).grid(row=row, column=column, sticky='w', padx=(0, 24))
 
         val_label = tk.Label(
-            frame, text=value,
+            parent, text=value,
             font=Theme.get_font(Theme.FONT_SIZE_HEADER, bold=True),
             bg=COLORS['bg_primary'], fg=COLORS['text_primary']
         )
-        val_label.pack(anchor='w')
+        val_label.grid(row=row + 1, column=column, rowspan=value_rowspan,
+                       sticky='nw', padx=(0, 24), pady=(0, pady))
 
         if var_name:
             setattr(self, f'{var_name}_label', val_label)
+            self._bind_text_setter(var_name, val_label)
+
+    def _bind_text_setter(self, name, label):
+        """Pre-bind the Tcl call that sets label's text (skips configure()'s option parsing)"""
+        self._text_setters[name] = partial(self.tk.call, str(label), 'configure', '-text')
 
-    def _create_stat_item_right(self, parent, label, value):
-        """Create a right-aligned stat item (label: value on same line)"""
-        frame = tk.Frame(parent, bg=COLORS['bg_primary'])
-        frame.pack(anchor='e')
+    def _set_text(self, name, text):
+        """Set a named label's text, skipping the Tk call when it hasn't changed"""
+        if self._last_texts.get(name) != text:
+            self._last_texts[name] = text
+            self._text_setters[name](text)
 
+    def _create_stat_item_right(self, parent, label, value, row=0, rowspan=1):
+        """Create a right-side stat item (label: value on same line) in grid columns 4-5"""
         tk.Label(
-            frame, text=label,
+            parent, text=label,
             font=Theme.get_font(Theme.FONT_SIZE_SMALL),
             bg=COLORS['bg_primary'], fg=COLORS['text_secondary']
-        ).pack(side=tk.LEFT)
+        ).grid(row=row, column=4, rowspan=rowspan, sticky='w')
 
         tk.Label(
-            frame, text=value,
+            parent, text=value,
             font=Theme.get_font(Theme.FONT_SIZE_SMALL),
             bg=COLORS['bg_primary'], fg=COLORS['text_primary']
-        ).pack(side=tk.LEFT, padx=(8, 0))
+        ).grid(row=row, column=5, rowspan=rowspan, sticky='w', padx=(8, 0))
 
     def _create_memory_panel(self):
         """Create Memory detail panel"""
         panel = tk.Frame(self.content, bg=COLORS['bg_primary'])
 
         mem = psutil.virtual_memory()
-        total_gb = mem.total / (1024**3)
+        total_gb = mem.total / GB
 
         # Header
         header = tk.Frame(panel, bg=COLORS['bg_primary'])
@@ -345,6 +438,8 @@ class PerformanceView(tk.Frame):
                                      fill_color=COLORS['graph_fill_purple'])
         self.mem_graph.show_labels = False
         self.mem_graph.pack(fill=tk.BOTH, expand=True)
+        for value in self._graph_backlog.pop('memory'):
+            self.mem_graph.add_value(value)
 
         # Graph labels bottom
         graph_labels_bottom = tk.Frame(panel, bg=COLORS['bg_primary'])
@@ -363,20 +458,13 @@ class PerformanceView(tk.Frame):
         ).pack(side=tk.RIGHT)
 
         # Stats
-        stats_container = tk.Frame(panel, bg=COLORS['bg_primary'])
-        stats_container.pack(fill=tk.X, padx=Theme.PADDING_LARGE, pady=(Theme.PADDING_MEDIUM, Theme.PADDING_LARGE))
-
-        row1 = tk.Frame(stats_container, bg=COLORS['bg_primary'])
-        row1.pack(fill=tk.X)
+        stats = self._create_stats_grid(panel)
 
-        self._create_stat_item(row1, "In Use", f"{mem.used / (1024**3):.1f} GB", 'mem_used')
-        self._create_stat_item(row1, "Available", f"{mem.available / (1024**3):.1f} GB", 'mem_avail')
-        self._create_stat_item(row1, "Cached", f"{mem.cached / (1024**3):.1f} GB", 'mem_cached')
+        self._create_stat_item(stats, "In Use", f"{mem.used / GB:.1f} GB", 'mem_used', column=0)
+        self._create_stat_item(stats, "Available", f"{mem.available / GB:.1f} GB", 'mem_avail', column=1)
+        self._create_stat_item(stats, "Cached", f"{mem.cached / GB:.1f} GB", 'mem_cached', column=2)
 
-        right_stats = tk.Frame(row1, bg=COLORS['bg_primary'])
-        right_stats.pack(side=tk.RIGHT)
-
-        self._create_stat_item_right(right_stats, "Total:", f"{total_gb:.1f} GB")
+        self._create_stat_item_right(stats, "Total:", f"{total_gb:.1f} GB", rowspan=2)
 
         self.panels['memory'] = panel
 
@@ -394,57 +482,121 @@ class PerformanceView(tk.Frame):
             bg=COLORS['bg_primary'], fg=COLORS['text_primary']
         ).pack(side=tk.LEFT)
 
-        # Disk info
-        content_area = tk.Frame(panel, bg=COLORS['bg_primary'])
-        content_area.pack(fill=tk.BOTH, expand=True, padx=Theme.PADDING_LARGE)
-
-        try:
-            partitions = psutil.disk_partitions()
-            for part in partitions[:4]:
-                try:
-                    usage = psutil.disk_usage(part.mountpoint)
-                    self._create_disk_card(content_area, part, usage)
-                except:
-                    pass
-        except:
-            pass
+        # Disk info (cards are pooled and refreshed in place)
+        self._disk_area = tk.Frame(panel, bg=COLORS['bg_primary'])
+        self._disk_area.pack(fill=tk.BOTH, expand=True, padx=Theme.PADDING_LARGE)
+        self._disk_cards = []
 
         self.panels['disk'] = panel
 
-    def _create_disk_card(self, parent, partition, usage):
-        """Create a card for a disk partition"""
+    def _refresh_disk_cards(self):
+        """Update the disk cards, reusing pooled card widgets"""
+        try:
+            partitions = psutil.disk_partitions()[:4]
+        except:
+            partitions = []
+
+        self._disk_partitions = partitions
+        for part in partitions:
+            self._stat_disk(part.mountpoint)
+        self._render_disk_cards()
+
+    def _stat_disk(self, mountpoint):
+        """Start a statvfs of mountpoint on a worker; _on_disk_usage gets the result"""
+        # statvfs can block on a slow or dead network mount, so it never runs on
+        # the Tk thread. A mount still stuck from an earlier request keeps that
+        # request instead of tying up another worker.
+        future = self._disk_pending.get(mountpoint)
+        if future is not None and not future.done():
+            return
+        if self._disk_pool is None:
+            self._disk_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='statvfs')
+        future = self._disk_pool.submit(_disk_usage, mountpoint)
+        self._disk_pending[mountpoint] = future
+        future.add_done_callback(
+            lambda f: self._results_q.put((self._on_disk_usage, (mountpoint, f))))
+
+    def _on_disk_usage(self, done):
+        """Record a finished statvfs and redraw what shows it (Tk thread, via the pump)"""
+        mountpoint, future = done
+        if self._stopped.is_set() or future.exception():
+            return
+        usage = future.result()
+        self._disk_usage[mountpoint] = usage
+        if mountpoint == '/' and usage:
+            self.disk_btn.set_value(usage.percent)
+            self.disk_btn.set_secondary_text(f"{usage.used / GB:.0f} / {usage.total / GB:.0f} GB")
+        if self.current_panel == 'disk':
+            self._render_disk_cards()
+
+    def _render_disk_cards(self):
+        """Show the last known usage of every mount that isn't stuck in statvfs"""
+        if self._stopped.is_set():
+            return
+        rows = []
+        for part in self._disk_partitions:
+            future = self._disk_pending.get(part.mountpoint)
+            usage = self._disk_usage.get(part.mountpoint)
+            if future is not None and future.done() and usage is not None:
+                rows.append((part, usage))
+
+        self._sync_card_pool(self._disk_cards, len(rows), self._create_disk_card, self._disk_area)
+        for card, (part, usage) in zip(self._disk_cards, rows):
+            card['mount'].configure(text=part.mountpoint)
+            card['device'].configure(text=f"{part.device} ({part.fstype})")
+            card['bar'].configure(width=int(usage.percent / 100 * 300))
+            card['usage'].configure(
+                text=f"{usage.used / GB:.1f} GB / {usage.total / GB:.1f} GB ({usage.percent:.0f}%)")
+
+    def _sync_card_pool(self, pool, count, create, parent):
+        """Grow pool to count cards (creating only what is missing) and show exactly count of them"""
+        while len(pool) < count:
+            pool.append(create(parent))
+        for i, card in enumerate(pool):
+            if i < count:
+                if not card['shown']:
+                    card['frame'].pack(fill=tk.X, pady=8)
+                    card['shown'] = True
+            elif card['shown']:
+                card['frame'].pack_forget()
+                card['shown'] = False
+
+    def _create_disk_card(self, parent):
+        """Create an (unpacked) card for a disk partition; filled by _render_disk_cards"""
         card = tk.Frame(parent, bg=COLORS['surface'], highlightbackground=COLORS['border'], highlightthickness=1)
-        card.pack(fill=tk.X, pady=8)
 
         inner = tk.Frame(card, bg=COLORS['surface'])
         inner.pack(fill=tk.X, padx=16, pady=12)
 
-        tk.Label(
-            inner, text=partition.mountpoint,
+        mount = tk.Label(
+            inner,
             font=Theme.get_font(Theme.FONT_SIZE_BODY, bold=True),
             bg=COLORS['surface'], fg=COLORS['text_primary']
-        ).pack(anchor='w')
+        )
+        mount.pack(anchor='w')
 
-        tk.Label(
-            inner, text=f"{partition.device} ({partition.fstype})",
+        device = tk.Label(
+            inner,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['surface'], fg=COLORS['text_secondary']
-        ).pack(anchor='w')
+        )
+        device.pack(anchor='w')
 
         bar_frame = tk.Frame(inner, bg=COLORS['bg_tertiary'], height=8)
         bar_frame.pack(fill=tk.X, pady=(8, 4))
 
-        used_pct = usage.percent / 100
-        bar = tk.Frame(bar_frame, bg=COLORS['accent'], width=int(used_pct * 300), height=8)
+        bar = tk.Frame(bar_frame, bg=COLORS['accent'], width=0, height=8)
         bar.place(x=0, y=0)
 
-        total_gb = usage.total / (1024**3)
-        used_gb = usage.used / (1024**3)
-        tk.Label(
-            inner, text=f"{used_gb:.1f} GB / {total_gb:.1f} GB ({usage.percent:.0f}%)",
+        usage = tk.Label(
+            inner,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['surface'], fg=COLORS['text_secondary']
-        ).pack(anchor='w')
+        )
+        usage.pack(anchor='w')
+
+        return {'frame': card, 'shown': False, 'mount': mount, 'device': device,
+                'bar': bar, 'usage': usage}
 
     def _create_network_panel(self):
         """Create Network detail panel"""
@@ -460,63 +612,74 @@ class PerformanceView(tk.Frame):
             bg=COLORS['bg_primary'], fg=COLORS['text_primary']
         ).pack(side=tk.LEFT)
 
-        content_area = tk.Frame(panel, bg=COLORS['bg_primary'])
-        content_area.pack(fill=tk.BOTH, expand=True, padx=Theme.PADDING_LARGE)
+        # Interface cards (pooled and refreshed in place)
+        self._net_area = tk.Frame(panel, bg=COLORS['bg_primary'])
+        self._net_area.pack(fill=tk.BOTH, expand=True, padx=Theme.PADDING_LARGE)
+        self._net_cards = []
+
+        self.panels['network'] = panel
 
+    def _refresh_network_cards(self):
+        """Update the network interface cards, reusing pooled card widgets"""
         try:
-            stats = psutil.net_io_counters(pernic=True)
+            stats = list(psutil.net_io_counters(pernic=True).items())[:4]
             addrs = psutil.net_if_addrs()
-
-            for iface, stat in list(stats.items())[:4]:
-                self._create_network_card(content_area, iface, stat, addrs.get(iface, []))
         except:
-            pass
-
-        self.panels['network'] = panel
-
-    def _create_network_card(self, parent, iface, stats, addrs):
-        """Create a card for a network interface"""
+            stats, addrs = [], {}
+
+        self._sync_card_pool(self._net_cards, len(stats), self._create_network_card, self._net_area)
+        for card, (iface, stat) in zip(self._net_cards, stats):
+            ip = "No IP"
+            for addr in addrs.get(iface, []):
+                if addr.family.name == 'AF_INET':
+                    ip = addr.address
+                    break
+
+            card['iface'].configure(text=iface)
+            card['ip'].configure(text=ip)
+            card['sent'].configure(text=f"Sent: {stat.bytes_sent / GB:.2f} GB")
+            card['recv'].configure(text=f"Received: {stat.bytes_recv / GB:.2f} GB")
+
+    def _create_network_card(self, parent):
+        """Create an (unpacked) card for a network interface; filled by _refresh_network_cards"""
         card = tk.Frame(parent, bg=COLORS['surface'], highlightbackground=COLORS['border'], highlightthickness=1)
-        card.pack(fill=tk.X, pady=8)
 
         inner = tk.Frame(card, bg=COLORS['surface'])
         inner.pack(fill=tk.X, padx=16, pady=12)
 
-        tk.Label(
-            inner, text=iface,
+        iface = tk.Label(
+            inner,
             font=Theme.get_font(Theme.FONT_SIZE_BODY, bold=True),
             bg=COLORS['surface'], fg=COLORS['text_primary']
-        ).pack(anchor='w')
-
-        ip = "No IP"
-        for addr in addrs:
-            if addr.family.name == 'AF_INET':
-                ip = addr.address
-                break
+        )
+        iface.pack(anchor='w')
 
-        tk.Label(
-            inner, text=ip,
+        ip = tk.Label(
+            inner,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['surface'], fg=COLORS['text_secondary']
-        ).pack(anchor='w')
+        )
+        ip.pack(anchor='w')
 
         stats_row = tk.Frame(inner, bg=COLORS['surface'])
         stats_row.pack(fill=tk.X, pady=(8, 0))
 
-        sent_gb = stats.bytes_sent / (1024**3)
-        recv_gb = stats.bytes_recv / (1024**3)
-
-        tk.Label(
-            stats_row, text=f"Sent: {sent_gb:.2f} GB",
+        sent = tk.Label(
+            stats_row,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['surface'], fg=COLORS['accent']
-        ).pack(side=tk.LEFT, padx=(0, 16))
+        )
+        sent.pack(side=tk.LEFT, padx=(0, 16))
 
-        tk.Label(
-            stats_row, text=f"Received: {recv_gb:.2f} GB",
+        recv = tk.Label(
+            stats_row,
             font=Theme.get_font(Theme.FONT_SIZE_TINY),
             bg=COLORS['surface'], fg=COLORS['accent_secondary']
-        ).pack(side=tk.LEFT)
+        )
+        recv.pack(side=tk.LEFT)
+
+        return {'frame': card, 'shown': False, 'iface': iface, 'ip': ip,
+                'sent': sent, 'recv': recv}
 
     def _create_gpu_panel(self):
         """Create GPU detail panel - WSysMon style with green graph"""
@@ -532,6 +695,7 @@ class PerformanceView(tk.Frame):
             bg=COLORS['bg_primary'], fg=COLORS['text_primary']
         )
         self.gpu_title_label.pack(side=tk.LEFT)
+        self._bind_text_setter('gpu_title', self.gpu_title_label)
 
         self.gpu_model_label = tk.Label(
             header, text="No GPU detected",
@@ -539,6 +703,7 @@ class PerformanceView(tk.Frame):
             bg=COLORS['bg_primary'], fg=COLORS['text_secondary']
         )
         self.gpu_model_label.pack(side=tk.RIGHT)
+        self._bind_text_setter('gpu_model', self.gpu_model_label)
 
         # Graph labels top
         graph_labels_top = tk.Frame(panel, bg=COLORS['bg_primary'])
@@ -566,6 +731,8 @@ class PerformanceView(tk.Frame):
                                      fill_color=COLORS['graph_fill_green'])
         self.gpu_graph.show_labels = False
         self.gpu_graph.pack(fill=tk.BOTH, expand=True)
+        for value in self._graph_backlog.pop('gpu'):
+            self.gpu_graph.add_value(value)
 
         # Graph labels bottom
         graph_labels_bottom = tk.Frame(panel, bg=COLORS['bg_primary'])
@@ -584,24 +751,15 @@ class PerformanceView(tk.Frame):
         ).pack(side=tk.RIGHT)
 
         # Stats - WSysMon GPU layout
-        stats_container = tk.Frame(panel, bg=COLORS['bg_primary'])
-        stats_container.pack(fill=tk.X, padx=Theme.PADDING_LARGE, pady=(Theme.PADDING_MEDIUM, Theme.PADDING_LARGE))
-
-        row1 = tk.Frame(stats_container, bg=COLORS['bg_primary'])
-        row1.pack(fill=tk.X, pady=(0, Theme.PADDING_SMALL))
+        stats = self._create_stats_grid(panel)
 
-        self._create_stat_item(row1, "Usage", "0%", 'gpu_usage')
-        self._create_stat_item(row1, "Speed", "0MHz", 'gpu_speed')
-        self._create_stat_item(row1, "Video memory", "0/0 GiB (0%)", 'gpu_vram')
+        self._create_stat_item(stats, "Usage", "0%", 'gpu_usage', column=0, pady=Theme.PADDING_SMALL)
+        self._create_stat_item(stats, "Speed", "0MHz", 'gpu_speed', column=1, pady=Theme.PADDING_SMALL)
+        self._create_stat_item(stats, "Video memory", "0/0 GiB (0%)", 'gpu_vram', column=2, pady=Theme.PADDING_SMALL)
 
-        right_stats1 = tk.Frame(row1, bg=COLORS['bg_primary'])
-        right_stats1.pack(side=tk.RIGHT)
-        self._create_stat_item_right(right_stats1, "Driver:", "N/A")
+        self._create_stat_item_right(stats, "Driver:", "N/A", rowspan=2)
 
-        row2 = tk.Frame(stats_container, bg=COLORS['bg_primary'])
-        row2.pack(fill=tk.X)
-
-        self._create_stat_item(row2, "Temperature", "0°C", 'gpu_temp')
+        self._create_stat_item(stats, "Temperature", "0°C", 'gpu_temp', row=2, column=0)
 
         self.panels['gpu'] = panel
 
@@ -613,68 +771,37 @@ class PerformanceView(tk.Frame):
         for panel in self.panels.values():
             panel.pack_forget()
 
-        if panel_name in self.panels:
-            self.panels[panel_name].pack(fill=tk.BOTH, expand=True)
+        if panel_name not in self.panels:
+            self._panel_factories[panel_name]()
+            self.panels[panel_name].bind('<Map>', self._on_map)
+        self.panels[panel_name].pack(fill=tk.BOTH, expand=True)
 
         self.current_panel = panel_name
 
-    def update(self):
-        """Update performance metrics"""
-        # Increment slow update counter (for expensive operations)
-        self._slow_update_counter += 1
-        do_slow_update = (self._slow_update_counter % 5 == 0)  # Every 5 seconds
-
-        # CPU (fast)
-        cpu_pct = psutil.cpu_percent()
-        self.cpu_history.append(cpu_pct)
-
-        self.cpu_graph.add_value(cpu_pct)
-        self.cpu_btn.set_value(cpu_pct)
-        self.cpu_btn.add_data_point(cpu_pct)
-
-        if hasattr(self, 'cpu_usage_label'):
-            self.cpu_usage_label.configure(text=f"{cpu_pct:.2f}%")
-
-        # CPU Speed (fast)
-        try:
-            freq = psutil.cpu_freq()
-            if freq and hasattr(self, 'cpu_speed_label'):
-                self.cpu_speed_label.configure(text=f"{freq.current/1000:.2f}GHz")
-        except:
-            pass
-
-        # Process count (fast) and threads (SLOW - only update every 5 cycles)
-        if do_slow_update:
-            try:
-                self._proc_count = len(psutil.pids())
-                # Thread count is expensive - use cached /proc/stat instead
-                try:
-                    with open('/proc/stat', 'r') as f:
-                        for line in f:
-                            if line.startswith('processes'):
-                                # This isn't thread count, so estimate from process count
-                                break
-                    # Simple estimate: ~2-3 threads per process on average
-                    self._thread_count = self._proc_count * 2
-                except:
-                    self._thread_count = self._proc_count * 2
-            except:
-                pass
-
-        if hasattr(self, 'cpu_procs_label'):
-            self.cpu_procs_label.configure(text=str(self._proc_count))
-        if hasattr(self, 'cpu_threads_label'):
-            self.cpu_threads_label.configure(text=str(self._thread_count))
-
-        # Uptime (fast)
-        uptime_seconds = int(time.time() - psutil.boot_time())
-        hours, remainder = divmod(uptime_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        if hasattr(self, 'cpu_uptime_label'):
-            self.cpu_uptime_label.configure(text=f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-
-        # CPU Temperature (SLOW - only update every 5 cycles)
-        if do_slow_update:
+        # Counts and cards refresh on slower ticks; show the latest ones right away
+        if panel_name == 'cpu':
+            self._update_cpu_counts()
+        elif panel_name == 'disk':
+            self._refresh_disk_cards()
+        elif panel_name == 'network':
+            self._refresh_network_cards()
+
+    def _on_map(self, event=None):
+        """The view or a panel was shown: draw graphs updated while hidden"""
+        self.after_idle(self._redraw_graphs)
+
+    def _redraw_graphs(self):
+        """Redraw dirty graphs (each one skips the work if clean or not viewable)"""
+        for btn in self.buttons.values():
+            btn._update_graph()
+        for name in ('cpu_graph', 'mem_graph', 'gpu_graph'):
+            graph = getattr(self, name, None)
+            if graph is not None:
+                graph._update_graph()
+
+    def _sensor_loop(self):
+        """Poll the CPU temperature every 2 seconds until the view is destroyed"""
+        while not self._stopped.is_set():
             try:
                 temps = psutil.sensors_temperatures()
                 if temps:
@@ -684,48 +811,211 @@ class PerformanceView(tk.Frame):
                             break
             except:
                 pass
+            self._stopped.wait(2)
+
+    def destroy(self):
+        """Stop the background workers and close the persistent /proc descriptors"""
+        self._stopped.set()
+        if self._disk_pool is not None:
+            self._disk_pool.shutdown(wait=False)
+        for fd in self._proc_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._proc_fds = {}
+        super().destroy()
+
+    def _read_proc(self, name):
+        """Re-read a /proc file through its persistent descriptor (bytes or None)"""
+        fd = self._proc_fds.get(name)
+        if fd is None:
+            return None
+        try:
+            # pread from offset 0 avoids a separate lseek per tick
+            # (procfs may return short reads, so read until EOF)
+            data = os.pread(fd, 65536, 0)
+            while True:
+                chunk = os.pread(fd, 65536, len(data))
+                if not chunk:
+                    return data
+                data += chunk
+        except OSError:
+            return None
+
+    def _read_fast_metrics(self):
+        """
+        Read the per-tick metrics straight from /proc.
+
+        Returns:
+            (cpu_pct, mem, uptime_seconds); any item is None if its file
+            couldn't be read
+        """
+        cpu_pct = mem = uptime_seconds = None
+
+        # CPU: aggregate line of /proc/stat, busy/total deltas as psutil does
+        data = self._read_proc('stat')
+        try:
+            times = [int(x) for x in data[:data.index(b'\n')].split()[1:]]
+            total = sum(times) - sum(times[8:10])  # guest time is already in user/nice
+            busy = total - times[3] - times[4]  # minus idle and iowait
+            prev = self._prev_cpu_times
+            self._prev_cpu_times = (busy, total)
+            cpu_pct = 0.0
+            if prev and total > prev[1]:
+                cpu_pct = min(100.0, max(0.0, (busy - prev[0]) / (total - prev[1]) * 100))
+        except (TypeError, ValueError, IndexError):
+            pass
 
-        if hasattr(self, 'cpu_temp_label') and self._cpu_temp > 0:
-            self.cpu_temp_label.configure(text=f"{self._cpu_temp:.0f}°C")
+        # Memory
+        data = self._read_proc('meminfo')
+        try:
+            fields = {}
+            for line in data.splitlines():
+                key, _, value = line.partition(b':')
+                fields[key] = int(value.split()[0]) * 1024
+            total = fields[b'MemTotal']
+            free = fields[b'MemFree']
+            buffers = fields.get(b'Buffers', 0)
+            cached = fields.get(b'Cached', 0) + fields.get(b'SReclaimable', 0)
+            available = fields.get(b'MemAvailable', free + cached + buffers)
+            used = total - available
+            mem = MemInfo(total, available, used, cached, round((total - available) / total * 100, 1))
+        except (TypeError, ValueError, IndexError, KeyError, ZeroDivisionError):
+            pass
 
-        # Memory (fast)
-        mem = psutil.virtual_memory()
-        self.mem_history.append(mem.percent)
+        # Uptime
+        data = self._read_proc('uptime')
+        try:
+            uptime_seconds = int(float(data.split()[0]))
+        except (AttributeError, ValueError, IndexError):
+            pass
 
-        self.mem_graph.add_value(mem.percent)
-        self.mem_btn.set_value(mem.percent)
-        self.mem_btn.add_data_point(mem.percent)
-        self.mem_btn.set_secondary_text(f"{mem.used / (1024**3):.1f} / {mem.total / (1024**3):.1f} GB")
+        return cpu_pct, mem, uptime_seconds
+
+    def _read_net_totals(self):
+        """Total (bytes_sent, bytes_recv) over all interfaces from /proc/net/dev, or None"""
+        data = self._read_proc('net/dev')
+        try:
+            sent = recv = 0
+            for line in data.splitlines()[2:]:  # skip the two header lines
+                cols = line.partition(b':')[2].split()
+                recv += int(cols[0])
+                sent += int(cols[8])
+            return sent, recv
+        except (AttributeError, ValueError, IndexError):
+            return None
+
+    def update(self):
+        """Run the metric groups that are due on this 1-second tick"""
+        self._tick_fast()
+        if self._tick_count % 2 == 0:
+            self._tick_medium()
+        if self._tick_count % 5 == 0:
+            self._tick_slow()
+        self._tick_count += 1
 
-        if hasattr(self, 'mem_used_label') and self.mem_used_label:
-            self.mem_used_label.configure(text=f"{mem.used / (1024**3):.1f} GB")
-        if hasattr(self, 'mem_avail_label') and self.mem_avail_label:
-            self.mem_avail_label.configure(text=f"{mem.available / (1024**3):.1f} GB")
-        if hasattr(self, 'mem_cached_label') and self.mem_cached_label:
-            self.mem_cached_label.configure(text=f"{mem.cached / (1024**3):.1f} GB")
+        # GPU
+        if self.gpu_data:
+            self._update_gpu_display()
 
-        # Disk (moderately slow - only update every 5 cycles)
-        if do_slow_update:
+    def _tick_fast(self):
+        """Every second: CPU and memory graphs plus the visible panel's live labels"""
+        set_text = self._set_text
+        cpu_pct, mem, uptime_seconds = self._read_fast_metrics()
+
+        # CPU
+        if cpu_pct is None:
+            cpu_pct = psutil.cpu_percent()
+        self.cpu_graph.add_value(cpu_pct)
+        self.cpu_btn.set_value(cpu_pct)
+        self.cpu_btn.add_data_point(cpu_pct)
+
+        # CPU panel labels (skipped while another panel is shown)
+        if self.current_panel == 'cpu':
+            set_text('cpu_usage', f"{cpu_pct:.2f}%")
+
+            if uptime_seconds is None:
+                uptime_seconds = int(time.time() - self._boot_time)
+            set_text('cpu_uptime', f"{uptime_seconds // 3600:02d}:{uptime_seconds // 60 % 60:02d}:{uptime_seconds % 60:02d}")
+
+        # Memory
+        if mem is None:
+            mem = psutil.virtual_memory()
+        if 'memory' in self.panels:
+            self.mem_graph.add_value(mem.percent)
+        else:
+            self._graph_backlog['memory'].append(mem.percent)
+        self.mem_btn.set_value(mem.percent)
+        self.mem_btn.add_data_point(mem.percent)
+        # Format each memory figure once
+        used_s = f"{mem.used / GB:.1f}"
+        self.mem_btn.set_secondary_text(f"{used_s} / {mem.total / GB:.1f} GB")
+
+        # Memory panel labels (skipped while another panel is shown)
+        if self.current_panel == 'memory':
+            set_text('mem_used', f"{used_s} GB")
+            set_text('mem_avail', f"{mem.available / GB:.1f} GB")
+            set_text('mem_cached', f"{mem.cached / GB:.1f} GB")
+
+    def _tick_medium(self):
+        """Every 2 seconds: CPU speed, disk and network"""
+        set_text = self._set_text
+        if self.current_panel == 'cpu':
             try:
-                disk = psutil.disk_usage('/')
-                self.disk_btn.set_value(disk.percent)
-                self.disk_btn.set_secondary_text(f"{disk.used / (1024**3):.0f} / {disk.total / (1024**3):.0f} GB")
+                freq = psutil.cpu_freq()
+                if freq:
+                    set_text('cpu_speed', f"{freq.current/1000:.2f}GHz")
             except:
                 pass
 
-        # Network (fast)
+        # Detail cards of the visible panel
+        if self.current_panel == 'disk':
+            self._refresh_disk_cards()
+        elif self.current_panel == 'network':
+            self._refresh_network_cards()
+
+        # Disk (the sidebar button is updated when the statvfs comes back)
+        self._stat_disk('/')
+
+        # Network (psutil only as a fallback)
         try:
-            net = psutil.net_io_counters()
-            sent_mb = net.bytes_sent / (1024**2)
-            recv_mb = net.bytes_recv / (1024**2)
+            net = self._read_net_totals()
+            if net is None:
+                counters = psutil.net_io_counters()
+                net = (counters.bytes_sent, counters.bytes_recv)
+            sent_mb = net[0] / MB
+            recv_mb = net[1] / MB
             self.net_btn.set_value(0, unit="")
             self.net_btn.set_secondary_text(f"S: {sent_mb:.0f} MB  R: {recv_mb:.0f} MB")
         except:
             pass
 
-        # GPU
-        if self.gpu_data:
-            self._update_gpu_display()
+    def _tick_slow(self):
+        """Every 5 seconds: process/thread counts and temperature"""
+        try:
+            # Count numeric /proc entries without building a PID list
+            n = 0
+            with os.scandir('/proc') as it:
+                for entry in it:
+                    if '0' <= entry.name[0] <= '9':
+                        n += 1
+            self._proc_count = n
+            # Thread count is expensive - simple estimate: ~2-3 threads per process on average
+            self._thread_count = self._proc_count * 2
+        except:
+            pass
+
+        if self.current_panel == 'cpu':
+            self._update_cpu_counts()
+
+    def _update_cpu_counts(self):
+        """Write the cached process/thread counts and temperature to the CPU panel"""
+        set_text = self._set_text
+        set_text('cpu_procs', str(self._proc_count))
+        set_text('cpu_threads', str(self._thread_count))
+        if self._cpu_temp > 0:
+            set_text('cpu_temp', f"{self._cpu_temp:.0f}°C")
 
     def update_gpu_data(self, gpu_data):
         """Update GPU data from backend"""
@@ -747,7 +1037,7 @@ class PerformanceView(tk.Frame):
 
         try:
             gpu_index = int(gpu[0])
-            gpu_name = gpu[1]
+            gpu_name = gpu[1].decode('utf-8', 'replace')
             gpu_util = int(gpu[2])
             gpu_mem_used = int(gpu[3])
             gpu_mem_total = int(gpu[4])
@@ -757,20 +1047,28 @@ class PerformanceView(tk.Frame):
         except (ValueError, IndexError):
             return
 
-        self.gpu_history.append(gpu_util)
-        self.gpu_graph.add_value(gpu_util)
+        if 'gpu' in self.panels:
+            self.gpu_graph.add_value(gpu_util)
+        else:
+            self._graph_backlog['gpu'].append(gpu_util)
 
         self.gpu_btn.set_value(gpu_util)
         self.gpu_btn.add_data_point(gpu_util)
-        self.gpu_btn.set_secondary_text(f"{gpu_mem_used} / {gpu_mem_total} MB")
-
-        self.gpu_title_label.configure(text=f"GPU {gpu_index}")
-        self.gpu_model_label.configure(text=gpu_name)
-
-        if hasattr(self, 'gpu_usage_label'):
-            self.gpu_usage_label.configure(text=f"{gpu_util}%")
-        if hasattr(self, 'gpu_vram_label'):
-            mem_pct = (gpu_mem_used / gpu_mem_total * 100) if gpu_mem_total > 0 else 0
-            self.gpu_vram_label.configure(text=f"{gpu_mem_used/1024:.1f}/{gpu_mem_total/1024:.0f} GiB ({mem_pct:.0f}%)")
-        if hasattr(self, 'gpu_temp_label'):
-            self.gpu_temp_label.configure(text=f"{gpu_temp}°C")
+        # The backend reports every 2 s; skip text writes for a frame already shown
+        if gpu != self._gpu_btn_frame:
+            self._gpu_btn_frame = gpu
+            self.gpu_btn.set_secondary_text(f"{gpu_mem_used} / {gpu_mem_total} MB")
+
+        # Panel labels only matter while the GPU panel is shown
+        if self.current_panel != 'gpu' or gpu == self._gpu_labels_frame:
+            return
+        self._gpu_labels_frame = gpu
+
+        set_text = self._set_text
+        set_text('gpu_title', f"GPU {gpu_index}")
+        set_text('gpu_model', gpu_name)
+
+        set_text('gpu_usage', f"{gpu_util}%")
+        mem_pct = (gpu_mem_used / gpu_mem_total * 100) if gpu_mem_total > 0 else 0
+        set_text('gpu_vram', f"{gpu_mem_used/1024:.1f}/{gpu_mem_total/1024:.0f} GiB ({mem_pct:.0f}%)")
+        set_text('gpu_temp', f"{gpu_temp}°C")
@@ -4,16 +4,26 @@ Inspired by the reference task manager design
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, Menu
 import psutil
 import os
 import signal
 import subprocess
-import time
 import re
-import threading
-from ..themes import COLORS, Theme
-from ..utils import IconLoader
+import sys
+from functools import lru_cache
+from ..themes import (
+    COLORS, Theme, ACCENT, BG_PRIMARY, BG_SECONDARY, BG_TERTIARY, SURFACE, SURFACE_HOVER,
+    TEXT_PRIMARY, TEXT_SECONDARY, TEXT_TERTIARY, SELECTION,
+)
+from ..utils import get_icon_loader
+
+try:
+    from Xlib import X, display as xdisplay
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
 
 
 # Process classification patterns
@@ -32,7 +42,7 @@ APP_PATTERNS = [
     'obs', 'kdenlive', 'handbrake', 'shotcut',
 ]
 
-BLACKLIST = {
+BLACKLIST = frozenset({
     'systemd', 'dbus-daemon', 'systemd-resolved', 'systemd-timesyncd',
     'systemd-logind', 'systemd-journald', 'systemd-udevd',
     'xorg', 'xwayland', 'kwin_x11', 'kwin_wayland',
@@ -45,38 +55,51 @@ BLACKLIST = {
     'xdg-desktop-portal', 'xdg-desktop-portal-gtk', 'xdg-desktop-portal-kde',
     'polkit-kde-authentication-agent-1', 'polkitd',
     'chrome_crashpad_handler', 'crashpad_handler',
-}
+})
 
-PARENT_BLACKLIST = {
+PARENT_BLACKLIST = frozenset({
     'bash', 'zsh', 'sh', 'fish', 'dash', 'ksh',
     'bwrap', 'snap-confine', 'firejail',
     'python', 'python3', 'python2', 'perl', 'ruby', 'node',
     'systemd', 'init',
-}
-
-
-def get_usage_color(value, max_val=100):
-    """Get background color based on usage value (yellow/orange gradient)"""
-    if value <= 0:
-        return COLORS['surface']
-
-    # Normalize value
-    ratio = min(1.0, value / max_val)
-
-    if ratio < 0.1:
-        return COLORS['surface']
-    elif ratio < 0.3:
-        # Light yellow
-        return '#4a4a2a'
-    elif ratio < 0.5:
-        # Yellow
-        return '#6b6b2a'
-    elif ratio < 0.7:
-        # Orange-yellow
-        return '#8b7b2a'
-    else:
-        # Orange
-        return '#ab8b2a'
+})
+
+# Names that are never shown as apps, as one set for a single lookup
+_NON_APP_NAMES = BLACKLIST | PARENT_BLACKLIST
+
+# Substring matchers compiled once: one regex scan per name instead of a
+# Python-level `in` test per pattern
+_APP_RE = re.compile('|'.join(map(re.escape, APP_PATTERNS)))
+_HELPER_RE = re.compile('crashpad|helper|zygote')  # also covers nacl_helper
+
+# xprop output parsing (window-PID fallback)
+_HEX_ID_RE = re.compile(r'0x[0-9a-fA-F]+')
+_WM_PID_RE = re.compile(r'=\s*(\d+)')
+
+
+# Usage colors by tenth of the "high" value (yellow/orange gradient):
+# <10% surface, <30% light yellow, <50% yellow, <70% orange-yellow, else orange
+_USAGE_COLORS = (
+    SURFACE,
+    '#4a4a2a', '#4a4a2a',
+    '#6b6b2a', '#6b6b2a',
+    '#8b7b2a', '#8b7b2a',
+    '#ab8b2a', '#ab8b2a', '#ab8b2a', '#ab8b2a',
+)
+
+
+def _cpu_color(cpu):
+    """Usage color for a CPU percentage (10% is high for a single process)"""
+    if cpu <= 0:
+        return _USAGE_COLORS[0]
+    return _USAGE_COLORS[int(cpu) if cpu < 10 else 10]
+
+
+def _mem_color(mem_mb):
+    """Usage color for a memory size in MiB (4 GiB is high)"""
+    if mem_mb <= 0:
+        return _USAGE_COLORS[0]
+    return _USAGE_COLORS[int(mem_mb * (10 / 4096)) if mem_mb < 4096 else 10]
 
 
 # Cached fonts for performance (avoid repeated Theme.get_font calls)
@@ -85,23 +108,84 @@ _FONT_BODY = None
 _FONT_TINY = None
 _FONT_BODY_BOLD = None
 
+# The fonts above are named Tk fonts, so items and widgets reference them by
+# name instead of Tk parsing a font spec each time; their Font objects (for
+# measuring) and metrics measured once: name -> (linespace, width of '0')
+_FONT_OBJECTS = {}
+_FONT_METRICS = {}
+
 
 def _init_fonts():
     """Initialize cached fonts (call once after tk root exists)"""
     global _FONT_SMALL, _FONT_BODY, _FONT_TINY, _FONT_BODY_BOLD
     if _FONT_SMALL is None:
-        _FONT_SMALL = Theme.get_font(Theme.FONT_SIZE_SMALL)
-        _FONT_BODY = Theme.get_font(Theme.FONT_SIZE_BODY)
-        _FONT_TINY = Theme.get_font(Theme.FONT_SIZE_TINY)
-        _FONT_BODY_BOLD = Theme.get_font(Theme.FONT_SIZE_BODY, bold=True)
+        _FONT_SMALL = _named_font('TMProcSmall', Theme.get_font(Theme.FONT_SIZE_SMALL))
+        _FONT_BODY = _named_font('TMProcBody', Theme.get_font(Theme.FONT_SIZE_BODY))
+        _FONT_TINY = _named_font('TMProcTiny', Theme.get_font(Theme.FONT_SIZE_TINY))
+        _FONT_BODY_BOLD = _named_font('TMProcBodyBold', Theme.get_font(Theme.FONT_SIZE_BODY, bold=True))
+
+
+def _named_font(name, spec):
+    """Create (or reconfigure) the named Tk font for a font tuple and return its name"""
+    family, size, weight = spec
+    font = tkfont.Font(name=name, exists=name in tkfont.names(),
+                       family=family, size=size, weight=weight)
+    _FONT_OBJECTS[name] = font
+    _FONT_METRICS[name] = (font.metrics('linespace'), font.measure('0'))
+    return name
+
+
+def _font_object(font):
+    """Shared tkfont.Font for a named row font (for measuring)"""
+    return _FONT_OBJECTS[font]
+
+
+def _set_item(batch, canvas, item, option, value):
+    """Set one option of a canvas item: queued as a Tcl command on batch, or applied now.
+
+    Row texts are numbers, units and arrows, so brace-quoting them is safe.
+    """
+    if batch is None:
+        canvas.itemconfigure(item, {option: value})
+    else:
+        batch.append(f"{canvas} itemconfigure {item} -{option} {{{value}}}")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_mem(hundredths):
+    """Format a memory size given in hundredths of a MiB"""
+    mem_mb = hundredths / 100
+    if mem_mb >= 1024:
+        return f"{mem_mb/1024:.2f}GiB"
+    return f"{mem_mb:.2f}MiB"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_cpu(hundredths):
+    """Format a CPU percentage given in hundredths of a percent"""
+    return f"{hundredths / 100:.2f}%"
 
 
-class SubProcessRow(tk.Frame):
-    """Individual process row shown when parent is expanded"""
+def _mem_text(mem_mb):
+    """Format a memory size in MiB for a row cell (cached per 0.01 MiB)"""
+    return _fmt_mem(round(mem_mb * 100))
+
+
+def _cpu_text(cpu):
+    """Format a CPU percentage for a row cell (cached per 0.01%)"""
+    return _fmt_cpu(round(cpu * 100))
+
+
+class SubProcessRow(tk.Canvas):
+    """Individual process row shown when parent is expanded (the row is one canvas)"""
 
     def __init__(self, parent, pid, name, cpu, mem, on_select=None, on_context=None, **kwargs):
-        super().__init__(parent, bg=COLORS['bg_primary'], cursor='hand2', **kwargs)
         _init_fonts()
+        linespace, self._zero = _FONT_METRICS[_FONT_SMALL]
+        super().__init__(
+            parent, height=linespace + 18, bg=BG_TERTIARY,
+            highlightthickness=0, bd=0, cursor='hand2', **kwargs
+        )
 
         self.pid = pid
         self.pids = [pid]  # For compatibility with kill functions
@@ -113,86 +197,73 @@ class SubProcessRow(tk.Frame):
         self.on_context = on_context
         self.is_app = False  # Sub-processes shown as individual
 
-        # Cache previous values to skip unnecessary updates
-        self._prev_cpu = None
-        self._prev_mem = None
+        # Last displayed (cpu, mem), rounded, to skip unnecessary updates
+        self._prev_key = None
 
-        # Inner frame with indentation
-        self.inner = tk.Frame(self, bg=COLORS['bg_tertiary'], cursor='hand2')
-        self.inner.pack(fill=tk.X, padx=(24, 0), pady=(0, 1))
+        # Drawn directly on the row canvas (no wrapping frame); the parent
+        # packs it indented
+        self._bg = BG_TERTIARY
 
-        self._create_widgets()
+        self._create_items()
         self._bind_events()
 
-    def _create_widgets(self):
-        """Create row widgets"""
-        # Small indent indicator
-        tk.Label(
-            self.inner, text="└",
-            font=_FONT_SMALL,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_tertiary'],
-            width=2
-        ).pack(side=tk.LEFT, padx=(4, 0), pady=8)
-
-        # PID as name for sub-process
-        self.name_label = tk.Label(
-            self.inner, text=f"PID {self.pid}",
-            font=_FONT_SMALL,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_secondary'],
-            anchor='w'
-        )
-        self.name_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 8), pady=8)
-
-        # PID
-        self.pid_label = tk.Label(
-            self.inner, text=str(self.pid),
-            font=_FONT_SMALL,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_tertiary'],
-            width=8, anchor='e'
-        )
-        self.pid_label.pack(side=tk.RIGHT, padx=(8, 16), pady=8)
-
-        # Memory
-        mem_mb = self.mem
-        if mem_mb >= 1024:
-            mem_text = f"{mem_mb/1024:.2f}GiB"
-        else:
-            mem_text = f"{mem_mb:.2f}MiB"
-        mem_color = get_usage_color(mem_mb, 4096)
-        self.mem_label = tk.Label(
-            self.inner, text=mem_text,
-            font=_FONT_SMALL,
-            bg=mem_color, fg=COLORS['text_primary'],
-            width=10, anchor='e', padx=6, pady=8
-        )
-        self.mem_label.pack(side=tk.RIGHT, padx=(0, 8))
-
-        # CPU
-        cpu_color = get_usage_color(self.cpu, 10)
-        self.cpu_label = tk.Label(
-            self.inner, text=f"{self.cpu:.2f}%",
-            font=_FONT_SMALL,
-            bg=cpu_color, fg=COLORS['text_primary'],
-            width=8, anchor='e', padx=6, pady=8
-        )
-        self.cpu_label.pack(side=tk.RIGHT, padx=(0, 8))
+    def _create_items(self):
+        """Create the row's canvas items (positions are set in _layout)"""
+        fg = TEXT_PRIMARY
+
+        # Small indent indicator and "PID n" as the name
+        self._indent_item = self.create_text(0, 0, text="└", font=_FONT_SMALL,
+                                             fill=TEXT_TERTIARY, anchor='center')
+        self._name_item = self.create_text(0, 0, text=f"PID {self.pid}", font=_FONT_SMALL,
+                                           fill=TEXT_SECONDARY, anchor='w')
+
+        # Right-hand cells; the mask hides name overflow behind them
+        self._mask = self.create_rectangle(0, 0, 0, 0, fill=BG_TERTIARY, width=0)
+        self._cpu_rect = self.create_rectangle(0, 0, 0, 0, fill=_cpu_color(self.cpu), width=0)
+        self._mem_rect = self.create_rectangle(0, 0, 0, 0, fill=_mem_color(self.mem), width=0)
+        self._cpu_item = self.create_text(0, 0, text=_cpu_text(self.cpu), font=_FONT_SMALL,
+                                          fill=fg, anchor='e')
+        self._mem_item = self.create_text(0, 0, text=_mem_text(self.mem), font=_FONT_SMALL,
+                                          fill=fg, anchor='e')
+        self._pid_item = self.create_text(0, 0, text=str(self.pid), font=_FONT_SMALL,
+                                          fill=TEXT_TERTIARY, anchor='e')
+
+    def _layout(self, event):
+        """Place the right-aligned cells for the current canvas size"""
+        w, h = event.width, event.height
+        mid = h / 2
+        z = self._zero
+
+        # Left: indent indicator (2 chars wide) and name
+        self.coords(self._indent_item, 4 + z + 2, mid)
+        self.coords(self._name_item, 4 + 2 * z + 4 + 6, mid)
+
+        # Right: same widths as the column headers (PID 8 chars, RAM 10, CPU 8)
+        right = w - 16
+        self.coords(self._pid_item, right - 2, mid)
+        right -= 8 * z + 4 + 8
+        self.coords(self._mem_rect, right - 10 * z - 14, 0, right, h)
+        self.coords(self._mem_item, right - 7, mid)
+        right -= 10 * z + 14 + 8
+        self.coords(self._cpu_rect, right - 8 * z - 14, 0, right, h)
+        self.coords(self._cpu_item, right - 7, mid)
+        self.coords(self._mask, right - 8 * z - 22, 0, w, h)
 
     def _bind_events(self):
         """Bind mouse events"""
-        widgets = [self, self.inner, self.name_label, self.cpu_label, self.mem_label, self.pid_label]
-        for w in widgets:
-            w.bind('<Enter>', self._on_enter)
-            w.bind('<Leave>', self._on_leave)
-            w.bind('<Button-1>', self._on_click)
-            w.bind('<Button-3>', self._on_right_click)
+        self.bind('<Configure>', self._layout)
+        self.bind('<Enter>', self._on_enter)
+        self.bind('<Leave>', self._on_leave)
+        self.bind('<Button-1>', self._on_click)
+        self.bind('<Button-3>', self._on_right_click)
 
     def _on_enter(self, event):
         if not self.selected:
-            self._set_bg(COLORS['surface_hover'])
+            self._set_bg(SURFACE_HOVER)
 
     def _on_leave(self, event):
         if not self.selected:
-            self._set_bg(COLORS['bg_tertiary'])
+            self._set_bg(BG_TERTIARY)
 
     def _on_click(self, event):
         if self.on_select:
@@ -205,56 +276,57 @@ class SubProcessRow(tk.Frame):
             self.on_context(event, self)
 
     def _set_bg(self, color):
-        self.inner.configure(bg=color)
-        self.name_label.configure(bg=color)
-        self.pid_label.configure(bg=color)
+        """Set background color for non-usage cells (one Tcl script, skipped if unchanged)"""
+        if color != self._bg:
+            self._bg = color
+            self.tk.eval(f"{self} configure -bg {color}\n{self} itemconfigure {self._mask} -fill {color}")
 
     def set_selected(self, selected):
         self.selected = selected
         if selected:
-            self._set_bg(COLORS['selection'])
+            self._set_bg(SELECTION)
         else:
-            self._set_bg(COLORS['bg_tertiary'])
+            self._set_bg(BG_TERTIARY)
 
-    def update_data(self, cpu, mem):
-        """Update process data (skip if unchanged)"""
+    def update_data(self, cpu, mem, batch=None):
+        """Update process data (skip if unchanged); Tk commands go to batch if given"""
         # Round to avoid unnecessary updates from tiny changes
         cpu_rounded = round(cpu, 1)
         mem_rounded = round(mem, 1)
 
         # Skip update if values haven't changed significantly
-        if cpu_rounded == self._prev_cpu and mem_rounded == self._prev_mem:
+        key = (cpu_rounded, mem_rounded)
+        if key == self._prev_key:
             return
 
-        self._prev_cpu = cpu_rounded
-        self._prev_mem = mem_rounded
+        self._prev_key = key
         self.cpu = cpu
         self.mem = mem
 
-        cpu_color = get_usage_color(cpu, 10)
-        self.cpu_label.configure(text=f"{cpu:.2f}%", bg=cpu_color)
-
-        if mem >= 1024:
-            mem_text = f"{mem/1024:.2f}GiB"
-        else:
-            mem_text = f"{mem:.2f}MiB"
-        mem_color = get_usage_color(mem, 4096)
-        self.mem_label.configure(text=mem_text, bg=mem_color)
+        _set_item(batch, self, self._cpu_item, 'text', _cpu_text(cpu))
+        _set_item(batch, self, self._cpu_rect, 'fill', _cpu_color(cpu))
+        _set_item(batch, self, self._mem_item, 'text', _mem_text(mem))
+        _set_item(batch, self, self._mem_rect, 'fill', _mem_color(mem))
 
 
 class ProcessRow(tk.Frame):
-    """Process row with colored usage cells - expandable if multiple PIDs"""
+    """Process row with colored usage cells - expandable if multiple PIDs.
+
+    The row content is drawn on a single canvas (text, cell rectangles and
+    icon as canvas items) rather than a frame of labels.
+    """
 
     # Row height to show ~10 processes in view
     ROW_HEIGHT = 48
 
     def __init__(self, parent, name, pids, cpu, mem, state, is_app=False,
                  on_select=None, on_context=None, process_details=None, icon=None, **kwargs):
-        super().__init__(parent, bg=COLORS['bg_primary'], cursor='hand2', **kwargs)
+        super().__init__(parent, bg=BG_PRIMARY, cursor='hand2', **kwargs)
         _init_fonts()
 
         self.name = name
         self.pids = pids
+        self.pid_count = len(pids)
         self.cpu = cpu
         self.mem = mem
         self.state = state
@@ -263,149 +335,150 @@ class ProcessRow(tk.Frame):
         self.on_select = on_select
         self.on_context = on_context
         self.expanded = False
-        self.process_details = process_details or {}  # {pid: {'cpu': x, 'mem': y}}
+        self.process_details = process_details or {}  # {pid: (cpu, mem)}
         self.sub_rows = {}
         self.icon = icon  # PhotoImage for app icon
 
-        # Cache previous values to skip unnecessary updates
-        self._prev_cpu = None
-        self._prev_mem = None
-        self._prev_pids_count = None
-
-        # Inner frame for actual content with padding
-        self.inner = tk.Frame(self, bg=COLORS['surface'], cursor='hand2')
-        self.inner.pack(fill=tk.X, pady=(0, 2))  # Small gap between rows
+        # Last displayed (cpu, mem, pid count), rounded, to skip unnecessary updates
+        self._prev_key = (None, None, self.pid_count)
+
+        # PID list text for the properties dialog and the pids it was built from
+        self._pids_text = ""
+        self._pids_text_for = None
+
+        # Position in the section container (kept from <Configure>, so the view
+        # can cull off-screen rows without querying Tk) and deferred update
+        self.y = None
+        self.height = 0
+        self._pending = None
+
+        # Row canvas (small gap between rows)
+        linespace, self._zero = _FONT_METRICS[_FONT_BODY]
+        self._arrow_w = 2 * _FONT_METRICS[_FONT_SMALL][1] + 4
+        self._bg = SURFACE
+        self.canvas = tk.Canvas(
+            self, height=linespace + 26, bg=SURFACE,
+            highlightthickness=0, bd=0, cursor='hand2'
+        )
+        self.canvas.pack(fill=tk.X, pady=(0, 2))
 
         # Container for sub-process rows (initially hidden)
-        self.sub_container = tk.Frame(self, bg=COLORS['bg_primary'])
+        self.sub_container = tk.Frame(self, bg=BG_PRIMARY)
 
-        self._create_widgets()
+        self._create_items()
         self._bind_events()
 
-    def _create_widgets(self):
-        """Create row widgets"""
-        # Expand arrow (for processes with children)
-        arrow = "▶" if len(self.pids) > 1 else " "
-        self.arrow_label = tk.Label(
-            self.inner, text=arrow,
-            font=_FONT_SMALL,
-            bg=COLORS['surface'], fg=COLORS['text_tertiary'],
-            width=2
-        )
-        self.arrow_label.pack(side=tk.LEFT, padx=(8, 0), pady=12)
+    def _create_items(self):
+        """Create the row's canvas items (positions are set in _layout)"""
+        c = self.canvas
+        fg = TEXT_PRIMARY
+        count = self.pid_count
+        first_pid = self.pids[0] if count else None
 
-        # Process count badge (shows number of processes if > 1)
-        count_text = f"({len(self.pids)})" if len(self.pids) > 1 else ""
-        self.count_label = tk.Label(
-            self.inner, text=count_text,
-            font=_FONT_TINY,
-            bg=COLORS['surface'], fg=COLORS['text_tertiary']
-        )
-        self.count_label.pack(side=tk.LEFT, padx=(0, 4), pady=12)
+        # Expand arrow and process count badge (only for groups)
+        self._arrow_item = c.create_text(0, 0, text="▶" if count > 1 else " ", font=_FONT_SMALL,
+                                         fill=TEXT_TERTIARY, anchor='center')
+        self._count_item = c.create_text(0, 0, text=f"({count})" if count > 1 else "", font=_FONT_TINY,
+                                         fill=TEXT_TERTIARY, anchor='w')
 
         # Icon for apps
-        self.icon_label = None
+        self._icon_item = None
         if self.icon and self.is_app:
-            self.icon_label = tk.Label(
-                self.inner, image=self.icon,
-                bg=COLORS['surface']
-            )
-            self.icon_label.pack(side=tk.LEFT, padx=(0, 6), pady=8)
-
-        # Name - expands to fill available space
-        self.name_label = tk.Label(
-            self.inner, text=self.name,
-            font=_FONT_BODY,
-            bg=COLORS['surface'], fg=COLORS['text_primary'],
-            anchor='w'
-        )
-        self.name_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8), pady=12)
-
-        # PID (on the right)
-        pid_text = str(self.pids[0]) if len(self.pids) == 1 else f"{len(self.pids)} PIDs"
-        self.pid_label = tk.Label(
-            self.inner, text=pid_text,
-            font=_FONT_BODY,
-            bg=COLORS['surface'], fg=COLORS['text_secondary'],
-            width=8, anchor='e'
-        )
-        self.pid_label.pack(side=tk.RIGHT, padx=(8, 16), pady=12)
-
-        # Memory cell with colored background (pack from right)
-        mem_mb = self.mem
-        if mem_mb >= 1024:
-            mem_text = f"{mem_mb/1024:.2f}GiB"
+            self._icon_item = c.create_image(0, 0, image=self.icon, anchor='w')
+
+        self._name_item = c.create_text(0, 0, text=self.name, font=_FONT_BODY, fill=fg, anchor='w')
+
+        # Right-hand cells; the mask hides name overflow behind them
+        self._mask = c.create_rectangle(0, 0, 0, 0, fill=SURFACE, width=0)
+        self._cpu_rect = c.create_rectangle(0, 0, 0, 0, fill=_cpu_color(self.cpu), width=0)
+        self._mem_rect = c.create_rectangle(0, 0, 0, 0, fill=_mem_color(self.mem), width=0)
+        self._cpu_item = c.create_text(0, 0, text=_cpu_text(self.cpu), font=_FONT_BODY,
+                                       fill=fg, anchor='e')
+        self._mem_item = c.create_text(0, 0, text=_mem_text(self.mem), font=_FONT_BODY,
+                                       fill=fg, anchor='e')
+        pid_text = str(first_pid) if count == 1 else f"{count} PIDs"
+        self._pid_item = c.create_text(0, 0, text=pid_text, font=_FONT_BODY,
+                                       fill=TEXT_SECONDARY, anchor='e')
+
+    def set_icon(self, icon):
+        """Add the app icon to a row built without one"""
+        if icon is None or self._icon_item is not None or not self.is_app:
+            return
+        self.icon = icon
+        self._icon_item = self.canvas.create_image(0, 0, image=icon, anchor='w')
+        self._layout()
+
+    def _layout(self, event=None):
+        """Place the row items for the current canvas size"""
+        c = self.canvas
+        if event is not None:
+            w, h = event.width, event.height
         else:
-            mem_text = f"{mem_mb:.2f}MiB"
-        mem_color = get_usage_color(mem_mb, 4096)  # 4GB is high
-        self.mem_label = tk.Label(
-            self.inner, text=mem_text,
-            font=_FONT_BODY,
-            bg=mem_color, fg=COLORS['text_primary'],
-            width=10, anchor='e', padx=8, pady=12
-        )
-        self.mem_label.pack(side=tk.RIGHT, padx=(0, 8))
-
-        # CPU cell with colored background (pack from right)
-        cpu_color = get_usage_color(self.cpu, 10)  # 10% is high for single process
-        self.cpu_label = tk.Label(
-            self.inner, text=f"{self.cpu:.2f}%",
-            font=_FONT_BODY,
-            bg=cpu_color, fg=COLORS['text_primary'],
-            width=8, anchor='e', padx=8, pady=12
-        )
-        self.cpu_label.pack(side=tk.RIGHT, padx=(0, 8))
+            w, h = c.winfo_width(), c.winfo_height()
+        mid = h / 2
+        z = self._zero
+
+        # Left: arrow, count badge, icon, name
+        x = 8
+        c.coords(self._arrow_item, x + self._arrow_w / 2, mid)
+        x += self._arrow_w
+        c.coords(self._count_item, x + 2, mid)
+        x += _font_object(_FONT_TINY).measure(c.itemcget(self._count_item, 'text')) + 8
+        if self._icon_item:
+            c.coords(self._icon_item, x + 2, mid)
+            x += self.icon.width() + 10
+        c.coords(self._name_item, x + 2, mid)
+
+        # Right: same widths as the column headers (PID 8 chars, RAM 10, CPU 8)
+        right = w - 16
+        c.coords(self._pid_item, right - 2, mid)
+        right -= 8 * z + 4 + 8
+        c.coords(self._mem_rect, right - 10 * z - 18, 0, right, h)
+        c.coords(self._mem_item, right - 9, mid)
+        right -= 10 * z + 18 + 8
+        c.coords(self._cpu_rect, right - 8 * z - 18, 0, right, h)
+        c.coords(self._cpu_item, right - 9, mid)
+        c.coords(self._mask, right - 8 * z - 26, 0, w, h)
 
     def _bind_events(self):
         """Bind mouse events"""
-        # Arrow is clickable for expand/collapse
-        self.arrow_label.bind('<Button-1>', self._on_arrow_click)
-        self.arrow_label.configure(cursor='hand2')
-
-        # Other widgets for selection
-        widgets = [self.inner, self.name_label, self.count_label,
-                   self.cpu_label, self.mem_label, self.pid_label]
-        if self.icon_label:
-            widgets.append(self.icon_label)
-        for w in widgets:
-            w.bind('<Enter>', self._on_enter)
-            w.bind('<Leave>', self._on_leave)
-            w.bind('<Button-1>', self._on_click)
-            w.bind('<Button-3>', self._on_right_click)
-
-        # Also bind to self but not arrow for hover
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
+        c = self.canvas
+        c.bind('<Configure>', self._layout)
+        c.bind('<Enter>', self._on_enter)
+        c.bind('<Leave>', self._on_leave)
+        c.bind('<Button-1>', self._on_click)
+        c.bind('<Button-3>', self._on_right_click)
 
-    def _on_arrow_click(self, event):
-        """Handle arrow click for expand/collapse"""
-        if len(self.pids) > 1:
-            self._toggle_expand()
-        return "break"  # Prevent event propagation
+        # Track where the row (including expanded sub-rows) sits in its section
+        self.bind('<Configure>', self._on_configure)
+
+    def _on_configure(self, event):
+        """Remember where the row sits in its container"""
+        self.y = event.y
+        self.height = event.height
 
     def _toggle_expand(self):
         """Toggle expanded state"""
         self.expanded = not self.expanded
         if self.expanded:
-            self.arrow_label.configure(text="▼")
+            self.canvas.itemconfigure(self._arrow_item, text="▼")
             self._show_sub_processes()
         else:
-            self.arrow_label.configure(text="▶")
+            self.canvas.itemconfigure(self._arrow_item, text="▶")
             self._hide_sub_processes()
 
     def _show_sub_processes(self):
         """Show individual process rows"""
-        self.sub_container.pack(fill=tk.X, after=self.inner)
+        self.sub_container.pack(fill=tk.X, after=self.canvas)
 
         for pid in self.pids:
             if pid not in self.sub_rows:
-                details = self.process_details.get(pid, {'cpu': 0, 'mem': 0})
+                cpu, mem = self.process_details.get(pid, (0, 0))
                 sub_row = SubProcessRow(
-                    self.sub_container, pid, self.name,
-                    details.get('cpu', 0), details.get('mem', 0),
+                    self.sub_container, pid, self.name, cpu, mem,
                     on_select=self.on_select, on_context=self.on_context
                 )
-                sub_row.pack(fill=tk.X)
+                sub_row.pack(fill=tk.X, padx=(24, 0), pady=(0, 1))
                 self.sub_rows[pid] = sub_row
 
     def _hide_sub_processes(self):
@@ -414,13 +487,17 @@ class ProcessRow(tk.Frame):
 
     def _on_enter(self, event):
         if not self.selected:
-            self._set_bg(COLORS['surface_hover'])
+            self._set_bg(SURFACE_HOVER)
 
     def _on_leave(self, event):
         if not self.selected:
-            self._set_bg(COLORS['surface'])
+            self._set_bg(SURFACE)
 
     def _on_click(self, event):
+        # The arrow column toggles expansion for groups
+        if event.x < 8 + self._arrow_w and self.pid_count > 1:
+            self._toggle_expand()
+            return
         if self.on_select:
             self.on_select(self)
 
@@ -431,64 +508,88 @@ class ProcessRow(tk.Frame):
             self.on_context(event, self)
 
     def _set_bg(self, color):
-        """Set background color for non-usage cells"""
-        self.inner.configure(bg=color)
-        self.arrow_label.configure(bg=color)
-        self.count_label.configure(bg=color)
-        self.name_label.configure(bg=color)
-        self.pid_label.configure(bg=color)
-        if self.icon_label:
-            self.icon_label.configure(bg=color)
+        """Set background color for non-usage cells (one Tcl script, skipped if unchanged)"""
+        if color != self._bg:
+            self._bg = color
+            c = self.canvas
+            self.tk.eval(f"{c} configure -bg {color}\n{c} itemconfigure {self._mask} -fill {color}")
 
     def set_selected(self, selected):
         self.selected = selected
         if selected:
-            self._set_bg(COLORS['selection'])
+            self._set_bg(SELECTION)
         else:
-            self._set_bg(COLORS['surface'])
+            self._set_bg(SURFACE)
+
+    @property
+    def pids_text(self):
+        """First PIDs as display text, rebuilt only when the pid list changes"""
+        pids = self.pids
+        if pids is not self._pids_text_for:
+            self._pids_text_for = pids
+            self._pids_text = ", ".join(map(str, pids[:5])) + ("..." if len(pids) > 5 else "")
+        return self._pids_text
+
+    def defer_update(self, cpu, mem, state, pids, process_details=None):
+        """Record new data for an off-screen row; widgets catch up in flush_pending"""
+        self.cpu = cpu
+        self.mem = mem
+        self.state = state
+        self.pids = pids
+        self.pid_count = len(pids)
+        if process_details:
+            self.process_details = process_details
+        self._pending = (cpu, mem, state, pids, process_details)
 
-    def update_data(self, cpu, mem, state, pids, process_details=None):
-        """Update process data (skip unchanged values)"""
+    def flush_pending(self, batch=None):
+        """Apply a deferred update, if any"""
+        if self._pending:
+            pending, self._pending = self._pending, None
+            self.update_data(*pending, batch=batch)
+
+    def update_data(self, cpu, mem, state, pids, process_details=None, batch=None):
+        """Update process data (skip unchanged values); Tk commands go to batch if given"""
+        self._pending = None
         # Round to avoid unnecessary updates from tiny changes
         cpu_rounded = round(cpu, 1)
         mem_rounded = round(mem, 1)
-        pids_count = len(pids)
+        pids_count = self.pid_count = len(pids)
 
         self.state = state
         self.pids = pids
         if process_details:
             self.process_details = process_details
 
-        # Only update CPU if changed
-        if cpu_rounded != self._prev_cpu:
-            self._prev_cpu = cpu_rounded
-            self.cpu = cpu
-            cpu_color = get_usage_color(cpu, 10)
-            self.cpu_label.configure(text=f"{cpu:.2f}%", bg=cpu_color)
-
-        # Only update Memory if changed
-        if mem_rounded != self._prev_mem:
-            self._prev_mem = mem_rounded
-            self.mem = mem
-            if mem >= 1024:
-                mem_text = f"{mem/1024:.2f}GiB"
-            else:
-                mem_text = f"{mem:.2f}MiB"
-            mem_color = get_usage_color(mem, 4096)
-            self.mem_label.configure(text=mem_text, bg=mem_color)
-
-        # Only update PID count if changed
-        if pids_count != self._prev_pids_count:
-            self._prev_pids_count = pids_count
-            if pids_count > 1:
-                arrow = "▼" if self.expanded else "▶"
-                self.count_label.configure(text=f"({pids_count})")
-                self.pid_label.configure(text=f"{pids_count} PIDs")
-            else:
-                arrow = " "
-                self.count_label.configure(text="")
-                self.pid_label.configure(text=str(pids[0]))
-            self.arrow_label.configure(text=arrow)
+        # One comparison covers the common case of nothing visible changing
+        key = (cpu_rounded, mem_rounded, pids_count)
+        prev_cpu, prev_mem, prev_count = self._prev_key
+        if key != self._prev_key:
+            self._prev_key = key
+            c = self.canvas
+
+            if cpu_rounded != prev_cpu:
+                self.cpu = cpu
+                _set_item(batch, c, self._cpu_item, 'text', _cpu_text(cpu))
+                _set_item(batch, c, self._cpu_rect, 'fill', _cpu_color(cpu))
+
+            if mem_rounded != prev_mem:
+                self.mem = mem
+                _set_item(batch, c, self._mem_item, 'text', _mem_text(mem))
+                _set_item(batch, c, self._mem_rect, 'fill', _mem_color(mem))
+
+            if pids_count != prev_count:
+                # The badge width moves the name, so these are applied now and relaid out
+                if pids_count > 1:
+                    c.itemconfigure(self._count_item, text=f"({pids_count})")
+                    _set_item(batch, c, self._pid_item, 'text', f"{pids_count} PIDs")
+                else:
+                    c.itemconfigure(self._count_item, text="")
+                    _set_item(batch, c, self._pid_item, 'text', str(pids[0]))
+                # The arrow only changes when the row becomes / stops being a group
+                if (pids_count > 1) != (prev_count > 1):
+                    _set_item(batch, c, self._arrow_item, 'text',
+                              ("▼" if self.expanded else "▶") if pids_count > 1 else " ")
+                self._layout()
 
         # Update sub-rows if expanded
         if self.expanded and process_details:
@@ -500,16 +601,15 @@ class ProcessRow(tk.Frame):
 
             # Add/update sub-rows
             for pid in pids:
-                details = process_details.get(pid, {'cpu': 0, 'mem': 0})
+                cpu, mem = process_details.get(pid, (0, 0))
                 if pid in self.sub_rows:
-                    self.sub_rows[pid].update_data(details.get('cpu', 0), details.get('mem', 0))
+                    self.sub_rows[pid].update_data(cpu, mem, batch)
                 else:
                     sub_row = SubProcessRow(
-                        self.sub_container, pid, self.name,
-                        details.get('cpu', 0), details.get('mem', 0),
+                        self.sub_container, pid, self.name, cpu, mem,
                         on_select=self.on_select, on_context=self.on_context
                     )
-                    sub_row.pack(fill=tk.X)
+                    sub_row.pack(fill=tk.X, padx=(24, 0), pady=(0, 1))
                     self.sub_rows[pid] = sub_row
 
 
@@ -518,14 +618,14 @@ class SectionHeader(tk.Frame):
 
     def __init__(self, parent, title, count=0, expanded=True, on_toggle=None,
                  bg_color=None, **kwargs):
-        super().__init__(parent, bg=bg_color or COLORS['accent'], **kwargs)
+        super().__init__(parent, bg=bg_color or ACCENT, **kwargs)
         _init_fonts()
 
         self.title = title
         self.count = count
         self.expanded = expanded
         self.on_toggle = on_toggle
-        self.bg_color = bg_color or COLORS['accent']
+        self.bg_color = bg_color or ACCENT
 
         self._create_widgets()
 
@@ -537,7 +637,7 @@ class SectionHeader(tk.Frame):
         self.title_label = tk.Label(
             self, text=self.title,
             font=_FONT_BODY_BOLD,
-            bg=self.bg_color, fg=COLORS['text_primary']
+            bg=self.bg_color, fg=TEXT_PRIMARY
         )
         self.title_label.pack(side=tk.LEFT, padx=16, pady=12)
 
@@ -559,21 +659,30 @@ class ProcessesView(tk.Frame):
     """Clean process list view"""
 
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, bg=COLORS['bg_primary'], **kwargs)
+        super().__init__(parent, bg=BG_PRIMARY, **kwargs)
 
         self.process_data = []
         self.process_groups = {}
         self.window_pids = set()
+        self._xdisplay = None  # python-xlib connection, opened on first window-PID query
         self.classification_cache = {}
         self.selected_row = None
+        self._ctx_menu = None  # right-click menu, built on first use
+        self._ctx_row = None  # row the context menu was opened for
+        self._details_dialog = None  # properties dialog, withdrawn instead of destroyed
+        self._details_title = None
+        self._details_rows = []  # (name label, value label) pairs, grown as needed
         self.rows = {}
+        self._row_sigs = {}  # key -> (cpu, mem) rounded, as last sent to the row
+        self._rows_without_icon = {}  # app row key -> name_lower, built before icons were ready
+        self._section_y = {}  # section container -> y in scroll_frame
+        self._flush_id = None
         self.apps_expanded = True
         self.bg_expanded = True
-        self._cache_cleanup_counter = 0
-        self._window_pid_thread_running = False  # Prevent thread accumulation
+        self._names = {}  # raw backend name -> (interned name, interned lowercase name)
 
         # Icon loader for app icons
-        self.icon_loader = IconLoader(size=20)
+        self.icon_loader = get_icon_loader(size=20)
 
         self._create_ui()
 
@@ -582,18 +691,18 @@ class ProcessesView(tk.Frame):
         _init_fonts()
 
         # Column headers with right padding to match content
-        header_frame = tk.Frame(self, bg=COLORS['bg_tertiary'])
+        header_frame = tk.Frame(self, bg=BG_TERTIARY)
         header_frame.pack(fill=tk.X, padx=(0, Theme.PADDING_MEDIUM))
 
         # Spacer for arrow
         tk.Label(header_frame, text="", width=2,
-                bg=COLORS['bg_tertiary']).pack(side=tk.LEFT, padx=(8, 0))
+                bg=BG_TERTIARY).pack(side=tk.LEFT, padx=(8, 0))
 
         # Name header - expands to fill space
         tk.Label(
             header_frame, text="Name",
             font=_FONT_BODY_BOLD,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_secondary'],
+            bg=BG_TERTIARY, fg=TEXT_SECONDARY,
             anchor='w'
         ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 8), pady=12)
 
@@ -601,7 +710,7 @@ class ProcessesView(tk.Frame):
         tk.Label(
             header_frame, text="PID", width=8,
             font=_FONT_BODY_BOLD,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_secondary'],
+            bg=BG_TERTIARY, fg=TEXT_SECONDARY,
             anchor='e'
         ).pack(side=tk.RIGHT, padx=(8, 16), pady=12)
 
@@ -609,7 +718,7 @@ class ProcessesView(tk.Frame):
         tk.Label(
             header_frame, text="RAM", width=10,
             font=_FONT_BODY_BOLD,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_secondary'],
+            bg=BG_TERTIARY, fg=TEXT_SECONDARY,
             anchor='e', padx=8
         ).pack(side=tk.RIGHT, padx=(0, 8), pady=12)
 
@@ -617,25 +726,27 @@ class ProcessesView(tk.Frame):
         tk.Label(
             header_frame, text="CPU", width=8,
             font=_FONT_BODY_BOLD,
-            bg=COLORS['bg_tertiary'], fg=COLORS['text_secondary'],
+            bg=BG_TERTIARY, fg=TEXT_SECONDARY,
             anchor='e', padx=8
         ).pack(side=tk.RIGHT, padx=(0, 8), pady=12)
 
         # Scrollable content area with right padding
-        container = tk.Frame(self, bg=COLORS['bg_primary'])
+        container = tk.Frame(self, bg=BG_PRIMARY)
         container.pack(fill=tk.BOTH, expand=True, padx=(0, Theme.PADDING_MEDIUM))
 
         # Canvas for scrolling
-        self.canvas = tk.Canvas(container, bg=COLORS['bg_primary'], highlightthickness=0)
+        self.canvas = tk.Canvas(container, bg=BG_PRIMARY, highlightthickness=0)
         scrollbar = ttk.Scrollbar(container, orient=tk.VERTICAL, command=self.canvas.yview)
 
-        self.scroll_frame = tk.Frame(self.canvas, bg=COLORS['bg_primary'])
+        self.scroll_frame = tk.Frame(self.canvas, bg=BG_PRIMARY)
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor='nw')
 
         self.scroll_frame.bind('<Configure>', lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
         self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.canvas_window, width=e.width))
 
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = scrollbar
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.bind('<Map>', self._schedule_flush)  # tab switched back to this view
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
@@ -651,8 +762,9 @@ class ProcessesView(tk.Frame):
         )
         self.apps_header.pack(fill=tk.X)
 
-        self.apps_container = tk.Frame(self.scroll_frame, bg=COLORS['bg_primary'])
+        self.apps_container = tk.Frame(self.scroll_frame, bg=BG_PRIMARY)
         self.apps_container.pack(fill=tk.X)
+        self.apps_container.bind('<Configure>', lambda e: self._section_y.__setitem__(self.apps_container, e.y))
 
         # Background processes section (same color as Apps)
         self.bg_header = SectionHeader(
@@ -662,18 +774,19 @@ class ProcessesView(tk.Frame):
         )
         self.bg_header.pack(fill=tk.X)
 
-        self.bg_container = tk.Frame(self.scroll_frame, bg=COLORS['bg_primary'])
+        self.bg_container = tk.Frame(self.scroll_frame, bg=BG_PRIMARY)
         self.bg_container.pack(fill=tk.X)
+        self.bg_container.bind('<Configure>', lambda e: self._section_y.__setitem__(self.bg_container, e.y))
 
         # Bottom toolbar with End task button
-        bottom_bar = tk.Frame(self, bg=COLORS['bg_secondary'])
+        bottom_bar = tk.Frame(self, bg=BG_SECONDARY)
         bottom_bar.pack(fill=tk.X, side=tk.BOTTOM)
 
         # Process count
         self.count_label = tk.Label(
             bottom_bar, text="0 processes",
             font=_FONT_BODY,
-            bg=COLORS['bg_secondary'], fg=COLORS['text_secondary']
+            bg=BG_SECONDARY, fg=TEXT_SECONDARY
         )
         self.count_label.pack(side=tk.LEFT, padx=16, pady=12)
 
@@ -681,13 +794,56 @@ class ProcessesView(tk.Frame):
         self.end_btn = tk.Button(
             bottom_bar, text="End task",
             font=_FONT_BODY_BOLD,
-            bg=COLORS['danger'], fg=COLORS['text_primary'],
-            activebackground=COLORS['danger_hover'], activeforeground=COLORS['text_primary'],
+            bg=COLORS['danger'], fg=TEXT_PRIMARY,
+            activebackground=COLORS['danger_hover'], activeforeground=TEXT_PRIMARY,
             relief=tk.FLAT, padx=24, pady=8, cursor='hand2',
             state=tk.DISABLED, command=self._kill_selected
         )
         self.end_btn.pack(side=tk.RIGHT, padx=16, pady=8)
 
+    def _on_yscroll(self, first, last):
+        """Scrollbar update; rows that scrolled into view catch up on deferred data"""
+        self._scrollbar.set(first, last)
+        self._schedule_flush()
+
+    def _schedule_flush(self, event=None):
+        """Flush deferred row updates once Tk is idle (coalesces bursts of scroll events)"""
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush_visible_rows)
+
+    def _visible_range(self):
+        """Visible y-range of scroll_frame (with one row of margin), or None if hidden"""
+        if not self.canvas.winfo_ismapped():
+            return None
+        top, bottom = self.canvas.yview()
+        height = self.scroll_frame.winfo_height()
+        return top * height - ProcessRow.ROW_HEIGHT, bottom * height + ProcessRow.ROW_HEIGHT
+
+    def _row_visible(self, row, view):
+        """Whether row overlaps the visible range (rows not laid out yet count as visible)"""
+        if row.y is None:
+            return True
+        if view is None:
+            return False
+        container = row.master
+        if not (self.apps_expanded if container is self.apps_container else self.bg_expanded):
+            return False
+        y = self._section_y.get(container, 0) + row.y
+        return y + row.height > view[0] and y < view[1]
+
+    def _flush_visible_rows(self):
+        """Apply deferred updates of rows that are now on screen"""
+        self._flush_id = None
+        view = self._visible_range()
+        if view is None:
+            return
+        batch = []
+        for row in self.rows.values():
+            if row._pending and self._row_visible(row, view):
+                row.flush_pending(batch)
+        if batch:
+            self.tk.eval('\n'.join(batch))
+
     def _toggle_section(self, section, expanded):
         """Toggle section visibility"""
         if section == 'apps':
@@ -702,71 +858,95 @@ class ProcessesView(tk.Frame):
                 self.bg_container.pack(fill=tk.X, after=self.bg_header)
             else:
                 self.bg_container.pack_forget()
+        if expanded:
+            self._schedule_flush()
+
+    def collect_window_pids(self):
+        """Return the set of PIDs that have windows (blocking, safe off the Tk thread)"""
+        # Ask the X server directly when python-xlib is installed (no subprocesses)
+        if HAS_XLIB:
+            pids = self._window_pids_xlib()
+            if pids is not None:
+                return pids
+
+        pids = set()
+        try:
+            # Use wmctrl if available (faster than xprop); parsed as bytes, since
+            # only the PID column is needed and window titles need no decoding
+            result = subprocess.run(
+                ['wmctrl', '-lp'],
+                capture_output=True, timeout=2
+            )
+            if result.returncode == 0:
+                for line in result.stdout.splitlines():
+                    # "<window id> <desktop> <pid> <host> <title>"
+                    parts = line.split(None, 3)
+                    if len(parts) >= 3:
+                        try:
+                            pid = int(parts[2])
+                            if pid > 0:
+                                pids.add(pid)
+                        except ValueError:
+                            continue
+                return pids
+        except FileNotFoundError:
+            pass  # wmctrl not installed, fall back to xprop
+        except:
+            pass
 
-    def update_window_pids(self):
-        """Update the set of PIDs that have windows (runs in background)"""
-        # Prevent spawning multiple threads if previous one is still running
-        if self._window_pid_thread_running:
-            return
+        # Fallback to xprop (slower)
+        try:
+            result = subprocess.run(
+                ['xprop', '-root', '_NET_CLIENT_LIST'],
+                capture_output=True, text=True, timeout=2
+            )
+            if result.returncode == 0:
+                window_ids = _HEX_ID_RE.findall(result.stdout)
+                # Limit to first 50 windows to avoid slowdown
+                for wid in window_ids[:50]:
+                    try:
+                        pid_result = subprocess.run(
+                            ['xprop', '-id', wid, '_NET_WM_PID'],
+                            capture_output=True, text=True, timeout=0.2
+                        )
+                        if '_NET_WM_PID' in pid_result.stdout:
+                            match = _WM_PID_RE.search(pid_result.stdout)
+                            if match:
+                                pids.add(int(match.group(1)))
+                    except:
+                        continue
+        except:
+            pass
+        return pids
+
+    def _window_pids_xlib(self):
+        """Read _NET_WM_PID of every managed window over one X connection (None on failure)"""
+        try:
+            if self._xdisplay is None:
+                d = xdisplay.Display()
+                self._xdisplay = (d, d.intern_atom('_NET_CLIENT_LIST'), d.intern_atom('_NET_WM_PID'))
+            d, client_list, wm_pid = self._xdisplay
+            prop = d.screen().root.get_full_property(client_list, X.AnyPropertyType)
+        except:
+            self._xdisplay = None
+            return None
 
-        def _fetch_pids():
+        pids = set()
+        for wid in (prop.value if prop else ()):
             try:
-                pids = set()
-                try:
-                    # Use wmctrl if available (faster than xprop)
-                    result = subprocess.run(
-                        ['wmctrl', '-lp'],
-                        capture_output=True, text=True, timeout=2
-                    )
-                    if result.returncode == 0:
-                        for line in result.stdout.strip().split('\n'):
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                try:
-                                    pid = int(parts[2])
-                                    if pid > 0:
-                                        pids.add(pid)
-                                except ValueError:
-                                    continue
-                        self.window_pids = pids
-                        return
-                except FileNotFoundError:
-                    pass  # wmctrl not installed, fall back to xprop
-                except:
-                    pass
-
-                # Fallback to xprop (slower)
-                try:
-                    result = subprocess.run(
-                        ['xprop', '-root', '_NET_CLIENT_LIST'],
-                        capture_output=True, text=True, timeout=2
-                    )
-                    if result.returncode == 0:
-                        window_ids = re.findall(r'0x[0-9a-fA-F]+', result.stdout)
-                        # Limit to first 50 windows to avoid slowdown
-                        for wid in window_ids[:50]:
-                            try:
-                                pid_result = subprocess.run(
-                                    ['xprop', '-id', wid, '_NET_WM_PID'],
-                                    capture_output=True, text=True, timeout=0.2
-                                )
-                                if '_NET_WM_PID' in pid_result.stdout:
-                                    match = re.search(r'=\s*(\d+)', pid_result.stdout)
-                                    if match:
-                                        pids.add(int(match.group(1)))
-                            except:
-                                continue
-                except:
-                    pass
-                self.window_pids = pids
-            finally:
-                self._window_pid_thread_running = False
-
-        # Run in background thread to avoid blocking UI
-        self._window_pid_thread_running = True
-        threading.Thread(target=_fetch_pids, daemon=True).start()
-
-    def _classify_process(self, pid, name):
+                # Windows can vanish between the two queries (BadWindow)
+                pid_prop = d.create_resource_object('window', wid).get_full_property(wm_pid, X.AnyPropertyType)
+                if pid_prop and len(pid_prop.value) and pid_prop.value[0] > 0:
+                    pids.add(int(pid_prop.value[0]))
+            except:
+                continue
+        return pids
+
+    def apply_window_pids(self, pids):
+        """Apply a window PID set from collect_window_pids (Tk thread)"""
+        self.window_pids = pids
+
+    def _classify_process(self, pid, name, name_lower):
         """Classify process as app or background"""
         # Check cache first (fast path)
         if pid in self.classification_cache:
@@ -777,15 +957,13 @@ class ProcessesView(tk.Frame):
                 return True
             return cached
 
-        name_lower = name.lower()
-
         # Quick blacklist check (no system calls needed) - case insensitive
-        if name_lower in BLACKLIST or name_lower in PARENT_BLACKLIST:
+        if name_lower in _NON_APP_NAMES:
             self.classification_cache[pid] = False
             return False
 
         # Also check for partial matches (e.g., crashpad in chrome_crashpad_handler)
-        if any(bl in name_lower for bl in ['crashpad', 'helper', 'zygote', 'nacl_helper']):
+        if _HELPER_RE.search(name_lower):
             self.classification_cache[pid] = False
             return False
 
@@ -795,20 +973,11 @@ class ProcessesView(tk.Frame):
             return True
 
         # Check app patterns (no system calls)
-        if any(pat in name_lower for pat in APP_PATTERNS):
+        if _APP_RE.search(name_lower):
             self.classification_cache[pid] = True
             return True
 
-        # Only do expensive uid check if nothing else matched
-        try:
-            proc = psutil.Process(pid)
-            if proc.uids().real != os.getuid():
-                self.classification_cache[pid] = False
-                return False
-        except:
-            self.classification_cache[pid] = False
-            return False
-
+        # Nothing matched: background process
         self.classification_cache[pid] = False
         return False
 
@@ -816,36 +985,46 @@ class ProcessesView(tk.Frame):
         """Update process data from backend"""
         self.process_data = data
 
-        # Periodic cache cleanup (every 30 updates)
-        self._cache_cleanup_counter += 1
-        if self._cache_cleanup_counter >= 30:
-            self._cache_cleanup_counter = 0
-            current_pids = {int(d[0]) for d in data}
-            # Remove stale entries
-            self.classification_cache = {
-                pid: val for pid, val in self.classification_cache.items()
-                if pid in current_pids
-            }
+        if len(self._names) > 4096:
+            self._names.clear()
 
         apps = {}
         background = {}
 
+        # Fields arrive as raw bytes from the backend; only the name is displayed
         for pid, name, state, cpu, mem, threads in data:
+            # Decode, lowercase and intern each distinct name once
+            names = self._names.get(name)
+            if names is None:
+                decoded = sys.intern(name.decode('utf-8', 'replace'))
+                names = self._names[name] = (decoded, sys.intern(decoded.lower()))
+            name, name_lower = names
             int_pid = int(pid)
             cpu_val = float(cpu)
             mem_mb = int(mem) / 1024
 
-            is_app = self._classify_process(int_pid, name)
+            is_app = self._classify_process(int_pid, name, name_lower)
             target = apps if is_app else background
 
-            if name not in target:
-                target[name] = {'pids': [], 'cpu': 0.0, 'mem': 0.0, 'state': state, 'details': {}}
-
-            target[name]['pids'].append(int_pid)
-            target[name]['cpu'] += cpu_val
-            target[name]['mem'] += mem_mb
-            # Store individual process details for expansion
-            target[name]['details'][int_pid] = {'cpu': cpu_val, 'mem': mem_mb}
+            group = target.get(name)
+            if group is None:
+                group = target[name] = {'pids': [], 'cpu': 0.0, 'mem': 0.0, 'state': state, 'details': {},
+                                        'name_lower': name_lower}
+
+            group['pids'].append(int_pid)
+            group['cpu'] += cpu_val
+            group['mem'] += mem_mb
+            # Store individual process details for expansion (a tuple, not a dict per process)
+            group['details'][int_pid] = (cpu_val, mem_mb)
+
+        # Every PID of this frame is now cached, so a larger cache holds PIDs that
+        # have exited; drop them so a reused PID is classified afresh
+        cache = self.classification_cache
+        if len(cache) > len(data):
+            self.classification_cache = {
+                pid: cache[pid]
+                for groups in (apps, background) for group in groups.values() for pid in group['pids']
+            }
 
         self._update_rows(apps, background)
         self.count_label.configure(text=f"{len(data)} processes")
@@ -853,54 +1032,80 @@ class ProcessesView(tk.Frame):
 
     def _update_rows(self, apps, background):
         """Update process rows"""
-        current_keys = set()
-
-        for name in apps:
-            current_keys.add(('app', name))
-        for name in background:
-            current_keys.add(('bg', name))
-
-        existing_keys = set(self.rows.keys())
-        to_add = current_keys - existing_keys
-        to_remove = existing_keys - current_keys
-        to_update = current_keys & existing_keys
-
-        # Remove dead processes
-        for key in to_remove:
-            self.rows[key].destroy()
-            del self.rows[key]
-
-        # Update existing
-        for key in to_update:
-            section, name = key
-            info = apps[name] if section == 'app' else background[name]
-            self.rows[key].update_data(
-                info['cpu'], info['mem'], info['state'], info['pids'],
-                process_details=info.get('details', {})
-            )
+        rows = self.rows
+        row_sigs = self._row_sigs
+        groups = {'app': apps, 'bg': background}
+
+        # App rows built before the icon indexes finished loading get their icons now
+        if self._rows_without_icon and self.icon_loader.is_ready():
+            for key, name_lower in self._rows_without_icon.items():
+                row = rows.get(key)
+                if row is not None:
+                    row.set_icon(self.icon_loader.get_icon(key[1], name_lower=name_lower))
+            self._rows_without_icon.clear()
+
+        # Remove dead processes (diffed against the new groups directly,
+        # without building key sets for both sides every refresh)
+        for key in [key for key in rows if key[1] not in groups[key[0]]]:
+            rows.pop(key).destroy()
+            row_sigs.pop(key, None)
+
+        # Update existing; their label changes run as one Tcl script instead
+        # of a Tk call per changed cell. Off-screen rows (or all rows while the
+        # view is hidden) only record the data until they scroll into view.
+        batch = []
+        view = self._visible_range()
+        to_add = []
+        for section, group in groups.items():
+            for name, info in group.items():
+                key = (section, name)
+                row = rows.get(key)
+                if row is None:
+                    to_add.append((section, name, info))
+                    continue
+
+                # Collapsed groups whose rounded values and PIDs are unchanged
+                # have nothing to redraw: skip the row update entirely
+                sig = (round(info['cpu'], 1), round(info['mem'], 1))
+                if sig == row_sigs.get(key) and not row.expanded and info['pids'] == row.pids:
+                    row.state = info['state']
+                    row.process_details = info['details']
+                    continue
+                row_sigs[key] = sig
+
+                if self._row_visible(row, view):
+                    row.update_data(
+                        info['cpu'], info['mem'], info['state'], info['pids'],
+                        process_details=info['details'], batch=batch
+                    )
+                else:
+                    row.defer_update(info['cpu'], info['mem'], info['state'], info['pids'],
+                                     process_details=info['details'])
+        if batch:
+            self.tk.eval('\n'.join(batch))
 
         # Add new
-        for key in to_add:
-            section, name = key
+        for section, name, info in to_add:
             if section == 'app':
-                info = apps[name]
                 # Get icon for app
-                icon = self.icon_loader.get_icon(name)
+                icon = self.icon_loader.get_icon(name, name_lower=info['name_lower'])
                 row = ProcessRow(
                     self.apps_container, name, info['pids'],
                     info['cpu'], info['mem'], info['state'], is_app=True,
                     on_select=self._on_row_select, on_context=self._show_context_menu,
-                    process_details=info.get('details', {}), icon=icon
+                    process_details=info['details'], icon=icon
                 )
+                if icon is None and not self.icon_loader.is_ready():
+                    self._rows_without_icon[(section, name)] = info['name_lower']
             else:
-                info = background[name]
                 row = ProcessRow(
                     self.bg_container, name, info['pids'],
                     info['cpu'], info['mem'], info['state'], is_app=False,
                     on_select=self._on_row_select, on_context=self._show_context_menu,
-                    process_details=info.get('details', {})
+                    process_details=info['details']
                 )
-            self.rows[key] = row
+            rows[(section, name)] = row
+            row_sigs[(section, name)] = (round(info['cpu'], 1), round(info['mem'], 1))
             row.pack(fill=tk.X)
 
         self.apps_header.set_count(len(apps))
@@ -917,52 +1122,66 @@ class ProcessesView(tk.Frame):
 
     def _show_context_menu(self, event, row):
         """Show right-click context menu"""
-        menu = Menu(self, tearoff=0)
-        menu.configure(bg=COLORS['surface'], fg=COLORS['text_primary'],
-                      activebackground=COLORS['selection'], activeforeground=COLORS['text_primary'])
+        # Built once; each popup only relabels the first entry
+        menu = self._ctx_menu
+        if menu is None:
+            menu = self._ctx_menu = Menu(self, tearoff=0)
+            menu.configure(bg=SURFACE, fg=TEXT_PRIMARY,
+                          activebackground=SELECTION, activeforeground=TEXT_PRIMARY)
+            menu.add_command(label="End Task", command=self._kill_selected)
+            menu.add_command(label="Force Kill (SIGKILL)", command=self._force_kill_selected)
+            menu.add_separator()
+            menu.add_command(label="Properties", command=lambda: self._show_details(self._ctx_row))
+        self._ctx_row = row
 
         # Different label for single process vs group
         if isinstance(row, SubProcessRow):
-            menu.add_command(label=f"End Process (PID {row.pid})", command=self._kill_selected)
-            menu.add_command(label="Force Kill (SIGKILL)", command=self._force_kill_selected)
+            label = f"End Process (PID {row.pid})"
+        elif len(row.pids) > 1:
+            label = f"End All ({len(row.pids)} processes)"
         else:
-            if len(row.pids) > 1:
-                menu.add_command(label=f"End All ({len(row.pids)} processes)", command=self._kill_selected)
-            else:
-                menu.add_command(label="End Task", command=self._kill_selected)
-            menu.add_command(label="Force Kill (SIGKILL)", command=self._force_kill_selected)
-
-        menu.add_separator()
-        menu.add_command(label="Properties", command=lambda: self._show_details(row))
+            label = "End Task"
+        menu.entryconfigure(0, label=label)
 
         try:
             menu.tk_popup(event.x_root, event.y_root)
         finally:
             menu.grab_release()
 
-    def _show_details(self, row):
-        """Show process details dialog"""
-        dialog = tk.Toplevel(self)
+    def _get_details_dialog(self):
+        """Properties dialog, created on first use; closing it only withdraws it"""
+        dialog = self._details_dialog
+        if dialog is not None and dialog.winfo_exists():
+            return dialog
 
-        # Handle both ProcessRow and SubProcessRow
-        is_sub = isinstance(row, SubProcessRow)
-        title = f"PID {row.pid}" if is_sub else row.name
-        dialog.title(f"Properties - {title}")
+        dialog = self._details_dialog = tk.Toplevel(self)
         dialog.geometry("420x320")
-        dialog.configure(bg=COLORS['bg_secondary'])
+        dialog.configure(bg=BG_SECONDARY)
         dialog.transient(self)
+        dialog.protocol('WM_DELETE_WINDOW', dialog.withdraw)
 
-        content = tk.Frame(dialog, bg=COLORS['bg_secondary'])
+        content = tk.Frame(dialog, bg=BG_SECONDARY)
         content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        content.columnconfigure(1, weight=1)
 
-        # Cache header font for dialog
-        header_font = Theme.get_font(Theme.FONT_SIZE_HEADER, bold=True)
+        self._details_title = tk.Label(
+            content,
+            font=Theme.get_font(Theme.FONT_SIZE_HEADER, bold=True),
+            bg=BG_SECONDARY, fg=TEXT_PRIMARY
+        )
+        self._details_title.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 16))
+        self._details_rows = []
+        return dialog
 
-        tk.Label(
-            content, text=title,
-            font=header_font,
-            bg=COLORS['bg_secondary'], fg=COLORS['text_primary']
-        ).pack(anchor='w', pady=(0, 16))
+    def _show_details(self, row):
+        """Show process details dialog"""
+        dialog = self._get_details_dialog()
+
+        # Handle both ProcessRow and SubProcessRow
+        is_sub = isinstance(row, SubProcessRow)
+        title = f"PID {row.pid}" if is_sub else row.name
+        dialog.title(f"Properties - {title}")
+        self._details_title.configure(text=title)
 
         if is_sub:
             details = [
@@ -974,8 +1193,8 @@ class ProcessesView(tk.Frame):
         else:
             details = [
                 ("Type", "Application" if row.is_app else "Background process"),
-                ("PIDs", ", ".join(str(p) for p in row.pids[:5]) + ("..." if len(row.pids) > 5 else "")),
-                ("Process Count", str(len(row.pids))),
+                ("PIDs", row.pids_text),
+                ("Process Count", str(row.pid_count)),
                 ("Total CPU", f"{row.cpu:.2f}%"),
                 ("Total Memory", f"{row.mem:.2f} MiB" if row.mem < 1024 else f"{row.mem/1024:.2f} GiB"),
             ]
@@ -983,29 +1202,41 @@ class ProcessesView(tk.Frame):
         try:
             pid = row.pid if is_sub else row.pids[0]
             proc = psutil.Process(pid)
-            details.append(("User", proc.username()))
-            details.append(("Threads", str(proc.num_threads())))
-            details.append(("Status", proc.status()))
-            if not is_sub:
-                details.append(("Executable", proc.exe()[:50] + "..." if len(proc.exe()) > 50 else proc.exe()))
+            # One read of the /proc files these share instead of one per query
+            with proc.oneshot():
+                details.append(("User", proc.username()))
+                details.append(("Threads", str(proc.num_threads())))
+                details.append(("Status", proc.status()))
+                if not is_sub:
+                    exe = proc.exe()
+                    details.append(("Executable", exe[:50] + "..." if len(exe) > 50 else exe))
         except:
             pass
 
-        for label, value in details:
-            row_frame = tk.Frame(content, bg=COLORS['bg_secondary'])
-            row_frame.pack(fill=tk.X, pady=4)
-
-            tk.Label(
-                row_frame, text=f"{label}:", width=14, anchor='w',
-                font=_FONT_BODY,
-                bg=COLORS['bg_secondary'], fg=COLORS['text_secondary']
-            ).pack(side=tk.LEFT)
+        # Reuse the label pairs from earlier opens; create only missing ones
+        rows = self._details_rows
+        content = self._details_title.master
+        while len(rows) < len(details):
+            rows.append((
+                tk.Label(content, width=14, anchor='w', font=_FONT_BODY,
+                         bg=BG_SECONDARY, fg=TEXT_SECONDARY),
+                tk.Label(content, anchor='w', font=_FONT_BODY,
+                         bg=BG_SECONDARY, fg=TEXT_PRIMARY),
+            ))
+
+        for i, (name_label, value_label) in enumerate(rows):
+            if i < len(details):
+                label, value = details[i]
+                name_label.configure(text=f"{label}:")
+                value_label.configure(text=value)
+                name_label.grid(row=i + 1, column=0, sticky='w', pady=4)
+                value_label.grid(row=i + 1, column=1, sticky='ew', pady=4)
+            else:
+                name_label.grid_remove()
+                value_label.grid_remove()
 
-            tk.Label(
-                row_frame, text=value, anchor='w',
-                font=_FONT_BODY,
-                bg=COLORS['bg_secondary'], fg=COLORS['text_primary']
-            ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        dialog.deiconify()
+        dialog.lift()
 
     def _kill_selected(self):
         """Kill selected process"""
@@ -1020,26 +1251,35 @@ class ProcessesView(tk.Frame):
             msg = f"End process PID {row.pid}?"
         else:
             msg = f"End '{row.name}'?"
-            if len(pids) > 1:
-                msg += f"\n\n{len(pids)} processes will be terminated."
+            count = len(pids)
+            if count > 1:
+                msg += f"\n\n{count} processes will be terminated."
 
         if not messagebox.askyesno("End task", msg):
             return
 
-        killed = 0
+        procs = []
         for pid in pids:
             try:
-                os.kill(pid, signal.SIGTERM)
-                killed += 1
+                procs.append(psutil.Process(pid))
             except:
                 pass
 
-        time.sleep(0.3)
+        # Signal through the Process handles (they also guard against PID reuse)
+        killed = 0
+        for proc in procs:
+            try:
+                proc.terminate()
+                killed += 1
+            except:
+                pass
 
-        for pid in pids:
+        # Give them up to 0.3s to exit (returns as soon as all have), then
+        # SIGKILL whatever is still running
+        _, alive = psutil.wait_procs(procs, timeout=0.3)
+        for proc in alive:
             try:
-                if psutil.Process(pid).is_running():
-                    os.kill(pid, signal.SIGKILL)
+                proc.kill()
             except:
                 pass
 
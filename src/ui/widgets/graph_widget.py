@@ -5,7 +5,16 @@ Uses canvas item reuse instead of delete/recreate for better performance
 
 import tkinter as tk
 from collections import deque
-from ..themes import COLORS, Theme
+from ..themes import (
+    COLORS, Theme, BG_PRIMARY, BG_TERTIARY, TEXT_PRIMARY, TEXT_TERTIARY,
+)
+
+# Palette entries without a theme-level constant, looked up once
+_GRAPH_LINE = COLORS['graph_line']
+_GRAPH_FILL = COLORS['graph_fill']
+_GRAPH_GRID = COLORS['graph_grid']
+_GRAPH_FILL_SECONDARY = COLORS['graph_fill_secondary']
+_GRAPH_LINE_SECONDARY = COLORS['graph_line_secondary']
 
 
 class GraphWidget(tk.Canvas):
@@ -19,7 +28,7 @@ class GraphWidget(tk.Canvas):
             parent,
             width=width,
             height=height,
-            bg=COLORS['bg_primary'],
+            bg=BG_PRIMARY,
             highlightthickness=0,
             **kwargs
         )
@@ -33,8 +42,8 @@ class GraphWidget(tk.Canvas):
         self.show_labels = True
 
         # Custom colors
-        self.line_color = line_color or COLORS['graph_line']
-        self.fill_color = fill_color or COLORS['graph_fill']
+        self.line_color = line_color or _GRAPH_LINE
+        self.fill_color = fill_color or _GRAPH_FILL
 
         self.label_y = "%"
         self.label_x = ""
@@ -54,8 +63,15 @@ class GraphWidget(tk.Canvas):
         self._data_line_secondary = None
         self._value_text = None
         self._label_items = []
+        self._item_state = {}  # item -> last 'state' set, to skip redundant flips
+        self._last_value_text = None
         self._initialized = False
         self._dirty = True
+        self._static_dirty = True  # background, grid and labels need re-layout
+        self._redraw_id = None  # pending coalesced redraw from add_value
+        self._last_value = None  # newest primary value and how many times in a row it came
+        self._repeat_count = 0
+        self._min_redraw_interval_ms = 33
 
         # Cache fonts (avoid repeated font tuple creation)
         self._font_small_bold = Theme.get_font(Theme.FONT_SIZE_SMALL, bold=True)
@@ -65,31 +81,64 @@ class GraphWidget(tk.Canvas):
         self._last_width = 0
         self._last_height = 0
 
+        # X coordinate of each history slot, for the (left, width) they were computed for
+        self._xs = []
+        self._xs_geometry = None
+
         self.bind('<Configure>', self._on_resize)
+        # Updates while hidden only record data; draw once when shown again (the
+        # owning view also triggers this, since hiding it doesn't unmap the canvas)
+        self.bind('<Map>', lambda e: self._update_graph())
 
     def set_max_value(self, value):
         """Set maximum Y-axis value"""
         self.max_value = max(1, value)
         self._dirty = True
+        self._static_dirty = True
 
     def set_labels(self, y_label="", x_label=""):
         """Set axis labels"""
         self.label_y = y_label
         self.label_x = x_label
         self._dirty = True
+        self._static_dirty = True
 
     def add_value(self, value, secondary=None):
         """Add a new data point"""
+        if value == self._last_value:
+            self._repeat_count += 1
+        else:
+            self._last_value = value
+            self._repeat_count = 1
+
         self.data_primary.append(value)
         if secondary is not None:
             self.data_secondary.append(secondary)
+        elif self._repeat_count > self.data_primary.maxlen and not self._dirty:
+            # The drawn history was already all this value: the frame is identical
+            return
         self._dirty = True
+        # Coalesce values added in quick succession into one redraw
+        if self._redraw_id is None:
+            self._redraw_id = self.after(self._min_redraw_interval_ms, self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run the redraw scheduled by add_value"""
+        self._redraw_id = None
         self._update_graph()
 
+    def destroy(self):
+        if self._redraw_id is not None:
+            self.after_cancel(self._redraw_id)
+            self._redraw_id = None
+        super().destroy()
+
     def clear(self):
         """Clear all data"""
         self.data_primary.clear()
         self.data_secondary.clear()
+        self._last_value = None
+        self._repeat_count = 0
         self._dirty = True
         self._update_graph()
 
@@ -107,26 +156,28 @@ class GraphWidget(tk.Canvas):
     def _init_canvas_items(self, left, top, right, bottom):
         """Initialize all canvas items once"""
         self.delete('all')
+        self._item_state = {}
+        self._last_value_text = None
 
         # Background rectangle
         self._bg_rect = self.create_rectangle(
             left, top, right, bottom,
-            fill=COLORS['bg_tertiary'],
+            fill=BG_TERTIARY,
             outline=''
         )
 
         # Grid lines (4 horizontal + 3 vertical = 7 lines)
         self._grid_lines = []
         for _ in range(7):
-            line_id = self.create_line(0, 0, 0, 0, fill=COLORS['graph_grid'], dash=(2, 4))
+            line_id = self.create_line(0, 0, 0, 0, fill=_GRAPH_GRID, dash=(2, 4))
             self._grid_lines.append(line_id)
 
         # Secondary data (behind primary)
         self._fill_polygon_secondary = self.create_polygon(
-            0, 0, fill=COLORS['graph_fill_secondary'], outline='', state='hidden'
+            0, 0, fill=_GRAPH_FILL_SECONDARY, outline='', state='hidden'
         )
         self._data_line_secondary = self.create_line(
-            0, 0, 0, 0, fill=COLORS['graph_line_secondary'],
+            0, 0, 0, 0, fill=_GRAPH_LINE_SECONDARY,
             width=Theme.GRAPH_LINE_WIDTH, smooth=True, state='hidden'
         )
 
@@ -145,7 +196,7 @@ class GraphWidget(tk.Canvas):
             text="",
             anchor='ne',
             font=self._font_small_bold,
-            fill=COLORS['text_primary']
+            fill=TEXT_PRIMARY
         )
 
         # Labels (if enabled)
@@ -154,19 +205,19 @@ class GraphWidget(tk.Canvas):
             # Y-axis labels (top, middle, bottom)
             for _ in range(3):
                 label_id = self.create_text(0, 0, text="", anchor='e',
-                                           font=self._font_tiny, fill=COLORS['text_tertiary'])
+                                           font=self._font_tiny, fill=TEXT_TERTIARY)
                 self._label_items.append(label_id)
             # X-axis labels (left, right)
             for _ in range(2):
                 label_id = self.create_text(0, 0, text="", anchor='nw',
-                                           font=self._font_tiny, fill=COLORS['text_tertiary'])
+                                           font=self._font_tiny, fill=TEXT_TERTIARY)
                 self._label_items.append(label_id)
 
         self._initialized = True
 
     def _update_graph(self):
         """Update graph using existing canvas items"""
-        if not self._dirty:
+        if not self._dirty or not self.winfo_viewable():
             return
 
         w = self.winfo_width()
@@ -190,6 +241,53 @@ class GraphWidget(tk.Canvas):
         # Initialize canvas items if needed
         if not self._initialized:
             self._init_canvas_items(graph_left, graph_top, graph_right, graph_bottom)
+            self._static_dirty = True
+
+        # Background, grid and labels only move on resize / axis changes
+        if self._static_dirty:
+            self._update_static(graph_left, graph_top, graph_right, graph_bottom)
+            self._static_dirty = False
+
+        # Update secondary data
+        if self.show_secondary and len(self.data_secondary) > 1:
+            points = self._calculate_points(self.data_secondary, graph_left, graph_top, graph_width, graph_height)
+            self._update_data_series(points, graph_top + graph_height,
+                                    self._fill_polygon_secondary, self._data_line_secondary)
+            self._set_state(self._fill_polygon_secondary, 'normal')
+            self._set_state(self._data_line_secondary, 'normal')
+        else:
+            self._set_state(self._fill_polygon_secondary, 'hidden')
+            self._set_state(self._data_line_secondary, 'hidden')
+
+        # Update primary data
+        if len(self.data_primary) > 1:
+            points = self._calculate_points(self.data_primary, graph_left, graph_top, graph_width, graph_height)
+            self._update_data_series(points, graph_top + graph_height,
+                                    self._fill_polygon, self._data_line)
+            self._set_state(self._fill_polygon, 'normal')
+            self._set_state(self._data_line, 'normal')
+        else:
+            self._set_state(self._fill_polygon, 'hidden')
+            self._set_state(self._data_line, 'hidden')
+
+        # Update value text (only when the shown string changes)
+        text = f"{self.data_primary[-1]:.1f}{self.label_y}" if self.data_primary else ""
+        if text != self._last_value_text:
+            self._last_value_text = text
+            self.itemconfigure(self._value_text, text=text)
+
+        self._dirty = False
+
+    def _set_state(self, item, state):
+        """Set an item's state, skipping the Tk call if it already has it"""
+        if self._item_state.get(item) != state:
+            self._item_state[item] = state
+            self.itemconfigure(item, state=state)
+
+    def _update_static(self, graph_left, graph_top, graph_right, graph_bottom):
+        """Position the background, grid lines, value text and axis labels"""
+        graph_width = graph_right - graph_left
+        graph_height = graph_bottom - graph_top
 
         # Update background rectangle
         self.coords(self._bg_rect, graph_left, graph_top, graph_right, graph_bottom)
@@ -201,48 +299,20 @@ class GraphWidget(tk.Canvas):
             for pct in [0.25, 0.5, 0.75]:
                 y = graph_bottom - (pct * graph_height)
                 self.coords(self._grid_lines[idx], graph_left, y, graph_right, y)
-                self.itemconfigure(self._grid_lines[idx], state='normal')
+                self._set_state(self._grid_lines[idx], 'normal')
                 idx += 1
             # Vertical lines
             for i in range(1, 4):
                 x = graph_left + (i * 0.25 * graph_width)
                 self.coords(self._grid_lines[idx], x, graph_top, x, graph_bottom)
-                self.itemconfigure(self._grid_lines[idx], state='normal')
+                self._set_state(self._grid_lines[idx], 'normal')
                 idx += 1
             # Hide unused grid lines
             while idx < len(self._grid_lines):
-                self.itemconfigure(self._grid_lines[idx], state='hidden')
+                self._set_state(self._grid_lines[idx], 'hidden')
                 idx += 1
 
-        # Update secondary data
-        if self.show_secondary and len(self.data_secondary) > 1:
-            points = self._calculate_points(self.data_secondary, graph_left, graph_top, graph_width, graph_height)
-            self._update_data_series(points, graph_top + graph_height,
-                                    self._fill_polygon_secondary, self._data_line_secondary)
-            self.itemconfigure(self._fill_polygon_secondary, state='normal')
-            self.itemconfigure(self._data_line_secondary, state='normal')
-        else:
-            self.itemconfigure(self._fill_polygon_secondary, state='hidden')
-            self.itemconfigure(self._data_line_secondary, state='hidden')
-
-        # Update primary data
-        if len(self.data_primary) > 1:
-            points = self._calculate_points(self.data_primary, graph_left, graph_top, graph_width, graph_height)
-            self._update_data_series(points, graph_top + graph_height,
-                                    self._fill_polygon, self._data_line)
-            self.itemconfigure(self._fill_polygon, state='normal')
-            self.itemconfigure(self._data_line, state='normal')
-        else:
-            self.itemconfigure(self._fill_polygon, state='hidden')
-            self.itemconfigure(self._data_line, state='hidden')
-
-        # Update value text
-        if len(self.data_primary) > 0:
-            current = self.data_primary[-1]
-            self.coords(self._value_text, graph_right - 5, graph_top + 5)
-            self.itemconfigure(self._value_text, text=f"{current:.1f}{self.label_y}")
-        else:
-            self.itemconfigure(self._value_text, text="")
+        self.coords(self._value_text, graph_right - 5, graph_top + 5)
 
         # Update labels
         if self.show_labels and self._label_items:
@@ -263,38 +333,38 @@ class GraphWidget(tk.Canvas):
             self.coords(self._label_items[4], graph_right, graph_bottom + 5)
             self.itemconfigure(self._label_items[4], text="60s", anchor='ne')
 
-        self._dirty = False
-
     def _calculate_points(self, data, left, top, width, height):
-        """Calculate graph points from data"""
-        points = []
-        max_points = Theme.GRAPH_HISTORY_SIZE
-
-        for i, value in enumerate(data):
-            x = left + (i / max_points) * width
-            clamped = max(0, min(self.max_value, value))
-            y = top + height - (clamped / self.max_value) * height
-            points.append((x, y))
-
+        """Calculate graph points from data, as a flat [x0, y0, x1, y1, ...] list"""
+        # X positions only depend on geometry: recomputed on resize, not per frame
+        xs = self._xs
+        if self._xs_geometry != (left, width):
+            self._xs_geometry = (left, width)
+            max_points = Theme.GRAPH_HISTORY_SIZE
+            step = width / max_points
+            xs = self._xs = [left + i * step for i in range(max_points)]
+
+        # Per-frame constants hoisted; clamping inlined instead of max()/min() calls
+        max_value = self.max_value
+        bottom = top + height
+        scale = height / max_value
+        ys = [bottom - (0 if value <= 0 else max_value if value >= max_value else value) * scale
+              for value in data]
+
+        # Interleave by slice assignment (no per-point tuples to flatten later)
+        n = len(ys)
+        points = [0.0] * (2 * n)
+        points[0::2] = xs[:n]
+        points[1::2] = ys
         return points
 
     def _update_data_series(self, points, bottom_y, fill_item, line_item):
-        """Update a data series polygon and line"""
-        if len(points) < 2:
+        """Update a data series polygon and line from flat point coordinates"""
+        if len(points) < 4:
             return
 
-        # Build fill polygon points
-        fill_points = [(points[0][0], bottom_y)]
-        fill_points.extend(points)
-        fill_points.append((points[-1][0], bottom_y))
-        flat_fill = [coord for point in fill_points for coord in point]
-
-        # Update polygon
-        self.coords(fill_item, *flat_fill)
-
-        # Update line
-        flat_line = [coord for point in points for coord in point]
-        self.coords(line_item, *flat_line)
+        # The fill is the line closed down to the bottom edge at both ends
+        self.coords(fill_item, points[0], bottom_y, *points, points[-2], bottom_y)
+        self.coords(line_item, *points)
 
     # Legacy method for compatibility
     def redraw(self):
@@ -5,7 +5,17 @@ Uses canvas item reuse for better performance
 
 import tkinter as tk
 from collections import deque
-from ..themes import COLORS, Theme
+from functools import partial
+from ..themes import (
+    COLORS, Theme, BG_TERTIARY, SURFACE, SURFACE_HOVER, ACCENT,
+    TEXT_PRIMARY, TEXT_SECONDARY, SELECTION,
+)
+
+# Palette entries without a theme-level constant, looked up once
+_GRAPH_LINE = COLORS['graph_line']
+_GRAPH_FILL = COLORS['graph_fill']
+_SELECTION_BORDER = COLORS['selection_border']
+_BORDER = COLORS['border']
 
 
 class PerformanceButton(tk.Frame):
@@ -18,7 +28,7 @@ class PerformanceButton(tk.Frame):
                  line_color=None, fill_color=None, **kwargs):
         super().__init__(
             parent,
-            bg=COLORS['surface'],
+            bg=SURFACE,
             cursor='hand2',
             **kwargs
         )
@@ -29,8 +39,8 @@ class PerformanceButton(tk.Frame):
         self.selected = False
 
         # Custom graph colors
-        self.line_color = line_color or COLORS['graph_line']
-        self.fill_color = fill_color or COLORS['graph_fill']
+        self.line_color = line_color or _GRAPH_LINE
+        self.fill_color = fill_color or _GRAPH_FILL
 
         # Data for mini graph
         self.data = deque(maxlen=30)
@@ -44,6 +54,11 @@ class PerformanceButton(tk.Frame):
         self._graph_line = None
         self._graph_initialized = False
         self._graph_dirty = True
+        self._graph_state = None  # last 'state' of the fill and line items
+        self._last_value = None  # newest value and how many times in a row it came
+        self._repeat_count = 0
+        self._xs = []  # x of each history slot, for _xs_width
+        self._xs_width = None
 
         # Cache fonts
         self._font_subheader_bold = Theme.get_font(Theme.FONT_SIZE_SUBHEADER, bold=True)
@@ -60,11 +75,11 @@ class PerformanceButton(tk.Frame):
     def _create_widgets(self):
         """Create button contents"""
         # Main container
-        content = tk.Frame(self, bg=COLORS['surface'])
+        content = tk.Frame(self, bg=SURFACE)
         content.pack(fill=tk.BOTH, expand=True, padx=12, pady=10)
 
         # Left side: Title and info
-        left_frame = tk.Frame(content, bg=COLORS['surface'])
+        left_frame = tk.Frame(content, bg=SURFACE)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Title with optional icon
@@ -73,14 +88,14 @@ class PerformanceButton(tk.Frame):
             left_frame,
             text=title_text,
             font=self._font_subheader_bold,
-            bg=COLORS['surface'],
-            fg=COLORS['text_primary'],
+            bg=SURFACE,
+            fg=TEXT_PRIMARY,
             anchor='w'
         )
         self.title_label.pack(anchor='w')
 
         # Info text container
-        self.info_frame = tk.Frame(left_frame, bg=COLORS['surface'])
+        self.info_frame = tk.Frame(left_frame, bg=SURFACE)
         self.info_frame.pack(anchor='w', pady=(4, 0))
 
         # Primary info (e.g., "45%")
@@ -88,8 +103,8 @@ class PerformanceButton(tk.Frame):
             self.info_frame,
             text="0%",
             font=self._font_header_bold,
-            bg=COLORS['surface'],
-            fg=COLORS['accent'],
+            bg=SURFACE,
+            fg=ACCENT,
             anchor='w'
         )
         self.value_label.pack(anchor='w')
@@ -99,27 +114,39 @@ class PerformanceButton(tk.Frame):
             self.info_frame,
             text="",
             font=self._font_tiny,
-            bg=COLORS['surface'],
-            fg=COLORS['text_secondary'],
+            bg=SURFACE,
+            fg=TEXT_SECONDARY,
             anchor='w'
         )
         self.secondary_label.pack(anchor='w')
 
+        # Pre-bound Tcl calls for the per-tick text writes (skip configure()'s option parsing)
+        self._set_value_text = partial(self.tk.call, str(self.value_label), 'configure', '-text')
+        self._set_secondary_text = partial(self.tk.call, str(self.secondary_label), 'configure', '-text')
+        self._value_text = "0%"
+        self._secondary_text = ""
+
         # Right side: Mini graph (borderless)
         self.graph_canvas = tk.Canvas(
             content,
             width=100,
             height=60,
-            bg=COLORS['bg_tertiary'],
+            bg=BG_TERTIARY,
             highlightthickness=0
         )
         self.graph_canvas.pack(side=tk.RIGHT, padx=(8, 0))
+        # Points added while hidden only record data; draw once when shown again
+        self.graph_canvas.bind('<Map>', lambda e: self._update_graph())
 
         # Cache all widgets that need bg changes (flat list for fast iteration)
         self._bg_widgets = [
             self, content, left_frame, self.info_frame,
             self.title_label, self.value_label, self.secondary_label
         ]
+        # One Tcl script recolors them all (%s is the color)
+        paths = ' '.join(str(w) for w in self._bg_widgets)
+        self._bg_script = 'foreach w {%s} {catch {$w configure -bg %%s}}' % paths
+        self._bg = SURFACE
 
     def _bind_events(self):
         """Bind interaction events"""
@@ -134,12 +161,12 @@ class PerformanceButton(tk.Frame):
     def _on_enter(self, event):
         """Mouse enter"""
         if not self.selected:
-            self._set_bg_fast(COLORS['surface_hover'])
+            self._set_bg_fast(SURFACE_HOVER)
 
     def _on_leave(self, event):
         """Mouse leave"""
         if not self.selected:
-            self._set_bg_fast(COLORS['surface'])
+            self._set_bg_fast(SURFACE)
 
     def _on_click(self, event):
         """Handle click"""
@@ -147,23 +174,21 @@ class PerformanceButton(tk.Frame):
             self.on_click()
 
     def _set_bg_fast(self, color):
-        """Set background color using cached widget list (fast)"""
-        for widget in self._bg_widgets:
-            try:
-                widget.configure(bg=color)
-            except tk.TclError:
-                pass
+        """Set background color of the cached widgets in one Tcl call (skipped if unchanged)"""
+        if color != self._bg:
+            self._bg = color
+            self.tk.eval(self._bg_script % color)
 
     def set_selected(self, selected):
         """Set selection state"""
         self.selected = selected
         if selected:
-            self._set_bg_fast(COLORS['selection'])
-            self.configure(highlightbackground=COLORS['selection_border'],
+            self._set_bg_fast(SELECTION)
+            self.configure(highlightbackground=_SELECTION_BORDER,
                           highlightthickness=2)
         else:
-            self._set_bg_fast(COLORS['surface'])
-            self.configure(highlightbackground=COLORS['border'],
+            self._set_bg_fast(SURFACE)
+            self.configure(highlightbackground=_BORDER,
                           highlightthickness=0)
 
     def set_title(self, title):
@@ -174,15 +199,30 @@ class PerformanceButton(tk.Frame):
 
     def set_value(self, value, unit="%"):
         """Set primary value display"""
-        self.value_label.configure(text=f"{value:.1f}{unit}")
+        text = f"{value:.1f}{unit}"
+        # Unchanged text would still invalidate the label and redraw it
+        if text != self._value_text:
+            self._value_text = text
+            self._set_value_text(text)
 
     def set_secondary_text(self, text):
         """Set secondary info text"""
-        self.secondary_label.configure(text=text)
+        if text != self._secondary_text:
+            self._secondary_text = text
+            self._set_secondary_text(text)
 
     def add_data_point(self, value):
         """Add a data point to the graph"""
+        if value == self._last_value:
+            self._repeat_count += 1
+        else:
+            self._last_value = value
+            self._repeat_count = 1
+
         self.data.append(value)
+        # The drawn history was already all this value: the frame is identical
+        if self._repeat_count > self.data.maxlen and not self._graph_dirty:
+            return
         self._graph_dirty = True
         self._update_graph()
 
@@ -197,11 +237,12 @@ class PerformanceButton(tk.Frame):
         self._graph_line = self.graph_canvas.create_line(
             0, 0, 0, 0, fill=self.line_color, width=2, smooth=True
         )
+        self._graph_state = 'normal'
         self._graph_initialized = True
 
     def _update_graph(self):
         """Update the mini graph using existing canvas items"""
-        if not self._graph_dirty:
+        if not self._graph_dirty or not self.graph_canvas.winfo_viewable():
             return
 
         w = self.graph_canvas.winfo_width()
@@ -215,8 +256,7 @@ class PerformanceButton(tk.Frame):
 
         if len(self.data) < 2:
             # Hide items when not enough data
-            self.graph_canvas.itemconfigure(self._graph_fill, state='hidden')
-            self.graph_canvas.itemconfigure(self._graph_line, state='hidden')
+            self._set_graph_state('hidden')
             self._graph_dirty = False
             return
 
@@ -224,27 +264,36 @@ class PerformanceButton(tk.Frame):
         graph_w = w - margin * 2
         graph_h = h - margin * 2
 
-        # Build points
-        points = []
-        for i, value in enumerate(self.data):
-            x = margin + (i / 30) * graph_w
-            clamped = max(0, min(self.max_value, value))
-            y = margin + graph_h - (clamped / self.max_value) * graph_h
-            points.append((x, y))
-
-        # Build fill polygon
-        fill_points = [(points[0][0], margin + graph_h)]
-        fill_points.extend(points)
-        fill_points.append((points[-1][0], margin + graph_h))
-        flat_fill = [c for p in fill_points for c in p]
-
-        # Update polygon coords
-        self.graph_canvas.coords(self._graph_fill, *flat_fill)
-        self.graph_canvas.itemconfigure(self._graph_fill, state='normal')
-
-        # Update line coords
-        line_flat = [c for p in points for c in p]
-        self.graph_canvas.coords(self._graph_line, *line_flat)
-        self.graph_canvas.itemconfigure(self._graph_line, state='normal')
+        # X positions only change with the canvas width
+        xs = self._xs
+        if self._xs_width != graph_w:
+            self._xs_width = graph_w
+            step = graph_w / 30
+            xs = self._xs = [margin + i * step for i in range(30)]
+
+        # Build points (constants hoisted, clamping inlined)
+        max_value = self.max_value
+        bottom = margin + graph_h
+        scale = graph_h / max_value
+        ys = [bottom - (0 if value <= 0 else max_value if value >= max_value else value) * scale
+              for value in self.data]
+
+        # Flat line coordinates, interleaved by slice assignment
+        n = len(ys)
+        points = [0.0] * (2 * n)
+        points[0::2] = xs[:n]
+        points[1::2] = ys
+
+        # Fill is the line closed down to the bottom edge at both ends
+        self.graph_canvas.coords(self._graph_fill, points[0], bottom, *points, points[-2], bottom)
+        self.graph_canvas.coords(self._graph_line, *points)
+        self._set_graph_state('normal')
 
         self._graph_dirty = False
+
+    def _set_graph_state(self, state):
+        """Show or hide the graph items (no Tk calls if unchanged)"""
+        if state != self._graph_state:
+            self._graph_state = state
+            self.graph_canvas.itemconfigure(self._graph_fill, state=state)
+            self.graph_canvas.itemconfigure(self._graph_line, state=state)
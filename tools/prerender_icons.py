@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Pre-render the app icon at the sizes the UI uses
+Composites the white icon onto its background so the window can load it
+with tk.PhotoImage directly, without PIL at startup
+"""
+
+import os
+import sys
+
+from PIL import Image
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+ICON_PATH = os.path.join(SRC_DIR, 'activity-tracker-white.png')
+
+# size -> background colour (window titlebar, sidebar #242424)
+VARIANTS = {
+    32: (36, 36, 36, 255),
+    22: (0x24, 0x24, 0x24, 255),
+}
+
+
+def prerender():
+    """Write activity-tracker-white-<size>.png for each variant"""
+    icon = Image.open(ICON_PATH).convert('RGBA')
+
+    for size, bg_color in VARIANTS.items():
+        bg = Image.new('RGBA', (size, size), bg_color)
+        resized = icon.resize((size, size), Image.LANCZOS)
+        bg.paste(resized, mask=resized.split()[3])
+
+        out_path = os.path.join(SRC_DIR, f'activity-tracker-white-{size}.png')
+        bg.convert('RGB').save(out_path, optimize=True)
+        print(f"Wrote {out_path}")
+
+
+if __name__ == "__main__":
+    sys.exit(prerender())